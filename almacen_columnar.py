@@ -0,0 +1,189 @@
+"""Almacén columnar de resultados basado en archivos `.npy` mapeados en memoria.
+
+Estructura en disco:
+
+    <ruta>/manifiesto.json
+    <ruta>/<tabla>/fragmento_000000/<columna>.npy
+    <ruta>/<tabla>/fragmento_000001/<columna>.npy
+    ...
+
+Cada fragmento se escribe una sola vez (solo se agregan fragmentos nuevos) y
+al reabrirlo las columnas se cargan con `mmap_mode="r"`, así que leer millones
+de filas no crea objetos de Python ni vuelve a interpretar texto.
+"""
+import json
+import operator
+import os
+
+import numpy as np
+
+import registro
+
+MANIFIESTO = "manifiesto.json"
+TAM_FRAGMENTO = 1_000_000
+
+
+class ColumnaSegmentada:
+    """Vista de una columna repartida en fragmentos mapeados en memoria, sin concatenarlos.
+
+    Se indexa con un entero o con un arreglo de índices globales y se compara
+    con un escalar como un arreglo de NumPy; solo se copian las filas pedidas.
+    """
+
+    def __init__(self, segmentos):
+        self.segmentos = list(segmentos)
+        largos = [len(segmento) for segmento in self.segmentos]
+        # Índice global de la primera fila de cada segmento
+        self.inicios = np.cumsum([0] + largos[:-1], dtype=np.int64)
+        self.total = int(sum(largos))
+        self.dtype = self.segmentos[0].dtype if self.segmentos else np.dtype(np.float64)
+
+    def __len__(self):
+        return self.total
+
+    def __getitem__(self, indices):
+        if isinstance(indices, (int, np.integer)):
+            indice = int(indices) + (self.total if indices < 0 else 0)
+            if not 0 <= indice < self.total:
+                raise IndexError(f"Índice fuera de rango: {indices}.")
+            segmento = np.searchsorted(self.inicios, indice, side="right") - 1
+            return self.segmentos[segmento][indice - self.inicios[segmento]]
+        indices = np.asarray(indices, dtype=np.int64)
+        segmentos = np.searchsorted(self.inicios, indices, side="right") - 1
+        salida = np.empty(indices.shape, dtype=self.dtype)
+        for segmento in np.unique(segmentos):
+            mascara = segmentos == segmento
+            salida[mascara] = self.segmentos[segmento][indices[mascara] - self.inicios[segmento]]
+        return salida
+
+    def _comparar(self, comparar, valor):
+        if not self.segmentos:
+            return np.zeros(0, dtype=bool)
+        return np.concatenate([comparar(segmento, valor) for segmento in self.segmentos])
+
+    def __lt__(self, valor):
+        return self._comparar(operator.lt, valor)
+
+    def __le__(self, valor):
+        return self._comparar(operator.le, valor)
+
+    def __gt__(self, valor):
+        return self._comparar(operator.gt, valor)
+
+    def __ge__(self, valor):
+        return self._comparar(operator.ge, valor)
+
+    def __eq__(self, valor):
+        return self._comparar(operator.eq, valor)
+
+    def __ne__(self, valor):
+        return self._comparar(operator.ne, valor)
+
+    __hash__ = None
+
+
+class AlmacenColumnar:
+    def __init__(self, ruta):
+        self.ruta = ruta
+        os.makedirs(ruta, exist_ok=True)
+        ruta_manifiesto = os.path.join(ruta, MANIFIESTO)
+        if os.path.exists(ruta_manifiesto):
+            with open(ruta_manifiesto, encoding="utf-8") as f:
+                self.manifiesto = json.load(f)
+        else:
+            self.manifiesto = {"tablas": {}}
+
+    def _guardar_manifiesto(self):
+        # Se escribe a un archivo temporal y se reemplaza para no dejarlo a medias
+        ruta_manifiesto = os.path.join(self.ruta, MANIFIESTO)
+        temporal = ruta_manifiesto + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(self.manifiesto, f, indent=2)
+        os.replace(temporal, ruta_manifiesto)
+
+    def tablas(self):
+        return list(self.manifiesto["tablas"])
+
+    def esquema(self, tabla):
+        return dict(self.manifiesto["tablas"][tabla]["esquema"])
+
+    def num_filas(self, tabla):
+        if tabla not in self.manifiesto["tablas"]:
+            return 0
+        return sum(f["filas"] for f in self.manifiesto["tablas"][tabla]["fragmentos"])
+
+    def agregar(self, tabla, columnas):
+        """Agrega un fragmento nuevo a `tabla` con las columnas dadas (todas del mismo largo)."""
+        columnas = {nombre: np.ascontiguousarray(valores) for nombre, valores in columnas.items()}
+        largos = {len(valores) for valores in columnas.values()}
+        if len(largos) != 1:
+            raise ValueError("Todas las columnas deben tener el mismo número de filas.")
+        esquema = {nombre: valores.dtype.str for nombre, valores in columnas.items()}
+
+        info = self.manifiesto["tablas"].setdefault(tabla, {"esquema": esquema, "fragmentos": []})
+        if info["esquema"] != esquema:
+            raise ValueError(f"El esquema no coincide con el de la tabla '{tabla}': {info['esquema']}.")
+
+        nombre_fragmento = f"fragmento_{len(info['fragmentos']):06d}"
+        directorio = os.path.join(self.ruta, tabla, nombre_fragmento)
+        os.makedirs(directorio, exist_ok=True)
+        for nombre, valores in columnas.items():
+            np.save(os.path.join(directorio, f"{nombre}.npy"), valores)
+
+        info["fragmentos"].append({"nombre": nombre_fragmento, "filas": largos.pop()})
+        self._guardar_manifiesto()
+
+    def fragmentos(self, tabla, columnas=None):
+        """Itera sobre los fragmentos de `tabla` como diccionarios de arreglos mapeados en memoria."""
+        info = self.manifiesto["tablas"][tabla]
+        nombres = columnas or list(info["esquema"])
+        for fragmento in info["fragmentos"]:
+            directorio = os.path.join(self.ruta, tabla, fragmento["nombre"])
+            yield {
+                nombre: np.load(os.path.join(directorio, f"{nombre}.npy"), mmap_mode="r")
+                for nombre in nombres
+            }
+
+    def columna(self, tabla, nombre):
+        """Devuelve la lista de segmentos (uno por fragmento) de una columna, sin copiar."""
+        return [fragmento[nombre] for fragmento in self.fragmentos(tabla, [nombre])]
+
+    def abrir(self, tabla, columnas=None):
+        """Devuelve las columnas de `tabla` como `ColumnaSegmentada`, sin copiar los fragmentos."""
+        segmentos = {nombre: [] for nombre in (columnas or self.esquema(tabla))}
+        for fragmento in self.fragmentos(tabla, columnas):
+            for nombre, valores in fragmento.items():
+                segmentos[nombre].append(valores)
+        return {nombre: ColumnaSegmentada(partes) for nombre, partes in segmentos.items()}
+
+    def leer(self, tabla, columnas=None):
+        """Concatena los fragmentos en arreglos en memoria (copia; útil para tablas pequeñas)."""
+        segmentos = {}
+        for fragmento in self.fragmentos(tabla, columnas):
+            for nombre, valores in fragmento.items():
+                segmentos.setdefault(nombre, []).append(valores)
+        return {nombre: np.concatenate(partes) for nombre, partes in segmentos.items()}
+
+
+def guardar_lote(almacen, figura, parametros, tam_fragmento=TAM_FRAGMENTO):
+    """Calcula las propiedades de un lote de `figura` y las guarda junto a sus parámetros.
+
+    Las columnas de parámetros se guardan con el tipo declarado en el registro.
+    """
+    definicion = registro.obtener(figura)
+    parametros = {p.nombre: np.asarray(parametros[p.nombre], dtype=p.dtype) for p in definicion.parametros}
+    total = len(next(iter(parametros.values())))
+    for inicio in range(0, total, tam_fragmento):
+        trozo = {nombre: valores[inicio:inicio + tam_fragmento] for nombre, valores in parametros.items()}
+        columnas = dict(trozo)
+        columnas.update(definicion.calcular(trozo))
+        almacen.agregar(figura, columnas)
+
+
+def guardar_lote_mixto(almacen, figuras, columnas, tam_fragmento=TAM_FRAGMENTO):
+    """Agrupa un lote con figuras mezcladas por tipo y guarda cada grupo en la tabla de su figura."""
+    figuras = np.asarray(figuras)
+    for clave in np.unique(figuras):
+        indices = np.flatnonzero(figuras == clave)
+        nombres = registro.obtener(str(clave)).nombres_parametros
+        guardar_lote(almacen, str(clave), {n: np.asarray(columnas[n])[indices] for n in nombres}, tam_fragmento)
@@ -0,0 +1,284 @@
+"""Anidado de piezas (rectángulos, círculos y polígonos regulares) en hojas fijas.
+
+Las piezas son figuras del registro (`cuadrilatero`, `circulo` y
+`poligono_regular`). Cada pieza se reduce a un rectángulo: los cuadriláteros y
+los polígonos por su caja (con giro de 90° permitido) y los círculos del mismo
+diámetro se agrupan en bloques con acomodo hexagonal, que luego se colocan
+como un rectángulo más. Los rectángulos se colocan con la heurística de
+horizonte (skyline, abajo-izquierda) abriendo hojas nuevas cuando hace falta.
+
+La búsqueda prueba muchos órdenes y variantes (inicios múltiples) en varios
+procesos durante un tiempo límite y se queda con la disposición que usa menos
+hojas y deja la última hoja más vacía.
+"""
+import math
+import multiprocessing as mp
+import os
+import random
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import registro
+
+FIGURAS_ANIDABLES = ("cuadrilatero", "circulo", "poligono_regular")
+TIEMPO_LIMITE = 2.0
+
+
+class Disposicion:
+    """Resultado del anidado.
+
+    `hojas` es una lista (una por hoja) de colocaciones
+    `(indice_pieza, x, y, rotada)`: (x, y) es la esquina inferior izquierda de
+    la caja de la pieza, o el centro en el caso de los círculos.
+    """
+
+    def __init__(self, piezas, ancho, alto, hojas):
+        self.piezas = piezas
+        self.ancho = ancho
+        self.alto = alto
+        self.hojas = hojas
+
+    def utilizacion(self):
+        """Fracción del área de cada hoja ocupada por piezas."""
+        areas = [_area(*self.piezas[i]) for i in range(len(self.piezas))]
+        return [sum(areas[i] for i, *_ in hoja) / (self.ancho * self.alto) for hoja in self.hojas]
+
+    def reporte(self):
+        utilizacion = self.utilizacion()
+        lineas = [f"Hojas usadas: {len(self.hojas)} de {self.ancho:.2f} × {self.alto:.2f} cm"]
+        for numero, (hoja, fraccion) in enumerate(zip(self.hojas, utilizacion), start=1):
+            lineas.append(f"Hoja {numero}: {len(hoja)} piezas, utilización {fraccion:.1%}")
+        total = sum(_area(*p) for p in self.piezas) / (len(self.hojas) * self.ancho * self.alto)
+        lineas.append(f"Utilización total: {total:.1%}")
+        return "\n".join(lineas)
+
+    def contornos(self, hoja):
+        """Contornos de las piezas colocadas en la hoja indicada, en cm."""
+        resultado = []
+        for indice, x, y, rotada in self.hojas[hoja]:
+            clave, parametros = self.piezas[indice]
+            puntos = registro.obtener(clave).contorno(parametros)
+            if clave == "circulo":
+                resultado.append(puntos + [x, y])
+                continue
+            if rotada:
+                puntos = puntos[:, ::-1] * [-1, 1]
+            resultado.append(puntos - puntos.min(axis=0) + [x, y])
+        return resultado
+
+    def fuera_de_hoja(self, tolerancia=1e-9):
+        """Lista de (hoja, índice de pieza) cuyos contornos se salen de la hoja."""
+        margen = tolerancia * max(self.ancho, self.alto)
+        fuera = []
+        for hoja in range(len(self.hojas)):
+            for (indice, *_), puntos in zip(self.hojas[hoja], self.contornos(hoja)):
+                if (puntos.min(axis=0) < -margen).any() or (puntos.max(axis=0) > [self.ancho + margen,
+                                                                                 self.alto + margen]).any():
+                    fuera.append((hoja, indice))
+        return fuera
+
+    def dibujar(self, hoja=0):
+        """Figura de matplotlib con la hoja y sus piezas."""
+        fig, ax = plt.subplots(figsize=(5, 5 * self.alto / self.ancho))
+        ax.plot([0, self.ancho, self.ancho, 0, 0], [0, 0, self.alto, self.alto, 0], color="black")
+        for puntos in self.contornos(hoja):
+            ax.fill(*puntos.T, alpha=0.5, edgecolor="black")
+        ax.set_title(f"Hoja {hoja + 1} - utilización {self.utilizacion()[hoja]:.1%}")
+        ax.set_xlabel("cm")
+        ax.set_ylabel("cm")
+        ax.axis("equal")
+        return fig
+
+
+def _area(clave, parametros):
+    return float(registro.obtener(clave).calcular(parametros)["area"])
+
+
+def _caja(clave, parametros):
+    extension = np.ptp(registro.obtener(clave).contorno(parametros), axis=0)
+    return float(extension[0]), float(extension[1])
+
+
+# Horizonte (skyline) de una hoja: segmentos [x, y, ancho] ordenados por x
+class _Horizonte:
+    def __init__(self, ancho, alto):
+        self.ancho = ancho
+        self.alto = alto
+        self.segmentos = [[0.0, 0.0, ancho]]
+
+    def buscar(self, w, h):
+        """Mejor posición abajo-izquierda para un rectángulo w × h, o None."""
+        mejor = None
+        for i, (x, _, _) in enumerate(self.segmentos):
+            if x + w > self.ancho + 1e-9:
+                break
+            y, j, fin = 0.0, i, x + w
+            while j < len(self.segmentos) and self.segmentos[j][0] < fin - 1e-9:
+                y = max(y, self.segmentos[j][1])
+                j += 1
+            if y + h <= self.alto + 1e-9 and (mejor is None or (y + h, x) < (mejor[1] + h, mejor[0])):
+                mejor = (x, y)
+        return mejor
+
+    def colocar(self, x, y, w, h):
+        nuevos, fin = [], x + w
+        for sx, sy, sw in self.segmentos:
+            if sx + sw <= x + 1e-9 or sx >= fin - 1e-9:
+                nuevos.append([sx, sy, sw])
+                continue
+            # El segmento queda cubierto total o parcialmente por el rectángulo
+            if sx < x:
+                nuevos.append([sx, sy, x - sx])
+            if sx + sw > fin:
+                nuevos.append([fin, sy, sx + sw - fin])
+        nuevos.append([x, y + h, w])
+        nuevos.sort()
+        # Unir segmentos contiguos de la misma altura
+        self.segmentos = [nuevos[0]]
+        for segmento in nuevos[1:]:
+            if abs(segmento[1] - self.segmentos[-1][1]) < 1e-9:
+                self.segmentos[-1][2] += segmento[2]
+            else:
+                self.segmentos.append(segmento)
+
+
+def _bloques_circulos(indices, diametro, ancho, alto, columnas):
+    """Divide círculos iguales en bloques hexagonales de `columnas` por fila.
+
+    Si el medio diámetro que desplaza las filas impares no cabe en el ancho de
+    la hoja, las filas se apilan sin desplazar (acomodo cuadrado).
+    Devuelve bloques (w, h, centros relativos, índices).
+    """
+    escalonado = columnas * diametro + diametro / 2 <= ancho + 1e-9
+    paso_fila = diametro * math.sqrt(3) / 2 if escalonado else diametro
+    filas_max = max(1, int((alto - diametro) // paso_fila) + 1)
+    bloques = []
+    por_bloque = columnas * filas_max
+    for inicio in range(0, len(indices), por_bloque):
+        grupo = indices[inicio:inicio + por_bloque]
+        filas = math.ceil(len(grupo) / columnas)
+        desplazamiento = diametro / 2 if escalonado else 0.0
+        centros = [((k % columnas) * diametro + diametro / 2 + (desplazamiento if (k // columnas) % 2 else 0),
+                    (k // columnas) * paso_fila + diametro / 2) for k in range(len(grupo))]
+        w = min(len(grupo), columnas) * diametro + (desplazamiento if filas > 1 else 0)
+        h = (filas - 1) * paso_fila + diametro
+        bloques.append((w, h, centros, grupo))
+    return bloques
+
+
+def _empaquetar(elementos, ancho, alto, orden, giros):
+    """Coloca los elementos en hojas con el horizonte, en el orden dado (primer ajuste)."""
+    hojas, horizontes = [], []
+    for k in orden:
+        w, h, centros, indices, girable = elementos[k]
+        opciones = [(w, h, False), (h, w, True)] if girable else [(w, h, False)]
+        if giros[k]:
+            opciones.reverse()
+        colocado = False
+        for hoja, horizonte in zip(hojas, horizontes):
+            for ew, eh, rotada in opciones:
+                posicion = horizonte.buscar(ew, eh)
+                if posicion is not None:
+                    _agregar(hoja, horizonte, posicion, ew, eh, rotada, centros, indices)
+                    colocado = True
+                    break
+            if colocado:
+                break
+        if not colocado:
+            horizonte = _Horizonte(ancho, alto)
+            for ew, eh, rotada in opciones:
+                posicion = horizonte.buscar(ew, eh)
+                if posicion is not None:
+                    hojas.append([])
+                    horizontes.append(horizonte)
+                    _agregar(hojas[-1], horizonte, posicion, ew, eh, rotada, centros, indices)
+                    break
+    return hojas
+
+
+def _agregar(hoja, horizonte, posicion, w, h, rotada, centros, indices):
+    x, y = posicion
+    horizonte.colocar(x, y, w, h)
+    if centros is None:
+        hoja.append((indices[0], x, y, rotada))
+    else:
+        hoja.extend((i, x + cx, y + cy, False) for i, (cx, cy) in zip(indices, centros))
+
+
+def _elementos(piezas, ancho, alto, separacion, rng):
+    """Convierte las piezas en rectángulos; la cantidad de columnas hexagonales varía entre inicios."""
+    elementos, circulos = [], {}
+    for indice, (clave, parametros) in enumerate(piezas):
+        if clave == "circulo":
+            circulos.setdefault(2 * float(parametros["radio"]) + separacion, []).append(indice)
+            continue
+        w, h = _caja(clave, parametros)
+        elementos.append((w + separacion, h + separacion, None, [indice], True))
+    for diametro, indices in circulos.items():
+        maximo = max(1, int((ancho - diametro / 2) // diametro))
+        columnas = maximo if rng.random() < 0.5 else rng.randint(1, maximo)
+        for w, h, centros, grupo in _bloques_circulos(indices, diametro, ancho, alto, columnas):
+            elementos.append((w, h, centros, grupo, False))
+    return elementos
+
+
+def _costo(hojas, piezas):
+    ultima = sum(_area(*piezas[i]) for i, *_ in hojas[-1]) if hojas else 0.0
+    return len(hojas), ultima
+
+
+def _buscar(piezas, ancho, alto, separacion, semilla, plazo):
+    rng = random.Random(semilla)
+    mejor, mejor_costo, intento = None, None, 0
+    while intento == 0 or time.monotonic() < plazo:
+        elementos = _elementos(piezas, ancho, alto, separacion, rng)
+        orden = list(range(len(elementos)))
+        # Los primeros intentos usan los órdenes clásicos; luego órdenes perturbados al azar
+        criterio = [lambda e: e[0] * e[1], lambda e: max(e[0], e[1]), lambda e: e[1], lambda e: e[0] + e[1]][intento % 4]
+        orden.sort(key=lambda k: criterio(elementos[k]), reverse=True)
+        if intento >= 4:
+            for _ in range(rng.randint(1, max(1, len(orden) // 3))):
+                a, b = rng.randrange(len(orden)), rng.randrange(len(orden))
+                orden[a], orden[b] = orden[b], orden[a]
+        giros = [intento >= 4 and rng.random() < 0.5 for _ in elementos]
+        hojas = _empaquetar(elementos, ancho, alto, orden, giros)
+        costo = _costo(hojas, piezas)
+        if mejor_costo is None or costo < mejor_costo:
+            mejor, mejor_costo = hojas, costo
+        intento += 1
+    return mejor_costo, mejor, intento
+
+
+def _trabajador(argumentos):
+    return _buscar(*argumentos)
+
+
+def anidar(piezas, ancho, alto, separacion=0.0, tiempo=TIEMPO_LIMITE, procesos=None, semilla=0):
+    """Acomoda las piezas `(clave, parametros)` en hojas de `ancho` × `alto` cm.
+
+    Reparte la búsqueda de inicios múltiples entre `procesos` durante `tiempo`
+    segundos y devuelve la mejor `Disposicion` encontrada.
+    """
+    for clave, parametros in piezas:
+        if clave not in FIGURAS_ANIDABLES:
+            raise ValueError(f"Figura no anidable: {clave}. Las figuras anidables son {list(FIGURAS_ANIDABLES)}.")
+        w, h = _caja(clave, parametros)
+        if min(w, h) + separacion > min(ancho, alto) or max(w, h) + separacion > max(ancho, alto):
+            raise ValueError(f"La pieza {registro.obtener(clave).nombre} {parametros} no cabe en la hoja.")
+
+    plazo = time.monotonic() + tiempo
+    procesos = procesos or os.cpu_count() or 1
+    tareas = [(piezas, ancho, alto, separacion, semilla + k, plazo) for k in range(procesos)]
+    if procesos == 1:
+        resultados = [_trabajador(tareas[0])]
+    else:
+        with mp.get_context().Pool(procesos) as grupo:
+            resultados = grupo.map(_trabajador, tareas)
+    _, hojas, _ = min(resultados, key=lambda r: r[0])
+    disposicion = Disposicion(piezas, ancho, alto, hojas)
+    fuera = disposicion.fuera_de_hoja()
+    if fuera:
+        raise RuntimeError(f"Piezas colocadas fuera de la hoja (hoja, pieza): {fuera}.")
+    return disposicion
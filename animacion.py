@@ -0,0 +1,164 @@
+"""Animaciones giratorias de los sólidos 3D exportadas a GIF.
+
+Cada proceso de trabajo construye la escena una sola vez (figura de Agg, ejes
+3D y artistas de la malla) y para cada fotograma solo cambia la vista con
+`view_init` antes de volver a dibujar. Los fotogramas llegan en orden al
+proceso principal, que los codifica uno por uno con Pillow y los escribe al
+archivo en cuanto los recibe: como mucho hay `ventana` fotogramas en memoria,
+sin importar cuántos tenga la animación.
+"""
+import math
+import multiprocessing as mp
+import os
+from collections import deque
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+from PIL import GifImagePlugin, Image
+
+FOTOGRAMAS = 72
+DURACION_MS = 50
+TAM_PULGADAS = 4
+DPI = 100
+
+_escena = {}
+
+
+def construir_escena(ax, clave, parametros):
+    """Agrega a `ax` los artistas del sólido con el mismo aspecto que la interfaz."""
+    p = parametros
+    theta = np.linspace(0, 2 * math.pi, 100)
+    if clave == "cubo":
+        r = [-p["lado"] / 2, p["lado"] / 2]
+        v = np.array([[x, y, z] for z in r for y in r for x in r])
+        aristas = [(0, 1), (1, 3), (3, 2), (2, 0), (4, 5), (5, 7), (7, 6), (6, 4),
+                   (0, 4), (1, 5), (2, 6), (3, 7)]
+        ax.add_collection3d(Line3DCollection([v[list(a)] for a in aristas], colors="b"))
+        limite = (-p["lado"], p["lado"]) * 3
+    elif clave == "esfera":
+        radio = p["radio"]
+        v = np.linspace(0, math.pi, 100)
+        ax.plot_surface(radio * np.outer(np.cos(theta), np.sin(v)), radio * np.outer(np.sin(theta), np.sin(v)),
+                        radio * np.outer(np.ones_like(theta), np.cos(v)), color="b", alpha=0.6)
+        limite = (-radio, radio) * 3
+    elif clave == "piramide":
+        l, h = p["lado_base"] / 2, p["altura"]
+        v = [[-l, -l, 0], [l, -l, 0], [l, l, 0], [-l, l, 0], [0, 0, h]]
+        caras = [[v[0], v[1], v[4]], [v[1], v[2], v[4]], [v[2], v[3], v[4]], [v[3], v[0], v[4]], v[:4]]
+        ax.add_collection3d(Poly3DCollection(caras, facecolors="cyan", linewidths=1, edgecolors="r", alpha=0.25))
+        limite = (-2 * l, 2 * l, -2 * l, 2 * l, 0, h + 1)
+    elif clave in ("cono", "cilindro", "prisma"):
+        if clave == "prisma":
+            n = int(p["n_lados"])
+            angulos = 2 * math.pi * np.arange(n + 1) / n
+            radio = p["longitud"]
+        else:
+            angulos, radio = theta, p["radio"]
+        x, y, h = radio * np.cos(angulos), radio * np.sin(angulos), p["altura"]
+        ax.plot(x, y, np.zeros_like(x), color="b")
+        if clave == "cono":
+            ax.plot([0], [0], [h], color="b", marker="o")
+            lados = [[(xi, yi, 0), (0, 0, h)] for xi, yi in zip(x, y)]
+        else:
+            ax.plot(x, y, np.full_like(x, h), color="b")
+            lados = [[(xi, yi, 0), (xi, yi, h)] for xi, yi in zip(x, y)]
+        # Una sola colección en lugar de una línea por generatriz
+        ax.add_collection3d(Line3DCollection(lados, colors="b"))
+        limite = (-radio, radio, -radio, radio, 0, h)
+    else:
+        raise ValueError(f"Sólido no válido: {clave}.")
+    ax.set_xlim(limite[0:2])
+    ax.set_ylim(limite[2:4])
+    ax.set_zlim(limite[4:6])
+    ax.set_xlabel("X (cm)")
+    ax.set_ylabel("Y (cm)")
+    ax.set_zlabel("Z (cm)")
+
+
+def vistas(fotogramas=FOTOGRAMAS, elevacion=25.0, oscilacion=0.0):
+    """Vistas (azimut, elevación) de una vuelta completa; la elevación puede oscilar."""
+    fase = 2 * np.pi * np.arange(fotogramas) / fotogramas
+    return list(zip(np.degrees(fase), elevacion + oscilacion * np.sin(fase)))
+
+
+def _iniciar(clave, parametros, titulo, tam, dpi):
+    fig = Figure(figsize=(tam, tam), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, projection="3d")
+    construir_escena(ax, clave, parametros)
+    if titulo:
+        ax.set_title(titulo)
+    _escena.update(canvas=canvas, ax=ax)
+
+
+def _renderizar(vista):
+    azimut, elevacion = vista
+    _escena["ax"].view_init(elev=elevacion, azim=azimut)
+    canvas = _escena["canvas"]
+    canvas.draw()
+    return canvas.get_width_height(), bytes(canvas.buffer_rgba())
+
+
+class EscritorGif:
+    """Escribe un GIF animado fotograma a fotograma, sin guardar los anteriores.
+
+    Todos los fotogramas usan la paleta del primero, que se escribe como
+    paleta global del archivo.
+    """
+
+    def __init__(self, ruta, duracion_ms=DURACION_MS, bucle=0):
+        self.archivo = open(ruta, "wb")
+        self.duracion_ms = duracion_ms
+        self.bucle = bucle
+        self.paleta = None
+
+    def agregar(self, imagen):
+        if self.paleta is None:
+            self.paleta = imagen.convert("RGB").quantize(colors=256, dither=Image.Dither.NONE)
+            cuadro = self.paleta
+            encabezado, _ = GifImagePlugin.getheader(cuadro, info={"loop": self.bucle, "optimize": False})
+            self.archivo.write(b"".join(encabezado))
+        else:
+            cuadro = imagen.convert("RGB").quantize(palette=self.paleta, dither=Image.Dither.NONE)
+        self.archivo.write(b"".join(GifImagePlugin.getdata(cuadro, duration=self.duracion_ms)))
+
+    def cerrar(self):
+        self.archivo.write(b";")
+        self.archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def exportar_gif(ruta, clave, parametros, fotogramas=FOTOGRAMAS, elevacion=25.0, oscilacion=0.0,
+                 duracion_ms=DURACION_MS, titulo=None, procesos=None, tam=TAM_PULGADAS, dpi=DPI):
+    """Renderiza una vuelta completa del sólido en paralelo y la guarda como GIF animado."""
+    lista = vistas(fotogramas, elevacion, oscilacion)
+    procesos = procesos or os.cpu_count() or 1
+    argumentos = (clave, parametros, titulo, tam, dpi)
+    with EscritorGif(ruta, duracion_ms) as escritor:
+        if procesos == 1:
+            _iniciar(*argumentos)
+            for vista in lista:
+                escritor.agregar(_a_imagen(*_renderizar(vista)))
+            return
+        with mp.get_context().Pool(procesos, initializer=_iniciar, initargs=argumentos) as grupo:
+            # Ventana acotada de fotogramas en vuelo: se encolan nuevos a medida que se escriben
+            ventana = 2 * procesos
+            pendientes = deque(grupo.apply_async(_renderizar, (vista,)) for vista in lista[:ventana])
+            siguientes = iter(lista[ventana:])
+            while pendientes:
+                tamano, datos = pendientes.popleft().get()
+                vista = next(siguientes, None)
+                if vista is not None:
+                    pendientes.append(grupo.apply_async(_renderizar, (vista,)))
+                escritor.agregar(_a_imagen(tamano, datos))
+
+
+def _a_imagen(tamano, datos):
+    return Image.frombuffer("RGBA", tamano, datos, "raw", "RGBA", 0, 1)
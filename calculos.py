@@ -0,0 +1,218 @@
+"""Fórmulas vectorizadas de las figuras.
+
+Cada función acepta escalares o arreglos de NumPy (de la misma forma) con las
+dimensiones en cm y devuelve un diccionario de propiedades calculadas. Son las
+mismas fórmulas que usa la interfaz, pero aplicables a lotes completos.
+"""
+import threading
+
+import numpy as np
+
+# Coeficientes de los polígonos regulares de lado 1 indexados por número de
+# lados. Las entradas n < 3 y la última son NaN: con `take(mode="clip")` los n
+# fuera de la tabla caen en ellas. Se extiende (duplicando) al pedir un n mayor.
+TAM_TABLA_INICIAL = 64
+MAX_TABLA = 1 << 20
+TAM_BLOQUE = 1 << 14
+# Con menos filas el costo fijo de la tabla supera al de calcular tan(π/n)
+MIN_FILAS_TABLA = 1 << 12
+
+_tabla_poligonos = np.empty(0)
+_bloqueo_tabla = threading.Lock()
+
+
+def _arr(valor):
+    return np.asarray(valor, dtype=np.float64)
+
+
+def _extender_tabla(n_max):
+    global _tabla_poligonos
+    with _bloqueo_tabla:
+        if n_max < len(_tabla_poligonos) - 1:
+            return _tabla_poligonos
+        tam = max(TAM_TABLA_INICIAL, 1 << (int(n_max) + 1).bit_length())
+        n = np.arange(tam, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tabla = n / (4 * np.tan(np.pi / n))
+        tabla[:3] = tabla[-1] = np.nan
+        # Se reemplaza el arreglo completo: los lectores nunca ven una tabla a medias
+        _tabla_poligonos = tabla
+        return _tabla_poligonos
+
+
+_extender_tabla(0)
+
+
+def _de_tabla(n_lados):
+    """Valores de la tabla para `n_lados`, o None si conviene calcularlos directamente.
+
+    Eso ocurre si algún n no es un entero en [3, MAX_TABLA) o si el arreglo es pequeño.
+    """
+    n_lados = np.asarray(n_lados)
+    tabla = _tabla_poligonos
+    if n_lados.ndim == 0:
+        valor = float(n_lados)
+        if not (valor.is_integer() and 3 <= valor < MAX_TABLA):
+            return None
+        if valor >= len(tabla) - 1:
+            tabla = _extender_tabla(valor)
+        return tabla[int(valor)]
+
+    if n_lados.size < MIN_FILAS_TABLA:
+        return None
+    plano = np.ascontiguousarray(n_lados).reshape(-1)
+    salida = np.empty(plano.shape)
+    entero = np.issubdtype(plano.dtype, np.integer)
+    indices = np.empty(min(len(plano), TAM_BLOQUE), dtype=np.intp)
+    iguales = np.empty(len(indices), dtype=bool)
+    # Por bloques que caben en la caché: la conversión a índices, la comprobación
+    # de que n es entero y la lectura de la tabla no crean arreglos del tamaño del lote
+    for inicio in range(0, len(plano), TAM_BLOQUE):
+        bloque = plano[inicio:inicio + TAM_BLOQUE]
+        if entero:
+            bloque_indices = bloque
+        else:
+            bloque_indices = indices[:len(bloque)]
+            with np.errstate(invalid="ignore"):
+                np.copyto(bloque_indices, bloque, casting="unsafe")
+            if not np.equal(bloque_indices, bloque, out=iguales[:len(bloque)]).all():
+                return None
+        destino = salida[inicio:inicio + len(bloque)]
+        tabla.take(bloque_indices, mode="clip", out=destino)
+        # n < 3 o más allá de la tabla caen en las entradas NaN de los extremos
+        if np.isnan(destino.sum()):
+            if bloque_indices.min() < 3 or bloque_indices.max() >= MAX_TABLA:
+                return None
+            tabla = _extender_tabla(bloque_indices.max())
+            tabla.take(bloque_indices, out=destino)
+    return salida.reshape(n_lados.shape)
+
+
+def coeficiente_area_poligono(n_lados):
+    """Área del polígono regular de lado 1, n / (4·tan(π/n)).
+
+    Para números de lados enteros (lo normal en los lotes, con pocos valores
+    distintos) es una lectura de la tabla; los arreglos pequeños y los que
+    tienen valores no enteros, fuera de rango o NaN se calculan directamente.
+    """
+    valores = _de_tabla(n_lados)
+    if valores is None:
+        # Sin errstate: en lotes pequeños su costo fijo pesa tanto como el cálculo
+        n_lados = _arr(n_lados)
+        valores = n_lados / (4 * np.tan(np.pi / n_lados))
+    return valores
+
+
+# Figuras 2D
+def triangulo(base, altura):
+    base, altura = _arr(base), _arr(altura)
+    return {
+        "area": 0.5 * base * altura,
+        "perimetro": base + altura + np.sqrt(base ** 2 + altura ** 2),
+    }
+
+
+def cuadrilatero(lado1, lado2):
+    lado1, lado2 = _arr(lado1), _arr(lado2)
+    return {"area": lado1 * lado2, "perimetro": 2 * (lado1 + lado2)}
+
+
+def circulo(radio):
+    radio = _arr(radio)
+    return {"area": np.pi * radio ** 2, "perimetro": 2 * np.pi * radio}
+
+
+def poligono_regular(n_lados, longitud_lado):
+    # n se deja con su tipo: las columnas enteras van directo a la tabla y no se copian a punto flotante
+    coeficiente = coeficiente_area_poligono(n_lados)
+    n_lados, longitud_lado = np.asarray(n_lados), _arr(longitud_lado)
+    return {
+        "area": coeficiente * longitud_lado ** 2,
+        "perimetro": n_lados * longitud_lado,
+    }
+
+
+def elipse(a, b):
+    a, b = _arr(a), _arr(b)
+    return {
+        "area": np.pi * a * b,
+        # Aproximación de Ramanujan
+        "perimetro": np.pi * (3 * (a + b) - np.sqrt((3 * a + b) * (a + 3 * b))),
+    }
+
+
+def trapecio(base_mayor, base_menor, altura, lado_no_paralelo):
+    base_mayor, base_menor = _arr(base_mayor), _arr(base_menor)
+    altura, lado_no_paralelo = _arr(altura), _arr(lado_no_paralelo)
+    return {
+        "area": ((base_mayor + base_menor) * altura) / 2,
+        "perimetro": base_mayor + base_menor + 2 * lado_no_paralelo,
+    }
+
+
+def paralelogramo(base, altura, angulo):
+    base, altura, angulo = _arr(base), _arr(altura), _arr(angulo)
+    lado_lateral = altura / np.sin(np.radians(angulo))
+    return {"area": base * altura, "perimetro": 2 * (base + lado_lateral)}
+
+
+def rombo(d_mayor, d_menor):
+    d_mayor, d_menor = _arr(d_mayor), _arr(d_menor)
+    lado = np.sqrt((d_mayor / 2) ** 2 + (d_menor / 2) ** 2)
+    return {"area": (d_mayor * d_menor) / 2, "perimetro": 4 * lado}
+
+
+def sector_circular(radio, angulo):
+    radio, angulo = _arr(radio), _arr(angulo)
+    return {
+        "area": (np.pi * radio ** 2 * angulo) / 360,
+        "longitud_arco": (2 * np.pi * radio * angulo) / 360,
+    }
+
+
+# Figuras 3D
+def cubo(lado):
+    lado = _arr(lado)
+    return {"area": 6 * lado ** 2, "volumen": lado ** 3}
+
+
+def esfera(radio):
+    radio = _arr(radio)
+    return {"area": 4 * np.pi * radio ** 2, "volumen": (4 / 3) * np.pi * radio ** 3}
+
+
+def piramide(lado_base, altura):
+    lado_base, altura = _arr(lado_base), _arr(altura)
+    area_base = lado_base ** 2
+    apotema = np.sqrt((lado_base / 2) ** 2 + altura ** 2)
+    area_lateral = 4 * (0.5 * lado_base * apotema)
+    return {"area_total": area_base + area_lateral, "volumen": (area_base * altura) / 3}
+
+
+def prisma(n_lados, longitud, altura):
+    coeficiente = coeficiente_area_poligono(n_lados)
+    n_lados, longitud, altura = np.asarray(n_lados), _arr(longitud), _arr(altura)
+    area_base = coeficiente * longitud ** 2
+    area_lateral = n_lados * longitud * altura
+    return {"area_total": 2 * area_base + area_lateral, "volumen": area_base * altura}
+
+
+def cono(radio, altura):
+    radio, altura = _arr(radio), _arr(altura)
+    generatriz = np.sqrt(radio ** 2 + altura ** 2)
+    area_base = np.pi * radio ** 2
+    return {
+        "generatriz": generatriz,
+        "area_total": area_base + np.pi * radio * generatriz,
+        "volumen": (1 / 3) * area_base * altura,
+    }
+
+
+def cilindro(radio, altura):
+    radio, altura = _arr(radio), _arr(altura)
+    area_base = np.pi * radio ** 2
+    return {
+        "area_total": 2 * area_base + 2 * np.pi * radio * altura,
+        "volumen": area_base * altura,
+    }
+
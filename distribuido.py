@@ -0,0 +1,354 @@
+"""Evaluación distribuida de lotes mixtos: un coordinador y trabajadores por TCP.
+
+El coordinador divide el lote en trozos y se los reparte a los trabajadores
+que se conectan a su puerto, sin ningún intermediario. Cada mensaje es una
+cabecera fija (tipo, número de trozo, largo) seguida de una carga columnar
+binaria: por cada columna su nombre, su tipo de NumPy y sus bytes crudos, que
+del otro lado se leen con `np.frombuffer` sin copiarlos ni interpretar texto.
+Solo viajan las columnas de parámetros que usan las figuras del trozo.
+
+Al conectarse, el trabajador recibe la lista de claves del registro del
+coordinador y traduce los códigos de figura a los de su propio registro. Si
+un trabajador se desconecta o no responde a tiempo, su trozo vuelve a la cola
+y lo toma otro; si informa un error, el trozo también se reintenta, hasta
+`REINTENTOS` veces. Cada resultado se escribe en la posición de su trozo, así
+que la salida queda en el orden de la entrada sin importar quién terminó
+primero.
+
+Desde la línea de comandos:
+
+    python distribuido.py coordinador entrada.npz salida.npz --puerto 5555
+    python distribuido.py trabajador servidor:5555        (en cada máquina)
+
+`entrada.npz` tiene la columna `figura` (claves o códigos del registro) y una
+columna por parámetro (NaN donde no aplica); `salida.npz` tiene una columna
+por propiedad. El protocolo no tiene autenticación: úselo solo en redes de
+confianza.
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import socket
+import struct
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+import registro
+
+TAM_TROZO = 1 << 18
+REINTENTOS = 3
+# Segundos que se espera la respuesta de un trozo antes de darlo por perdido
+TIEMPO_LIMITE = 60.0
+
+# Tipos de mensaje
+HOLA, TRABAJO, RESULTADO, ERROR, FIN = range(1, 6)
+
+_MAGICO = b"GEO1"
+_CABECERA = struct.Struct("!4sBqQ")
+_COLUMNAS = struct.Struct("!I")
+_NOMBRE = struct.Struct("!H")
+_TIPO = struct.Struct("!B")
+_BYTES = struct.Struct("!Q")
+
+
+class ErrorProtocolo(ConnectionError):
+    pass
+
+
+def codificar_columnas(columnas):
+    """Carga columnar: lista de bloques de bytes listos para enviarse sin copiar los datos."""
+    partes = [_COLUMNAS.pack(len(columnas))]
+    for nombre, valores in columnas.items():
+        valores = np.ascontiguousarray(valores)
+        nombre, tipo = nombre.encode(), valores.dtype.str.encode()
+        partes += [_NOMBRE.pack(len(nombre)), nombre, _TIPO.pack(len(tipo)), tipo,
+                   _BYTES.pack(valores.nbytes), memoryview(valores).cast("B")]
+    return partes
+
+
+def decodificar_columnas(datos):
+    """Inversa de `codificar_columnas`; los arreglos son vistas sobre `datos`."""
+    vista = memoryview(datos)
+    columnas, posicion = {}, _COLUMNAS.size
+    (cantidad,) = _COLUMNAS.unpack_from(vista)
+    for _ in range(cantidad):
+        (largo,) = _NOMBRE.unpack_from(vista, posicion)
+        posicion += _NOMBRE.size
+        nombre = bytes(vista[posicion:posicion + largo]).decode()
+        posicion += largo
+        (largo,) = _TIPO.unpack_from(vista, posicion)
+        posicion += _TIPO.size
+        tipo = np.dtype(bytes(vista[posicion:posicion + largo]).decode())
+        posicion += largo
+        if tipo.kind not in "biuf":
+            raise ErrorProtocolo(f"Tipo de columna no admitido: {tipo}.")
+        (largo,) = _BYTES.unpack_from(vista, posicion)
+        posicion += _BYTES.size
+        if posicion + largo > len(vista):
+            raise ErrorProtocolo("Carga columnar truncada.")
+        columnas[nombre] = np.frombuffer(vista[posicion:posicion + largo], dtype=tipo)
+        posicion += largo
+    return columnas
+
+
+def _enviar(conexion, tipo, trozo, partes=()):
+    largo = sum(len(p) if isinstance(p, bytes) else p.nbytes for p in partes)
+    conexion.sendall(_CABECERA.pack(_MAGICO, tipo, trozo, largo))
+    for parte in partes:
+        conexion.sendall(parte)
+
+
+def _recibir_exacto(conexion, largo):
+    datos = bytearray(largo)
+    vista, recibidos = memoryview(datos), 0
+    while recibidos < largo:
+        n = conexion.recv_into(vista[recibidos:])
+        if n == 0:
+            raise ErrorProtocolo("La conexión se cerró a mitad de un mensaje.")
+        recibidos += n
+    return datos
+
+
+def _recibir(conexion):
+    magico, tipo, trozo, largo = _CABECERA.unpack(_recibir_exacto(conexion, _CABECERA.size))
+    if magico != _MAGICO:
+        raise ErrorProtocolo("Mensaje no reconocido.")
+    return tipo, trozo, _recibir_exacto(conexion, largo)
+
+
+class Coordinador:
+    """Reparte un lote mixto entre los trabajadores que se conecten.
+
+    `claves` tiene la clave (o el código de `registro.codificar`) de la figura
+    de cada fila y `columnas` las columnas de parámetros, como en
+    `registro.evaluar_lote_mixto`. `direccion` es la dirección en la que
+    escucha (con `puerto=0` el sistema elige uno libre).
+    """
+
+    def __init__(self, claves, columnas, tam_trozo=TAM_TROZO, host="127.0.0.1", puerto=0,
+                 tiempo_limite=TIEMPO_LIMITE, reintentos=REINTENTOS):
+        claves = np.asarray(claves)
+        self.codigos = claves.astype(registro.TIPO_CODIGO) if np.issubdtype(claves.dtype, np.integer) \
+            else registro.codificar(claves)
+        self.filas = len(self.codigos)
+        # Las columnas enteras (n_lados) viajan como enteros y usan la tabla de polígonos sin conversión
+        tipos = registro.tipos_lote()
+        self.columnas = {nombre: registro.columna_lote(nombre, valores, tipos) for nombre, valores in columnas.items()}
+        self.salidas = {nombre: np.full(self.filas, np.nan) for nombre in registro.nombres_propiedades()}
+        self.trozos = [(inicio, min(self.filas, inicio + tam_trozo)) for inicio in range(0, self.filas, tam_trozo)]
+        self.tiempo_limite = tiempo_limite
+        self.reintentos = reintentos
+
+        self.condicion = threading.Condition()
+        self.pendientes = deque(range(len(self.trozos)))
+        self.terminados = set()
+        self.intentos = [0] * len(self.trozos)
+        self.error = None
+        self.servidor = socket.create_server((host, puerto))
+        self.direccion = self.servidor.getsockname()[:2]
+
+    def _entrada(self, trozo):
+        inicio, fin = self.trozos[trozo]
+        codigos = self.codigos[inicio:fin]
+        claves = list(registro.FIGURAS)
+        nombres = []
+        for codigo in np.unique(codigos):
+            nombres += [n for n in registro.obtener(claves[codigo]).nombres_parametros if n not in nombres]
+        return {"codigo": codigos, **{n: self.columnas[n][inicio:fin] for n in nombres}}
+
+    def _completo(self):
+        return len(self.terminados) == len(self.trozos)
+
+    def _siguiente(self):
+        """Siguiente trozo pendiente; espera si los que faltan están en curso. None al terminar."""
+        with self.condicion:
+            while True:
+                if self.error is not None or self._completo():
+                    return None
+                if self.pendientes:
+                    return self.pendientes.popleft()
+                self.condicion.wait()
+
+    def _devolver(self, trozo, motivo):
+        with self.condicion:
+            self.intentos[trozo] += 1
+            if self.intentos[trozo] > self.reintentos:
+                self.error = RuntimeError(f"El trozo {trozo} falló {self.intentos[trozo]} veces; último error: {motivo}")
+            else:
+                self.pendientes.appendleft(trozo)
+            self.condicion.notify_all()
+
+    def _guardar(self, trozo, columnas):
+        inicio, fin = self.trozos[trozo]
+        for nombre, valores in columnas.items():
+            if nombre not in self.salidas or len(valores) != fin - inicio:
+                raise ErrorProtocolo(f"Resultado inesperado para el trozo {trozo}: columna '{nombre}'.")
+        for nombre, valores in columnas.items():
+            self.salidas[nombre][inicio:fin] = valores
+        with self.condicion:
+            self.terminados.add(trozo)
+            self.condicion.notify_all()
+
+    def _atender(self, conexion, direccion):
+        with conexion:
+            conexion.settimeout(self.tiempo_limite)
+            try:
+                _enviar(conexion, HOLA, 0, [json.dumps(list(registro.FIGURAS)).encode()])
+                while True:
+                    trozo = self._siguiente()
+                    if trozo is None:
+                        _enviar(conexion, FIN, 0)
+                        return
+                    try:
+                        _enviar(conexion, TRABAJO, trozo, codificar_columnas(self._entrada(trozo)))
+                        tipo, numero, datos = _recibir(conexion)
+                        if tipo == ERROR:
+                            self._devolver(trozo, f"{direccion[0]}:{direccion[1]}: {datos.decode()}")
+                            continue
+                        if tipo != RESULTADO or numero != trozo:
+                            raise ErrorProtocolo(f"Se esperaba el resultado del trozo {trozo}.")
+                        self._guardar(trozo, decodificar_columnas(datos))
+                    except (OSError, ValueError) as e:
+                        # Trabajador perdido: el trozo vuelve a la cola para otro
+                        self._devolver(trozo, f"{direccion[0]}:{direccion[1]}: {e}")
+                        return
+            except OSError:
+                return
+
+    def ejecutar(self, tiempo_total=None):
+        """Acepta trabajadores hasta completar el lote; devuelve las propiedades en el orden de la entrada."""
+        limite = None if tiempo_total is None else time.monotonic() + tiempo_total
+        hilos = []
+        self.servidor.settimeout(0.2)
+        try:
+            while True:
+                with self.condicion:
+                    if self.error is not None or self._completo():
+                        break
+                if limite is not None and time.monotonic() > limite:
+                    with self.condicion:
+                        self.error = TimeoutError(f"El lote no terminó en {tiempo_total} s "
+                                                  f"({len(self.terminados)} de {len(self.trozos)} trozos).")
+                        self.condicion.notify_all()
+                    break
+                try:
+                    conexion, direccion = self.servidor.accept()
+                except socket.timeout:
+                    continue
+                hilo = threading.Thread(target=self._atender, args=(conexion, direccion),
+                                        name=f"coordinador-{direccion[0]}:{direccion[1]}", daemon=True)
+                hilo.start()
+                hilos.append(hilo)
+        finally:
+            self.servidor.close()
+        for hilo in hilos:
+            hilo.join()
+        if self.error is not None:
+            raise self.error
+        return self.salidas
+
+
+def _conectar(host, puerto, espera):
+    # El coordinador puede no estar escuchando todavía
+    limite = time.monotonic() + espera
+    while True:
+        try:
+            return socket.create_connection((host, puerto))
+        except OSError:
+            if time.monotonic() > limite:
+                raise
+            time.sleep(0.1)
+
+
+def trabajador(host, puerto, espera=10.0):
+    """Evalúa trozos del coordinador hasta que no queden; devuelve cuántos evaluó."""
+    evaluados = 0
+    with _conectar(host, puerto, espera) as conexion:
+        tipo, _, datos = _recibir(conexion)
+        if tipo != HOLA:
+            raise ErrorProtocolo("El coordinador no envió su registro de figuras.")
+        locales = {clave: i for i, clave in enumerate(registro.FIGURAS)}
+        claves = json.loads(datos.decode())
+        # Código del coordinador -> código local (-1 si la figura no está registrada aquí)
+        traduccion = np.array([locales.get(clave, -1) for clave in claves], dtype=registro.TIPO_CODIGO)
+        while True:
+            tipo, trozo, datos = _recibir(conexion)
+            if tipo == FIN:
+                return evaluados
+            if tipo != TRABAJO:
+                raise ErrorProtocolo(f"Mensaje inesperado del coordinador: {tipo}.")
+            try:
+                entrada = decodificar_columnas(datos)
+                originales = entrada.pop("codigo")
+                codigos = traduccion[originales]
+                if (codigos < 0).any():
+                    faltantes = [claves[i] for i in np.unique(originales[codigos < 0])]
+                    raise ValueError(f"Figuras no registradas en este trabajador: {', '.join(faltantes)}.")
+                salida = registro.evaluar_lote_mixto(codigos, entrada)
+            except Exception as e:
+                _enviar(conexion, ERROR, trozo, [str(e).encode()])
+                continue
+            _enviar(conexion, RESULTADO, trozo, codificar_columnas(salida))
+            evaluados += 1
+
+
+def evaluar_local(claves, columnas, trabajadores=None, tam_trozo=TAM_TROZO, tiempo_total=None):
+    """Coordinador y `trabajadores` procesos en esta máquina, conectados por localhost."""
+    trabajadores = trabajadores or os.cpu_count() or 1
+    coordinador = Coordinador(claves, columnas, tam_trozo)
+    host, puerto = coordinador.direccion
+    procesos = [mp.get_context().Process(target=trabajador, args=(host, puerto), daemon=True)
+                for _ in range(trabajadores)]
+    for proceso in procesos:
+        proceso.start()
+    try:
+        return coordinador.ejecutar(tiempo_total)
+    finally:
+        for proceso in procesos:
+            proceso.join(timeout=5)
+            if proceso.is_alive():
+                proceso.terminate()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluación distribuida de lotes de figuras.")
+    modos = parser.add_subparsers(dest="modo", required=True)
+    coordinador = modos.add_parser("coordinador", help="reparte un lote y junta los resultados")
+    coordinador.add_argument("entrada", help="archivo .npz con la columna 'figura' y los parámetros")
+    coordinador.add_argument("salida", help="archivo .npz donde guardar las propiedades")
+    coordinador.add_argument("--host", default="0.0.0.0")
+    coordinador.add_argument("--puerto", type=int, default=5555)
+    coordinador.add_argument("--tam-trozo", type=int, default=TAM_TROZO)
+    coordinador.add_argument("--locales", type=int, default=0, help="trabajadores a iniciar en esta máquina")
+    trabajador_parser = modos.add_parser("trabajador", help="evalúa trozos de un coordinador")
+    trabajador_parser.add_argument("direccion", help="host:puerto del coordinador")
+    args = parser.parse_args(argv)
+
+    if args.modo == "trabajador":
+        host, _, puerto = args.direccion.rpartition(":")
+        print(f"Trozos evaluados: {trabajador(host, int(puerto))}")
+        return
+
+    with np.load(args.entrada) as archivo:
+        columnas = {nombre: archivo[nombre] for nombre in archivo.files}
+    claves = columnas.pop("figura")
+    instancia = Coordinador(claves, columnas, args.tam_trozo, args.host, args.puerto)
+    print(f"Esperando trabajadores en {instancia.direccion[0]}:{instancia.direccion[1]} "
+          f"({len(instancia.trozos)} trozos)")
+    locales = [mp.get_context().Process(target=trabajador, args=("127.0.0.1", instancia.direccion[1]), daemon=True)
+               for _ in range(args.locales)]
+    for proceso in locales:
+        proceso.start()
+    salidas = instancia.ejecutar()
+    for proceso in locales:
+        proceso.join()
+    np.savez(args.salida, **salidas)
+    print(f"Resultados guardados en {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
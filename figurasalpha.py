@@ -11,12 +11,24 @@ import sys
 import os
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
+import time
+import render_vectorial
+import historial
+import almacen_columnar
+import tabla_resultados
+import galeria
+import registro
+import inverso
+import tolerancias
+import triangulos
+import geometria
+import animacion
+import formulas
 
 # Constantes globales
 UNIDADES_VALIDAS = ["cm", "m", "in", "ft"]
 CONV_FACTORS = {"cm": 1, "m": 100, "in": 2.54, "ft": 30.48}
 
-
 def check_dependencies(dependencies):
     missing = []
     for dep in dependencies:
@@ -51,13 +63,19 @@ def convertir_a_cm(valor, unidad):
         raise ValueError(f"Unidad no válida: {unidad}. Las unidades válidas son {UNIDADES_VALIDAS}.")
     return valor * CONV_FACTORS[unidad]
 
-def exportar_a_pdf(resultado_texto, fig):
+def exportar_a_pdf(resultado_texto, fig, contorno=None):
     file_path = filedialog.asksaveasfilename(
         defaultextension=".pdf",
         filetypes=[("Archivos PDF", "*.pdf")]
     )
     if file_path:
         try:
+            # Las figuras 2D se escriben como trazos vectoriales sin pasar por matplotlib
+            if contorno is not None:
+                render_vectorial.reporte_pdf(file_path, [(resultado_texto, contorno)])
+                messagebox.showinfo("Exportación", "Resultados exportados exitosamente en PDF.")
+                return
+
             # Crear el canvas del PDF con ReportLab
             c = canvas.Canvas(file_path, pagesize=letter)
             width, height = letter
@@ -90,21 +108,68 @@ def exportar_a_pdf(resultado_texto, fig):
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo exportar: {e}")
 
+def exportar_a_svg(contorno, titulo=None):
+    file_path = filedialog.asksaveasfilename(
+        defaultextension=".svg",
+        filetypes=[("Archivos SVG", "*.svg")]
+    )
+    if file_path:
+        try:
+            render_vectorial.guardar_svg(file_path, contorno, titulo=titulo)
+            messagebox.showinfo("Exportación", "Figura exportada exitosamente en SVG.")
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo exportar: {e}")
+
+def exportar_a_gif(clave, parametros, titulo=None):
+    file_path = filedialog.asksaveasfilename(
+        defaultextension=".gif",
+        filetypes=[("Archivos GIF", "*.gif")]
+    )
+    if file_path:
+        try:
+            animacion.exportar_gif(file_path, clave, parametros, titulo=titulo)
+            messagebox.showinfo("Exportación", "Animación exportada exitosamente en GIF.")
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo exportar: {e}")
+
 class Triangulo:
-    def __init__(self, base, altura, unidad="cm"):
+    """Triángulo general resuelto con `triangulos` a partir de cualquier caso.
+
+    Los lados se dan en `unidad` y se guardan en cm; los ángulos van en grados.
+    En el caso LLA ambiguo, `alternativa` tiene el segundo triángulo posible.
+    """
+    def __init__(self, caso="LLL", unidad="cm", **datos):
+        self.caso = caso
         self.unidad = unidad
-        self.base = convertir_a_cm(base, unidad)
-        self.altura = convertir_a_cm(altura, unidad)
-        self.hipotenusa = math.sqrt(self.base ** 2 + self.altura ** 2)
-        self.area = 0.5 * self.base * self.altura
-        self.perimetro = self.base + self.altura + self.hipotenusa
-        self.tipo = self.clasificar()  # Llama al método clasificar
-
-    def clasificar(self):
-        if self.base == self.altura:
-            return "Isósceles"
-        else:
-            return "Escaleno"
+        datos = {nombre: convertir_a_cm(valor, unidad) if nombre.islower() else valor
+                 for nombre, valor in datos.items()}
+        primera, segunda = triangulos.resolver(caso, **datos)
+        if not primera["valido"]:
+            raise ValueError("Los datos no forman un triángulo.")
+        self._asignar(primera)
+        self.alternativa = None
+        if segunda is not None and segunda["valido"]:
+            self.alternativa = Triangulo("LLL", a=float(segunda["a"]), b=float(segunda["b"]), c=float(segunda["c"]))
+
+    @classmethod
+    def rectangulo(cls, base, altura, unidad="cm"):
+        """Triángulo rectángulo a partir de sus catetos."""
+        return cls("LAL", unidad, a=base, b=altura, C=90)
+
+    def _asignar(self, resultado):
+        for clave in ("a", "b", "c", "A", "B", "C", "area", "perimetro", "inradio", "circunradio"):
+            setattr(self, clave, float(resultado[clave]))
+        self.tipo = str(resultado["por_lados"])
+        self.tipo_angulos = str(resultado["por_angulos"])
+
+    def texto(self):
+        return (f"Lados: a = {self.a:.2f} cm, b = {self.b:.2f} cm, c = {self.c:.2f} cm\n"
+                f"Ángulos: A = {self.A:.2f}°, B = {self.B:.2f}°, C = {self.C:.2f}°\n"
+                f"Área: {self.area:.2f} cm²\n"
+                f"Perímetro: {self.perimetro:.2f} cm\n"
+                f"Inradio: {self.inradio:.2f} cm\n"
+                f"Circunradio: {self.circunradio:.2f} cm\n"
+                f"Tipo: {self.tipo} {self.tipo_angulos.lower()}")
 
 
 # Ventana principal
@@ -119,6 +184,15 @@ class App:
         self.style.theme_use("clam")
         self.configurar_estilos()
 
+        # Historial de cálculos (se guarda en segundo plano)
+        self.historial = historial.Historial()
+
+        # Figuras definidas por el usuario en sesiones anteriores
+        errores = formulas.cargar()
+        if errores:
+            messagebox.showwarning("Figuras Personalizadas", "No se pudieron cargar:\n" +
+                                   "\n".join(f"{nombre}: {error}" for nombre, error in errores))
+
         # Contenedor principal
         self.main_frame = ttk.Frame(root)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -188,6 +262,8 @@ class App:
     def limpiar_contenido(self):
         for widget in self.main_frame.winfo_children():
             widget.destroy()
+        # Las figuras de pyplot siguen registradas aunque se destruya su lienzo
+        plt.close("all")
 
     """Muestra el menú principal."""
     def mostrar_menu_principal(self):
@@ -196,6 +272,10 @@ class App:
         ttk.Label(self.main_frame, text="Selecciona una categoría:", font=("Arial", 14)).pack(pady=10)
         ttk.Button(self.main_frame, text="Figuras 2D", command=self.mostrar_menu_2d).pack(pady=5)
         ttk.Button(self.main_frame, text="Figuras 3D", command=self.mostrar_menu_3d).pack(pady=5)
+        ttk.Button(self.main_frame, text="Figuras Personalizadas", command=self.mostrar_menu_personalizadas).pack(pady=5)
+        ttk.Button(self.main_frame, text="Resultados por Lote", command=self.abrir_resultados_lote).pack(pady=5)
+        ttk.Button(self.main_frame, text="Historial", command=self.mostrar_historial).pack(pady=5)
+        ttk.Button(self.main_frame, text="Galería", command=self.mostrar_menu_galeria).pack(pady=5)
         ttk.Button(self.main_frame, text="Cambiar Tema", command=self.cambiar_tema_interfaz).pack(pady=5)
         ttk.Button(self.main_frame, text="Contacto", command=self.mostrar_contacto).pack(pady=5)
         ttk.Button(self.main_frame, text="Salir", command=self.root.quit).pack(pady=5)
@@ -203,31 +283,253 @@ class App:
 
     """Muestra el menú de figuras 2D."""
     def mostrar_menu_2d(self):
-        self.limpiar_contenido()
-        ttk.Label(self.main_frame, text="Selecciona una figura 2D:", font=("Arial", 12)).pack(pady=10)
-        ttk.Button(self.main_frame, text="Triángulo", command=self.calcular_triangulo).pack(pady=5)
-        ttk.Button(self.main_frame, text="Cuadrilátero", command=self.calcular_cuadrilatero).pack(pady=5)
-        ttk.Button(self.main_frame, text="Círculo", command=self.calcular_circulo).pack(pady=5)
-        ttk.Button(self.main_frame, text="Polígono Regular", command=self.calcular_poligono_regular).pack(pady=5)
-        ttk.Button(self.main_frame, text="Elipse", command=self.calcular_elipse).pack(pady=5)
-        ttk.Button(self.main_frame, text="Trapecio", command=self.calcular_trapecio).pack(pady=5)
-        ttk.Button(self.main_frame, text="Paralelogramo", command=self.calcular_paralelogramo).pack(pady=5)
-        ttk.Button(self.main_frame, text="Rombo", command=self.calcular_rombo).pack(pady=5)
-        ttk.Button(self.main_frame, text="Sector Circular", command=self.calcular_sector_circular).pack(pady=5)
-        ttk.Button(self.main_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
+        self.mostrar_menu_figuras("2D")
 
     """Muestra el menú de figuras 3D."""
     def mostrar_menu_3d(self):
+        self.mostrar_menu_figuras("3D")
+
+    def mostrar_menu_figuras(self, dimension):
         self.limpiar_contenido()
-        ttk.Label(self.main_frame, text="Selecciona una figura 3D:", font=("Arial", 12)).pack(pady=10)
-        ttk.Button(self.main_frame, text="Cubo", command=self.calcular_cubo).pack(pady=5)
-        ttk.Button(self.main_frame, text="Esfera", command=self.calcular_esfera).pack(pady=5)
-        ttk.Button(self.main_frame, text="Pirámide", command=self.calcular_piramide).pack(pady=5)
-        ttk.Button(self.main_frame, text="Prisma", command=self.calcular_prisma).pack(pady=5)
-        ttk.Button(self.main_frame, text="Cono", command=self.calcular_cono).pack(pady=5)
-        ttk.Button(self.main_frame, text="Cilindro", command=self.calcular_cilindro).pack(pady=5)
+        ttk.Label(self.main_frame, text=f"Selecciona una figura {dimension}:", font=("Arial", 12)).pack(pady=10)
+        for figura in registro.figuras(dimension):
+            if isinstance(figura, formulas.FiguraPersonalizada):
+                continue
+            ttk.Button(self.main_frame, text=figura.nombre,
+                       command=lambda clave=figura.clave: self.calcular_figura(clave)).pack(pady=5)
+        if dimension == "2D":
+            ttk.Button(self.main_frame, text="Resolver Triángulo", command=self.calcular_triangulo_general).pack(pady=5)
         ttk.Button(self.main_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
 
+    def regresar_a_menu(self, figura):
+        if isinstance(figura, formulas.FiguraPersonalizada):
+            self.mostrar_menu_personalizadas()
+        elif figura.dimension == "2D":
+            self.mostrar_menu_2d()
+        else:
+            self.mostrar_menu_3d()
+
+    """Muestra las figuras definidas por el usuario."""
+    def mostrar_menu_personalizadas(self):
+        self.limpiar_contenido()
+        ttk.Label(self.main_frame, text="Figuras personalizadas:", font=("Arial", 12)).pack(pady=10)
+        for figura in formulas.personalizadas():
+            ttk.Button(self.main_frame, text=f"{figura.nombre} ({figura.dimension})",
+                       command=lambda clave=figura.clave: self.calcular_figura(clave)).pack(pady=5)
+        ttk.Button(self.main_frame, text="Nueva Figura", command=self.nueva_figura_personalizada).pack(pady=5)
+        ttk.Button(self.main_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
+
+    def nueva_figura_personalizada(self):
+        """Formulario para definir una figura con sus propias fórmulas."""
+        self.limpiar_contenido()
+        ttk.Label(self.main_frame, text="Nombre:").pack(pady=5)
+        nombre_entry = ttk.Entry(self.main_frame)
+        nombre_entry.pack()
+        ttk.Label(self.main_frame, text="Dimensión:").pack(pady=5)
+        dimension_var = tk.StringVar(value="2D")
+        ttk.Combobox(self.main_frame, textvariable=dimension_var, state="readonly", values=["2D", "3D"]).pack()
+        ttk.Label(self.main_frame, text="Parámetros (separados por comas):").pack(pady=5)
+        parametros_entry = ttk.Entry(self.main_frame)
+        parametros_entry.pack()
+        ttk.Label(self.main_frame, text="Fórmulas (una asignación por línea; 'dentro' define la región en x, y):").pack(pady=5)
+        formula_text = tk.Text(self.main_frame, width=60, height=8)
+        formula_text.insert("1.0", "area = pi * a * b\nperimetro = 2 * pi * sqrt((a**2 + b**2) / 2)\n"
+                                   "dentro = (x / a)**2 + (y / b)**2 <= 1")
+        formula_text.pack()
+
+        def guardar():
+            nombre = nombre_entry.get().strip()
+            if not nombre:
+                messagebox.showerror("Error", "Escribe un nombre para la figura.")
+                return
+            try:
+                formulas.crear(nombre, dimension_var.get(), parametros_entry.get().split(","),
+                               formula_text.get("1.0", tk.END))
+                formulas.guardar()
+            except formulas.ErrorFormula as e:
+                messagebox.showerror("Error en la fórmula", str(e))
+                return
+            except OSError as e:
+                messagebox.showerror("Error", f"No se pudo guardar: {e}")
+                return
+            self.mostrar_menu_personalizadas()
+
+        ttk.Button(self.main_frame, text="Guardar", command=guardar).pack(pady=10)
+        ttk.Button(self.main_frame, text="Regresar", command=self.mostrar_menu_personalizadas).pack(pady=5)
+
+    """Muestra el historial de cálculos paginado."""
+    def mostrar_historial(self):
+        self.limpiar_contenido()
+        self.historial.vaciar()
+        ttk.Label(self.main_frame, text="Historial de cálculos", font=("Arial", 14)).pack(pady=10)
+
+        filtro_frame = ttk.Frame(self.main_frame)
+        filtro_frame.pack(pady=5)
+        ttk.Label(filtro_frame, text="Figura:").pack(side=tk.LEFT, padx=5)
+        figura_var = tk.StringVar(value="Todas")
+        filtro = ttk.Combobox(filtro_frame, textvariable=figura_var, state="readonly",
+                              values=["Todas"] + self.historial.figuras())
+        filtro.pack(side=tk.LEFT, padx=5)
+        total_label = ttk.Label(filtro_frame)
+        total_label.pack(side=tk.LEFT, padx=10)
+
+        columnas = ("id", "fecha", "figura", "parametros", "resultado")
+        tabla = ttk.Treeview(self.main_frame, columns=columnas, show="headings", height=20)
+        for columna, ancho in zip(columnas, (60, 140, 110, 260, 260)):
+            tabla.heading(columna, text=columna.capitalize())
+            tabla.column(columna, width=ancho, anchor=tk.W)
+        tabla.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        # Pila con el id inicial de cada página visitada (paginación por llave)
+        paginas = [None]
+
+        def figura_actual():
+            return None if figura_var.get() == "Todas" else figura_var.get()
+
+        def cargar():
+            tabla.delete(*tabla.get_children())
+            filas = self.historial.pagina(figura_actual(), antes_de=paginas[-1])
+            for id_, figura, fecha, parametros, resultado in filas:
+                texto_parametros = ", ".join(f"{k}={v:g}" if isinstance(v, (int, float)) else f"{k}={v}"
+                                             for k, v in parametros.items())
+                tabla.insert("", tk.END, values=(id_, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(fecha)),
+                                                 figura, texto_parametros, resultado.replace("\n", " | ")))
+            total_label.config(text=f"Página {len(paginas)} de {self.historial.contar(figura_actual())} registros")
+            return filas
+
+        def siguiente():
+            hijos = tabla.get_children()
+            if len(hijos) == historial.TAM_PAGINA:
+                paginas.append(int(tabla.item(hijos[-1], "values")[0]))
+                if not cargar():
+                    paginas.pop()
+                    cargar()
+
+        def anterior():
+            if len(paginas) > 1:
+                paginas.pop()
+                cargar()
+
+        def filtrar(_evento=None):
+            del paginas[1:]
+            cargar()
+
+        filtro.bind("<<ComboboxSelected>>", filtrar)
+        botones_frame = ttk.Frame(self.main_frame)
+        botones_frame.pack(pady=10)
+        ttk.Button(botones_frame, text="Anterior", command=anterior).pack(side=tk.LEFT, padx=5)
+        ttk.Button(botones_frame, text="Siguiente", command=siguiente).pack(side=tk.LEFT, padx=5)
+        ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
+        cargar()
+
+    def abrir_resultados_lote(self):
+        ruta = filedialog.askdirectory(title="Selecciona la carpeta del almacén de resultados")
+        if not ruta:
+            return
+        almacen = almacen_columnar.AlmacenColumnar(ruta)
+        tablas = [t for t in almacen.tablas() if t in registro.FIGURAS]
+        if not tablas:
+            messagebox.showerror("Error", "La carpeta no contiene resultados por lote.")
+            return
+        self.mostrar_resultados_lote(almacen, tablas[0])
+
+    """Muestra un lote de resultados en una tabla virtualizada."""
+    def mostrar_resultados_lote(self, almacen, figura):
+        self.limpiar_contenido()
+        resultados_frame, figura_frame = self.dividir_frame()
+        seleccion_frame = ttk.Frame(resultados_frame)
+        seleccion_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(seleccion_frame, text="Figura:").pack(side=tk.LEFT, padx=5)
+        figura_var = tk.StringVar(value=figura)
+        selector = ttk.Combobox(seleccion_frame, textvariable=figura_var, state="readonly",
+                                values=[t for t in almacen.tablas() if t in registro.FIGURAS])
+        selector.pack(side=tk.LEFT, padx=5)
+        selector.bind("<<ComboboxSelected>>", lambda e: self.mostrar_resultados_lote(almacen, figura_var.get()))
+        ttk.Button(seleccion_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
+
+        columnas = almacen.abrir(figura)
+        tabla = tabla_resultados.TablaVirtual(
+            resultados_frame, columnas,
+            al_seleccionar=lambda fila: self.dibujar_fila(figura_frame, figura, columnas, fila)
+        )
+        tabla.pack(fill=tk.BOTH, expand=True)
+
+    def dibujar_fila(self, frame, figura, columnas, fila):
+        """Grafica una fila de un lote con el método dibujar_* correspondiente."""
+        for widget in frame.winfo_children():
+            widget.destroy()
+        plt.close("all")
+        definicion = registro.obtener(figura)
+        parametros = {nombre: columnas[nombre][fila] for nombre in definicion.nombres_parametros}
+        getattr(self, definicion.dibujo_metodo)(frame, *definicion.argumentos_dibujo(parametros))
+
+    """Muestra las fuentes disponibles para la galería."""
+    def mostrar_menu_galeria(self):
+        self.limpiar_contenido()
+        ttk.Label(self.main_frame, text="Galería de figuras", font=("Arial", 14)).pack(pady=10)
+        ttk.Button(self.main_frame, text="Desde el Historial", command=self.galeria_desde_historial).pack(pady=5)
+        ttk.Button(self.main_frame, text="Desde un Lote", command=self.galeria_desde_lote).pack(pady=5)
+        ttk.Button(self.main_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
+
+    def galeria_desde_historial(self, limite=5000):
+        self.historial.vaciar()
+        elementos = [(figura, parametros) for _, figura, _, parametros, _ in self.historial.pagina(limite=limite)
+                     if figura in registro.FIGURAS and registro.FIGURAS[figura].tiene_contorno]
+        if not elementos:
+            messagebox.showinfo("Galería", "El historial está vacío.")
+            return
+        self.mostrar_galeria(elementos)
+
+    def galeria_desde_lote(self):
+        ruta = filedialog.askdirectory(title="Selecciona la carpeta del almacén de resultados")
+        if not ruta:
+            return
+        almacen = almacen_columnar.AlmacenColumnar(ruta)
+        tablas = [t for t in almacen.tablas() if t in registro.FIGURAS and registro.FIGURAS[t].tiene_contorno]
+        if not tablas:
+            messagebox.showerror("Error", "La carpeta no contiene resultados por lote.")
+            return
+        self.galeria_de_tabla(almacen, tablas, tablas[0])
+
+    def galeria_de_tabla(self, almacen, tablas, tabla):
+        """Galería de una tabla del almacén; los mosaicos leen solo sus filas de los fragmentos mapeados."""
+        parametros = registro.obtener(tabla).nombres_parametros
+        columnas = almacen.abrir(tabla, parametros)
+        self.mostrar_galeria(galeria.ElementosLote(tabla, columnas, parametros),
+                             selector=(tablas, tabla, lambda t: self.galeria_de_tabla(almacen, tablas, t)))
+
+    def mostrar_galeria(self, elementos, filas=4, columnas=4, selector=None):
+        """`selector` es (opciones, actual, al_cambiar) para elegir la tabla de un lote."""
+        self.limpiar_contenido()
+        plt.close("all")
+        fig = plt.figure(figsize=(8, 8))
+        canvas = FigureCanvasTkAgg(fig, master=self.main_frame)
+        vista = galeria.Galeria(fig, elementos, filas, columnas)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        botones_frame = ttk.Frame(self.main_frame)
+        botones_frame.pack(pady=5)
+        if selector is not None:
+            opciones, actual, al_cambiar = selector
+            ttk.Label(botones_frame, text="Figura:").pack(side=tk.LEFT, padx=5)
+            tabla_var = tk.StringVar(value=actual)
+            seleccion = ttk.Combobox(botones_frame, textvariable=tabla_var, state="readonly", values=opciones)
+            seleccion.pack(side=tk.LEFT, padx=5)
+            seleccion.bind("<<ComboboxSelected>>", lambda e: al_cambiar(tabla_var.get()))
+        pagina_label = ttk.Label(botones_frame)
+
+        def mover(paso):
+            vista.mostrar_pagina(vista.pagina + paso)
+            pagina_label.config(text=f"Página {vista.pagina + 1} de {vista.num_paginas}")
+
+        ttk.Button(botones_frame, text="Anterior", command=lambda: mover(-1)).pack(side=tk.LEFT, padx=5)
+        pagina_label.pack(side=tk.LEFT, padx=5)
+        ttk.Button(botones_frame, text="Siguiente", command=lambda: mover(1)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_galeria).pack(side=tk.LEFT, padx=5)
+        canvas.mpl_connect("scroll_event", lambda e: mover(1 if e.button == "down" else -1))
+        canvas.draw()
+        mover(0)
+
     # contacyo
     def mostrar_contacto(self):
         self.limpiar_contenido()
@@ -246,41 +548,197 @@ class App:
         webbrowser.open("https://github.com/MNooker")
 
 
-#calculos figuras 2d
-    def calcular_triangulo(self):
-        for widget in self.main_frame.winfo_children(): widget.destroy()
+    # Formulario y resultados genéricos, generados a partir del registro de figuras
+    def calcular_figura(self, clave):
+        figura = registro.obtener(clave)
+        self.limpiar_contenido()
         resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Base:").pack()
-        self.base_entry = ttk.Entry(resultados_frame)
-        self.base_entry.pack()
-        ttk.Label(resultados_frame, text="Altura:").pack()
-        self.altura_entry = ttk.Entry(resultados_frame)
-        self.altura_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_triangulo(resultados_frame, figura_frame)).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
-
-    def mostrar_resultado_triangulo(self, resultados_frame, figura_frame):
+        self.entradas = {}
+        for parametro in figura.parametros:
+            ttk.Label(resultados_frame, text=f"{parametro.etiqueta}:").pack(pady=5)
+            self.entradas[parametro.nombre] = ttk.Entry(resultados_frame)
+            self.entradas[parametro.nombre].pack()
+        ttk.Button(resultados_frame, text="Calcular",
+                   command=lambda: self.mostrar_resultado_figura(clave, resultados_frame, figura_frame)).pack(pady=10)
+        ttk.Button(resultados_frame, text="Resolver para...",
+                   command=lambda: self.resolver_para(clave, resultados_frame, figura_frame)).pack(pady=5)
+        ttk.Button(resultados_frame, text="Tolerancias...",
+                   command=lambda: self.calcular_tolerancias(clave)).pack(pady=5)
+        ttk.Button(resultados_frame, text="Regresar", command=lambda: self.regresar_a_menu(figura)).pack(pady=5)
+
+    def resolver_para(self, clave, resultados_frame, figura_frame):
+        """Busca el valor de un parámetro que produce el área, perímetro o volumen indicado."""
+        figura = registro.obtener(clave)
+        etiquetas = {p.nombre: p.etiqueta for p in figura.parametros}
+        incognitas = {etiquetas[nombre]: nombre for nombre in inverso.incognitas(clave)}
+        propiedades = {etiqueta: propiedad for propiedad, etiqueta, _ in figura.propiedades}
+
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Resolver para")
+        ventana.geometry("320x260")
+        ttk.Label(ventana, text="Incógnita:").pack(pady=5)
+        incognita_var = tk.StringVar(value=next(iter(incognitas)))
+        ttk.Combobox(ventana, textvariable=incognita_var, state="readonly", values=list(incognitas)).pack()
+        ttk.Label(ventana, text="Propiedad objetivo:").pack(pady=5)
+        propiedad_var = tk.StringVar(value=next(iter(propiedades)))
+        ttk.Combobox(ventana, textvariable=propiedad_var, state="readonly", values=list(propiedades)).pack()
+        ttk.Label(ventana, text="Valor objetivo:").pack(pady=5)
+        objetivo_entry = ttk.Entry(ventana)
+        objetivo_entry.pack()
+
+        def aplicar():
+            incognita = incognitas[incognita_var.get()]
+            try:
+                objetivo = float(objetivo_entry.get())
+                fijos = {p.nombre: p.tipo(self.entradas[p.nombre].get())
+                         for p in figura.parametros if p.nombre != incognita}
+            except ValueError:
+                messagebox.showerror("Error", "Ingresa valores numéricos válidos en los demás parámetros y en el objetivo.")
+                return
+            solucion = inverso.resolver(clave, propiedades[propiedad_var.get()], objetivo, incognita, fijos)
+            if not solucion.convergio:
+                messagebox.showerror("Error", "No existe un valor válido de la incógnita que alcance ese objetivo.")
+                return
+            self.entradas[incognita].delete(0, tk.END)
+            self.entradas[incognita].insert(0, f"{float(solucion.valores):.6g}")
+            ventana.destroy()
+            if (clave, incognita) in inverso.RAMAS:
+                messagebox.showinfo("Resolver para", f"Se eligió la solución en (0, {inverso.RAMAS[(clave, incognita)]:g}]; "
+                                                     f"180 - {float(solucion.valores):.6g} también es solución.")
+            self.mostrar_resultado_figura(clave, resultados_frame, figura_frame)
+
+        ttk.Button(ventana, text="Resolver", command=aplicar).pack(pady=10)
+
+    def calcular_tolerancias(self, clave):
+        """Propaga tolerancias ± de los parámetros a las propiedades de la figura."""
+        figura = registro.obtener(clave)
         try:
-            base = float(self.base_entry.get())
-            altura = float(self.altura_entry.get())
-            if base <= 0 or altura <= 0:
-                messagebox.showerror("Error", "Los valores deben ser mayores que cero.")
+            valores = {p.nombre: p.tipo(self.entradas[p.nombre].get()) for p in figura.parametros}
+        except ValueError:
+            messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
+            return
+        if not figura.validar(valores):
+            messagebox.showerror("Error", figura.mensaje_error)
+            return
+
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Tolerancias")
+        ventana.geometry("560x520")
+        entradas_tolerancia = {}
+        for parametro in figura.parametros:
+            if parametro.nombre not in tolerancias.parametros_con_tolerancia(clave):
+                continue
+            ttk.Label(ventana, text=f"Tolerancia ± de {parametro.etiqueta}:").pack(pady=2)
+            entradas_tolerancia[parametro.nombre] = ttk.Entry(ventana)
+            entradas_tolerancia[parametro.nombre].insert(0, "0")
+            entradas_tolerancia[parametro.nombre].pack()
+        montecarlo_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(ventana, text="Incluir Monte Carlo (10⁶ muestras)", variable=montecarlo_var).pack(pady=5)
+        resultado_label = ttk.Label(ventana, justify="left")
+
+        def aplicar():
+            try:
+                tolerancia = {nombre: float(entrada.get()) for nombre, entrada in entradas_tolerancia.items()}
+            except ValueError:
+                messagebox.showerror("Error", "Ingresa tolerancias numéricas válidas.")
                 return
-            area = 0.5 * base * altura
-            perimetro = base + altura + math.sqrt(base ** 2 + altura ** 2)
-            resultado_texto = f"Área: {area:.2f} cm²\nPerímetro: {perimetro:.2f} cm"
-            for widget in resultados_frame.winfo_children(): widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_triangulo).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_2d).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-            self.dibujar_triangulo(figura_frame, base, altura)
+            muestras = tolerancias.MUESTRAS if montecarlo_var.get() else None
+            resultado_label.config(text=tolerancias.texto_tolerancias(clave, valores, tolerancia, muestras))
+
+        ttk.Button(ventana, text="Calcular", command=aplicar).pack(pady=5)
+        resultado_label.pack(pady=5)
+        ttk.Button(ventana, text="Exportar Texto",
+                   command=lambda: self.exportar_resultados(resultado_label.cget("text"))).pack(pady=5)
+
+    def mostrar_resultado_figura(self, clave, resultados_frame, figura_frame):
+        figura = registro.obtener(clave)
+        try:
+            parametros = {p.nombre: p.tipo(self.entradas[p.nombre].get()) for p in figura.parametros}
         except ValueError:
             messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
+            return
+        if not figura.validar(parametros):
+            messagebox.showerror("Error", figura.mensaje_error)
+            return
+        propiedades = figura.calcular(parametros)
+        resultado_texto = figura.texto_resultado(parametros, propiedades)
+        self.historial.registrar(clave, parametros, resultado_texto)
+
+        for widget in resultados_frame.winfo_children(): widget.destroy()
+        ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
+        ttk.Label(resultados_frame, text=resultado_texto, justify="left").pack(pady=5)
+        botones_frame = ttk.Frame(resultados_frame)
+        botones_frame.pack(pady=10)
+        ttk.Button(botones_frame, text="Volver a Calcular", command=lambda: self.calcular_figura(clave)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(botones_frame, text="Regresar", command=lambda: self.regresar_a_menu(figura)).pack(side=tk.LEFT, padx=5)
+        fig = getattr(self, figura.dibujo_metodo)(figura_frame, *figura.argumentos_dibujo(parametros))
+        contorno = figura.contorno(parametros) if figura.dimension == "2D" and figura.tiene_contorno else None
+        if contorno is not None:
+            # Las figuras 2D se exportan como trazos vectoriales
+            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig, contorno)).pack(side=tk.LEFT, padx=5)
+            ttk.Button(botones_frame, text="Exportar SVG", command=lambda: exportar_a_svg(contorno, figura.nombre)).pack(side=tk.LEFT, padx=5)
+        elif isinstance(figura, formulas.FiguraPersonalizada):
+            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
+        else:
+            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
+            ttk.Button(botones_frame, text="Exportar GIF", command=lambda: exportar_a_gif(clave, parametros, figura.nombre)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(botones_frame, text="Exportar Texto", command=lambda: self.exportar_resultados(resultado_texto)).pack(side=tk.LEFT, padx=5)
+
+    # Triángulo general: se resuelve a partir de cualquier combinación de lados y ángulos
+    def calcular_triangulo_general(self):
+        self.limpiar_contenido()
+        resultados_frame, figura_frame = self.dividir_frame()
+        ttk.Label(resultados_frame, text="Datos conocidos:").pack(pady=5)
+        caso_var = tk.StringVar(value="LLL")
+        ttk.Combobox(resultados_frame, textvariable=caso_var, state="readonly",
+                     values=list(triangulos.CASOS)).pack()
+        etiquetas = []
+        self.entradas = []
+        for _ in range(3):
+            etiquetas.append(ttk.Label(resultados_frame))
+            etiquetas[-1].pack(pady=5)
+            self.entradas.append(ttk.Entry(resultados_frame))
+            self.entradas[-1].pack()
+
+        def actualizar_etiquetas(_evento=None):
+            for etiqueta, nombre in zip(etiquetas, triangulos.CASOS[caso_var.get()]):
+                unidad = "cm" if nombre.islower() else "°"
+                etiqueta.config(text=f"{'Lado' if nombre.islower() else 'Ángulo'} {nombre} ({unidad}):")
+
+        caso_var.trace_add("write", lambda *_: actualizar_etiquetas())
+        actualizar_etiquetas()
+        ttk.Button(resultados_frame, text="Calcular",
+                   command=lambda: self.mostrar_resultado_triangulo_general(caso_var.get(), resultados_frame, figura_frame)).pack(pady=10)
+        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_2d).pack(pady=5)
 
+    def mostrar_resultado_triangulo_general(self, caso, resultados_frame, figura_frame):
+        try:
+            datos = {nombre: float(entrada.get()) for nombre, entrada in zip(triangulos.CASOS[caso], self.entradas)}
+            triangulo = Triangulo(caso, **datos)
+        except ValueError:
+            messagebox.showerror("Error", "Los datos no forman un triángulo válido.")
+            return
+        resultado_texto = triangulo.texto()
+        if triangulo.alternativa is not None:
+            resultado_texto = (f"Caso ambiguo: hay dos triángulos posibles.\n\nSolución 1:\n{resultado_texto}"
+                               f"\n\nSolución 2:\n{triangulo.alternativa.texto()}")
+        # El caso va en la clave: el historial solo guarda parámetros numéricos
+        self.historial.registrar(f"triangulo_{caso.lower()}", datos, resultado_texto)
+
+        for widget in resultados_frame.winfo_children(): widget.destroy()
+        ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
+        ttk.Label(resultados_frame, text=resultado_texto, justify="left").pack(pady=5)
+        botones_frame = ttk.Frame(resultados_frame)
+        botones_frame.pack(pady=10)
+        ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_triangulo_general).pack(side=tk.LEFT, padx=5)
+        ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_2d).pack(side=tk.LEFT, padx=5)
+        fig = self.dibujar_triangulo_general(figura_frame, triangulo)
+        contorno = geometria.contorno_triangulo_lados(triangulo.a, triangulo.b, triangulo.c)
+        ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig, contorno)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(botones_frame, text="Exportar SVG", command=lambda: exportar_a_svg(contorno, "Triángulo")).pack(side=tk.LEFT, padx=5)
+        ttk.Button(botones_frame, text="Exportar Texto", command=lambda: self.exportar_resultados(resultado_texto)).pack(side=tk.LEFT, padx=5)
+
+    #dibujos figuras 2d
     def dibujar_triangulo(self, frame, base, altura):
         fig, ax = plt.subplots(figsize=(4, 4))
         ax.plot([0, base, 0, 0], [0, 0, altura, 0], marker="o")
@@ -295,39 +753,36 @@ class App:
         return fig
 
 
-    def calcular_cuadrilatero(self):
-        for widget in self.main_frame.winfo_children(): widget.destroy()
-        resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Lado 1:").pack(pady=5)
-        self.lado1_entry = ttk.Entry(resultados_frame)
-        self.lado1_entry.pack()
-        ttk.Label(resultados_frame, text="Lado 2:").pack(pady=5)
-        self.lado2_entry = ttk.Entry(resultados_frame)
-        self.lado2_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_cuadrilatero(resultados_frame, figura_frame)).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
-
-    def mostrar_resultado_cuadrilatero(self, resultados_frame, figura_frame):
-        try:
-            lado1 = float(self.lado1_entry.get())
-            lado2 = float(self.lado2_entry.get())
-            if lado1 <= 0 or lado2 <= 0:
-                messagebox.showerror("Error", "Los valores deben ser mayores que cero.")
-                return
-            area = lado1 * lado2
-            perimetro = 2 * (lado1 + lado2)
-            resultado_texto = f"Área: {area:.2f} cm²\nPerímetro: {perimetro:.2f} cm"
-            for widget in resultados_frame.winfo_children(): widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_cuadrilatero).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_2d).pack(side=tk.LEFT, padx=5)
-            fig = self.dibujar_cuadrilatero(figura_frame, lado1, lado2)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-        except ValueError:
-            messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
+    def dibujar_triangulo_general(self, frame, triangulo):
+        fig, ax = plt.subplots(figsize=(4, 4))
+        triangulos_a_dibujar = [triangulo] + ([triangulo.alternativa] if triangulo.alternativa else [])
+        for t, estilo in zip(triangulos_a_dibujar, ["-", "--"]):
+            puntos = geometria.contorno_triangulo_lados(t.a, t.b, t.c)
+            ax.plot(*np.vstack([puntos, puntos[:1]]).T, estilo, marker="o")
+        ax.set_title(f"Triángulo {triangulo.tipo} {triangulo.tipo_angulos.lower()}")
+        ax.grid(True)
+        ax.axis("equal")
+        canvas = FigureCanvasTkAgg(fig, master=frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack()
+        return fig
+
+    def dibujar_personalizada(self, frame, contorno, titulo):
+        fig, ax = plt.subplots(figsize=(4, 4))
+        if contorno is None:
+            ax.text(0.5, 0.5, "Sin geometría", ha="center", va="center", transform=ax.transAxes)
+            ax.set_axis_off()
+        else:
+            ax.plot(*np.vstack([contorno, contorno[:1]]).T)
+            ax.set_xlabel("X (cm)")
+            ax.set_ylabel("Y (cm)")
+            ax.grid(True)
+            ax.axis("equal")
+        ax.set_title(titulo)
+        canvas = FigureCanvasTkAgg(fig, master=frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack()
+        return fig
 
     def dibujar_cuadrilatero(self, frame, lado1, lado2):
         fig, ax = plt.subplots(figsize=(4, 4))
@@ -343,36 +798,6 @@ class App:
         return fig
 
 
-    def calcular_circulo(self):
-        for widget in self.main_frame.winfo_children(): widget.destroy()
-        resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Radio:").pack(pady=5)
-        self.radio_entry = ttk.Entry(resultados_frame)
-        self.radio_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_circulo(resultados_frame, figura_frame)).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_2d).pack(pady=5)
-
-    def mostrar_resultado_circulo(self, resultados_frame, figura_frame):
-        try:
-            radio = float(self.radio_entry.get())
-            if radio <= 0:
-                messagebox.showerror("Error", "El radio debe ser mayor que cero.")
-                return
-            area = math.pi * radio ** 2
-            perimetro = 2 * math.pi * radio
-            resultado_texto = f"Área: {area:.2f} cm²\nPerímetro: {perimetro:.2f} cm"
-            for widget in resultados_frame.winfo_children(): widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_circulo).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_2d).pack(side=tk.LEFT, padx=5)
-            fig = self.dibujar_circulo(figura_frame, radio)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-        except ValueError:
-            messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
-
     def dibujar_circulo(self, frame, radio):
         fig, ax = plt.subplots(figsize=(4, 4))
         circulo = plt.Circle((0, 0), radio, color='b', fill=False)
@@ -388,52 +813,6 @@ class App:
         return fig
 
 
-    def calcular_poligono_regular(self):
-        self.limpiar_contenido()
-        resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Número de lados:").pack(pady=5)
-        self.n_lados_entry = ttk.Entry(resultados_frame)
-        self.n_lados_entry.pack()
-        ttk.Label(resultados_frame, text="Longitud del lado:").pack(pady=5)
-        self.longitud_lado_entry = ttk.Entry(resultados_frame)
-        self.longitud_lado_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_poligono_regular(resultados_frame, figura_frame)).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_2d).pack(pady=5)
-
-    def calcular_datos_poligono_regular(self, n_lados, longitud_lado):
-        area = (n_lados * longitud_lado ** 2) / (4 * math.tan(math.pi / n_lados))
-        perimetro = n_lados * longitud_lado
-        return longitud_lado, area, perimetro
-
-    def mostrar_resultado_poligono_regular(self, resultados_frame, figura_frame):
-        try:
-            n_lados = int(self.n_lados_entry.get())
-            longitud_lado = float(self.longitud_lado_entry.get())
-            if n_lados < 3:
-                messagebox.showerror("Error", "El número de lados debe ser al menos 3.")
-                return
-            if longitud_lado <= 0:
-                messagebox.showerror("Error", "La longitud del lado debe ser mayor que cero.")
-                return
-
-            longitud_cm, area, perimetro = self.calcular_datos_poligono_regular(n_lados, longitud_lado)
-            resultado_texto = (
-                f"Área: {area:.2f} cm²\n"
-                f"Perímetro: {perimetro:.2f} cm"
-            )
-            for widget in resultados_frame.winfo_children(): widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto, justify="left").pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_2d).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_poligono_regular).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-            self.dibujar_poligono_regular(figura_frame, n_lados, longitud_cm)
-
-        except ValueError:
-            messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
-
     def dibujar_poligono_regular(self, frame, n_lados, longitud_lado):
         angulo = 2 * np.pi / n_lados
         x = [longitud_lado * np.cos(i * angulo) for i in range(n_lados)]
@@ -449,43 +828,9 @@ class App:
         canvas = FigureCanvasTkAgg(fig, master=frame)
         canvas.draw()
         canvas.get_tk_widget().pack()
+        return fig
 
 
-    def calcular_elipse(self):
-        for widget in self.main_frame.winfo_children(): widget.destroy()
-        resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Semieje Mayor:").pack(pady=5)
-        self.semieje_mayor_entry = ttk.Entry(resultados_frame)
-        self.semieje_mayor_entry.pack()
-        ttk.Label(resultados_frame, text="Semieje Menor:").pack(pady=5)
-        self.semieje_menor_entry = ttk.Entry(resultados_frame)
-        self.semieje_menor_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_elipse(resultados_frame, figura_frame)).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_2d).pack(pady=5)
-
-    def mostrar_resultado_elipse(self, resultados_frame, figura_frame):
-        try:
-            a = float(self.semieje_mayor_entry.get())
-            b = float(self.semieje_menor_entry.get())
-            if a <= 0 or b <= 0:
-                messagebox.showerror("Error", "Los valores deben ser mayores que cero.")
-                return
-            area = math.pi * a * b
-            # Aproximación para el perímetro de una elipse (fórmula de Ramanujan)
-            perimetro = math.pi * (3 * (a + b) - math.sqrt((3 * a + b) * (a + 3 * b)))
-            resultado_texto = f"Área: {area:.2f} cm²\nPerímetro aproximado: {perimetro:.2f} cm"
-            for widget in resultados_frame.winfo_children(): widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_elipse).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
-            fig = self.dibujar_elipse(figura_frame, a, b)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-        except ValueError:
-            messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
-
     def dibujar_elipse(self, frame, a, b):
         theta = np.linspace(0, 2 * np.pi, 100)
         x = a * np.cos(theta)
@@ -503,48 +848,6 @@ class App:
         return fig
 
 
-    def calcular_trapecio(self):
-        for widget in self.main_frame.winfo_children(): widget.destroy()
-        resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Base Mayor:").pack(pady=5)
-        self.base_mayor_entry = ttk.Entry(resultados_frame)
-        self.base_mayor_entry.pack()
-        ttk.Label(resultados_frame, text="Base Menor:").pack(pady=5)
-        self.base_menor_entry = ttk.Entry(resultados_frame)
-        self.base_menor_entry.pack()
-        ttk.Label(resultados_frame, text="Altura:").pack(pady=5)
-        self.altura_entry = ttk.Entry(resultados_frame)
-        self.altura_entry.pack()
-        ttk.Label(resultados_frame, text="Lado No Paralelo:").pack(pady=5)
-        self.lado_no_paralelo_entry = ttk.Entry(resultados_frame)
-        self.lado_no_paralelo_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_trapecio(resultados_frame, figura_frame)).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_2d).pack(pady=5)
-
-    def mostrar_resultado_trapecio(self, resultados_frame, figura_frame):
-        try:
-            base_mayor = float(self.base_mayor_entry.get())
-            base_menor = float(self.base_menor_entry.get())
-            altura = float(self.altura_entry.get())
-            lado_no_paralelo = float(self.lado_no_paralelo_entry.get())
-            if base_mayor <= 0 or base_menor <= 0 or altura <= 0 or lado_no_paralelo <= 0:
-                messagebox.showerror("Error", "Los valores deben ser mayores que cero.")
-                return
-            area = ((base_mayor + base_menor) * altura) / 2
-            perimetro = base_mayor + base_menor + 2 * lado_no_paralelo
-            resultado_texto = f"Área: {area:.2f} cm²\nPerímetro: {perimetro:.2f} cm"
-            for widget in resultados_frame.winfo_children(): widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_trapecio).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
-            fig = self.dibujar_trapecio(figura_frame, base_mayor, base_menor, altura)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-        except ValueError:
-            messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
-
     def dibujar_trapecio(self, frame, base_mayor, base_menor, altura):
         x = [0, base_mayor, base_mayor - (base_mayor - base_menor) / 2, (base_mayor - base_menor) / 2, 0]
         y = [0, 0, altura, altura, 0]
@@ -561,41 +864,6 @@ class App:
         return fig
 
 
-    def calcular_rombo(self):
-            for widget in self.main_frame.winfo_children(): widget.destroy()
-            resultados_frame, figura_frame = self.dividir_frame()
-            ttk.Label(resultados_frame, text="Diagonal Mayor:").pack(pady=5)
-            self.diagonal_mayor_entry = ttk.Entry(resultados_frame)
-            self.diagonal_mayor_entry.pack()
-            ttk.Label(resultados_frame, text="Diagonal Menor:").pack(pady=5)
-            self.diagonal_menor_entry = ttk.Entry(resultados_frame)
-            self.diagonal_menor_entry.pack()
-            ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_rombo(resultados_frame, figura_frame)).pack(pady=10)
-            ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_2d).pack(pady=5)
-
-    def mostrar_resultado_rombo(self, resultados_frame, figura_frame):
-            try:
-                d_mayor = float(self.diagonal_mayor_entry.get())
-                d_menor = float(self.diagonal_menor_entry.get())
-                if d_mayor <= 0 or d_menor <= 0:
-                    messagebox.showerror("Error", "Los valores deben ser mayores que cero.")
-                    return
-                area = (d_mayor * d_menor) / 2
-                lado = math.sqrt((d_mayor / 2) ** 2 + (d_menor / 2) ** 2)
-                perimetro = 4 * lado
-                resultado_texto = f"Área: {area:.2f} cm²\nPerímetro: {perimetro:.2f} cm"
-                for widget in resultados_frame.winfo_children(): widget.destroy()
-                ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-                ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-                botones_frame = ttk.Frame(resultados_frame)
-                botones_frame.pack(pady=10)
-                ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_rombo).pack(side=tk.LEFT, padx=5)
-                ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
-                fig = self.dibujar_rombo(figura_frame, d_mayor, d_menor)
-                ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-            except ValueError:
-                messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
-
     def dibujar_rombo(self, frame, d_mayor, d_menor):
             x = [0, d_mayor / 2, 0, -d_mayor / 2, 0]
             y = [d_menor / 2, 0, -d_menor / 2, 0, d_menor / 2]
@@ -612,40 +880,6 @@ class App:
             return fig
 
 
-    def calcular_sector_circular(self):
-            for widget in self.main_frame.winfo_children(): widget.destroy()
-            resultados_frame, figura_frame = self.dividir_frame()
-            ttk.Label(resultados_frame, text="Radio:").pack(pady=5)
-            self.radio_entry = ttk.Entry(resultados_frame)
-            self.radio_entry.pack()
-            ttk.Label(resultados_frame, text="Ángulo Central (grados):").pack(pady=5)
-            self.angulo_entry = ttk.Entry(resultados_frame)
-            self.angulo_entry.pack()
-            ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_sector(resultados_frame, figura_frame)).pack(pady=10)
-            ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_2d).pack(pady=5)
-
-    def mostrar_resultado_sector(self, resultados_frame, figura_frame):
-            try:
-                radio = float(self.radio_entry.get())
-                angulo = float(self.angulo_entry.get())
-                if radio <= 0 or angulo <= 0 or angulo > 360:
-                    messagebox.showerror("Error", "El radio debe ser mayor que cero y el ángulo entre 0 y 360 grados.")
-                    return
-                area = (math.pi * radio ** 2 * angulo) / 360
-                longitud_arco = (2 * math.pi * radio * angulo) / 360
-                resultado_texto = f"Área: {area:.2f} cm²\nLongitud del Arco: {longitud_arco:.2f} cm"
-                for widget in resultados_frame.winfo_children(): widget.destroy()
-                ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-                ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-                botones_frame = ttk.Frame(resultados_frame)
-                botones_frame.pack(pady=10)
-                ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_sector_circular).pack( side=tk.LEFT, padx=5)
-                ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
-                fig = self.dibujar_sector_circular(figura_frame, radio, angulo)
-                ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-            except ValueError:
-                messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
-
     def dibujar_sector_circular(self, frame, radio, angulo):
             theta = np.linspace(0, np.radians(angulo), 100)
             x = radio * np.cos(theta)
@@ -666,49 +900,6 @@ class App:
             return fig
 
 
-    def calcular_paralelogramo(self):
-            for widget in self.main_frame.winfo_children(): widget.destroy()
-            resultados_frame, figura_frame = self.dividir_frame()
-            ttk.Label(resultados_frame, text="Base:").pack(pady=5)
-            self.base_entry = ttk.Entry(resultados_frame)
-            self.base_entry.pack()
-            ttk.Label(resultados_frame, text="Altura:").pack(pady=5)
-            self.altura_entry = ttk.Entry(resultados_frame)
-            self.altura_entry.pack()
-            ttk.Label(resultados_frame, text="Ángulo (grados):").pack(pady=5)
-            self.angulo_entry = ttk.Entry(resultados_frame)
-            self.angulo_entry.pack()
-            ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_paralelogramo(resultados_frame, figura_frame)).pack(pady=10)
-            ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_2d).pack(pady=5)
-
-    def mostrar_resultado_paralelogramo(self, resultados_frame, figura_frame):
-            try:
-                base = float(self.base_entry.get())
-                altura = float(self.altura_entry.get())
-                angulo = float(self.angulo_entry.get())
-                if base <= 0 or altura <= 0 or angulo <= 0 or angulo >= 180:
-                    messagebox.showerror("Error","La base y la altura deben ser mayores que cero y el ángulo debe estar entre 0 y 180 grados.")
-                    return
-                area = base * altura
-                angulo_rad = math.radians(angulo)
-                lado_lateral = altura / math.sin(angulo_rad)
-                perimetro = 2 * (base + lado_lateral)
-                resultado_texto = f"Área: {area:.2f} cm²\nPerímetro: {perimetro:.2f} cm"
-                for widget in resultados_frame.winfo_children():
-                    widget.destroy()
-                ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-                ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-                botones_frame = ttk.Frame(resultados_frame)
-                botones_frame.pack(pady=10)
-                ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_paralelogramo).pack(
-                    side=tk.LEFT, padx=5)
-                ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT,
-                                                                                                     padx=5)
-                fig = self.dibujar_paralelogramo(figura_frame, base, altura, angulo)
-                ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-            except ValueError:
-                messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
-
     def dibujar_paralelogramo(self, frame, base, altura, angulo):
             angulo_rad = math.radians(angulo)
             x1, y1 = 0, 0
@@ -727,39 +918,7 @@ class App:
             canvas.get_tk_widget().pack()
             return fig
 
-    #calculos figuras 3d
-    def calcular_cubo(self):
-        for widget in self.main_frame.winfo_children(): widget.destroy()
-        resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Lado:").pack(pady=5)
-        self.lado_entry = ttk.Entry(resultados_frame)
-        self.lado_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_cubo(resultados_frame, figura_frame)).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
-
-    def mostrar_resultado_cubo(self, resultados_frame, figura_frame):
-        try:
-            lado = float(self.lado_entry.get())
-            if lado <= 0:
-                messagebox.showerror("Error", "El lado debe ser mayor que cero.")
-                return
-            area = 6 * (lado ** 2)
-            volumen = lado ** 3
-            resultado_texto = (f"Lado: {lado:.2f} cm\n"
-                               f"Área superficial: {area:.2f} cm²\n"
-                               f"Volumen: {volumen:.2f} cm³")
-            for widget in resultados_frame.winfo_children(): widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_cubo).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
-            fig = self.dibujar_cubo(figura_frame, lado)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-        except ValueError:
-            messagebox.showerror("Error", "Ingresa un valor numérico válido.")
-
+    #dibujos figuras 3d
     def dibujar_cubo(self, frame, lado):
         fig = plt.figure(figsize=(4, 4))
         ax = fig.add_subplot(111, projection='3d')
@@ -790,38 +949,6 @@ class App:
         return fig
 
 
-    def calcular_esfera(self):
-        for widget in self.main_frame.winfo_children(): widget.destroy()
-        resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Radio:").pack(pady=5)
-        self.radio_entry = ttk.Entry(resultados_frame)
-        self.radio_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_esfera(resultados_frame, figura_frame)).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
-
-    def mostrar_resultado_esfera(self, resultados_frame, figura_frame):
-        try:
-            radio = float(self.radio_entry.get())
-            if radio <= 0:
-                messagebox.showerror("Error", "El radio debe ser mayor que cero.")
-                return
-            area = 4 * math.pi * (radio ** 2)
-            volumen = (4 / 3) * math.pi * (radio ** 3)
-            resultado_texto = (f"Radio: {radio:.2f} cm\n"
-                               f"Área superficial: {area:.2f} cm²\n"
-                               f"Volumen: {volumen:.2f} cm³")
-            for widget in resultados_frame.winfo_children(): widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_esfera).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
-            fig = self.dibujar_esfera(figura_frame, radio)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-        except ValueError:
-            messagebox.showerror("Error", "Ingresa un valor numérico válido.")
-
     def dibujar_esfera(self, frame, radio):
         fig = plt.figure(figsize=(4, 4))
         ax = fig.add_subplot(111, projection='3d')
@@ -844,46 +971,6 @@ class App:
         return fig
 
 
-    def calcular_piramide(self):
-        for widget in self.main_frame.winfo_children(): widget.destroy()
-        resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Lado de la base:").pack(pady=5)
-        self.lado_base_entry = ttk.Entry(resultados_frame)
-        self.lado_base_entry.pack()
-        ttk.Label(resultados_frame, text="Altura:").pack(pady=5)
-        self.altura_entry = ttk.Entry(resultados_frame)
-        self.altura_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_piramide(resultados_frame, figura_frame)).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
-
-    def mostrar_resultado_piramide(self, resultados_frame, figura_frame):
-        try:
-            lado_base = float(self.lado_base_entry.get())
-            altura = float(self.altura_entry.get())
-            if lado_base <= 0 or altura <= 0:
-                messagebox.showerror("Error", "Los valores deben ser mayores que cero.")
-                return
-            area_base = lado_base ** 2
-            apotema = math.sqrt((lado_base / 2) ** 2 + altura ** 2)
-            area_lateral = 4 * (0.5 * lado_base * apotema)
-            area_total = area_base + area_lateral
-            volumen = (area_base * altura) / 3
-            resultado_texto = (f"Lado base: {lado_base:.2f} cm\n"
-                               f"Altura: {altura:.2f} cm\n"
-                               f"Área total: {area_total:.2f} cm²\n"
-                               f"Volumen: {volumen:.2f} cm³")
-            for widget in resultados_frame.winfo_children(): widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_piramide).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
-            fig = self.dibujar_piramide(figura_frame, lado_base, altura)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-        except ValueError:
-            messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
-
     def dibujar_piramide(self, frame, lado_base, altura):
         fig = plt.figure(figsize=(4, 4))
         ax = fig.add_subplot(111, projection='3d')
@@ -915,48 +1002,6 @@ class App:
         return fig
 
 
-    def calcular_cono(self):
-        for widget in self.main_frame.winfo_children(): widget.destroy()
-        resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Radio de la base:").pack(pady=5)
-        self.radio_entry = ttk.Entry(resultados_frame)
-        self.radio_entry.pack()
-        ttk.Label(resultados_frame, text="Altura:").pack(pady=5)
-        self.altura_entry = ttk.Entry(resultados_frame)
-        self.altura_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_cono(resultados_frame, figura_frame)).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
-
-    def mostrar_resultado_cono(self, resultados_frame, figura_frame):
-        try:
-            radio = float(self.radio_entry.get())
-            altura = float(self.altura_entry.get())
-            if radio <= 0 or altura <= 0:
-                messagebox.showerror("Error", "Los valores deben ser mayores que cero.")
-                return
-            generatriz = math.sqrt(radio**2 + altura**2)
-            area_base = math.pi * radio**2
-            area_lateral = math.pi * radio * generatriz
-            area_total = area_base + area_lateral
-            volumen = (1/3) * area_base * altura
-            resultado_texto = (f"Radio: {radio:.2f} cm\n"
-                               f"Altura: {altura:.2f} cm\n"
-                               f"Generatriz: {generatriz:.2f} cm\n"
-                               f"Área total: {area_total:.2f} cm²\n"
-                               f"Volumen: {volumen:.2f} cm³")
-            for widget in resultados_frame.winfo_children():
-                widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_cono).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
-            fig = self.dibujar_cono(figura_frame, radio, altura)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-        except ValueError:
-            messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
-
     def dibujar_cono(self, frame, radio, altura):
         fig = plt.figure(figsize=(4, 4))
         ax = fig.add_subplot(111, projection='3d')
@@ -978,53 +1023,6 @@ class App:
         return fig
 
 
-    def calcular_prisma(self):
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
-        resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Número de lados de la base:").pack(pady=5)
-        self.n_lados_entry = ttk.Entry(resultados_frame)
-        self.n_lados_entry.pack()
-        ttk.Label(resultados_frame, text="Longitud de cada lado:").pack(pady=5)
-        self.longitud_entry = ttk.Entry(resultados_frame)
-        self.longitud_entry.pack()
-        ttk.Label(resultados_frame, text="Altura del prisma:").pack(pady=5)
-        self.altura_entry = ttk.Entry(resultados_frame)
-        self.altura_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_prisma(resultados_frame, figura_frame)).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
-
-    def mostrar_resultado_prisma(self, resultados_frame, figura_frame):
-        try:
-            n_lados = int(self.n_lados_entry.get())
-            longitud = float(self.longitud_entry.get())
-            altura = float(self.altura_entry.get())
-            if n_lados < 3 or longitud <= 0 or altura <= 0:
-                messagebox.showerror("Error", "El número de lados debe ser >= 3 y los valores positivos.")
-                return
-            area_base = (n_lados * (longitud ** 2)) / (4 * math.tan(math.pi/n_lados))
-            perimetro_base = n_lados * longitud
-            area_lateral = perimetro_base * altura
-            area_total = 2 * area_base + area_lateral
-            volumen = area_base * altura
-            resultado_texto = (f"Número de lados: {n_lados}\n"
-                               f"Longitud: {longitud:.2f} cm\n"
-                               f"Altura: {altura:.2f} cm\n"
-                               f"Área total: {area_total:.2f} cm²\n"
-                               f"Volumen: {volumen:.2f} cm³")
-            for widget in resultados_frame.winfo_children():
-                widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_prisma).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
-            fig = self.dibujar_prisma(figura_frame, n_lados, longitud, altura)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-        except ValueError:
-            messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
-
     def dibujar_prisma(self, frame, n_lados, longitud, altura):
         fig = plt.figure(figsize=(4, 4))
         ax = fig.add_subplot(111, projection='3d')
@@ -1047,47 +1045,6 @@ class App:
         return fig
 
 
-    def calcular_cilindro(self):
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
-        resultados_frame, figura_frame = self.dividir_frame()
-        ttk.Label(resultados_frame, text="Radio de la base:").pack(pady=5)
-        self.radio_entry = ttk.Entry(resultados_frame)
-        self.radio_entry.pack()
-        ttk.Label(resultados_frame, text="Altura:").pack(pady=5)
-        self.altura_entry = ttk.Entry(resultados_frame)
-        self.altura_entry.pack()
-        ttk.Button(resultados_frame, text="Calcular", command=lambda: self.mostrar_resultado_cilindro(resultados_frame, figura_frame) ).pack(pady=10)
-        ttk.Button(resultados_frame, text="Regresar", command=self.mostrar_menu_principal).pack(pady=5)
-
-    def mostrar_resultado_cilindro(self, resultados_frame, figura_frame):
-        try:
-            radio = float(self.radio_entry.get())
-            altura = float(self.altura_entry.get())
-            if radio <= 0 or altura <= 0:
-                messagebox.showerror("Error", "Los valores deben ser mayores que cero.")
-                return
-            area_base = math.pi * radio**2
-            area_lateral = 2 * math.pi * radio * altura
-            area_total = 2 * area_base + area_lateral
-            volumen = area_base * altura
-            resultado_texto = (f"Radio: {radio:.2f} cm\n"
-                               f"Altura: {altura:.2f} cm\n"
-                               f"Área total: {area_total:.2f} cm²\n"
-                               f"Volumen: {volumen:.2f} cm³")
-            for widget in resultados_frame.winfo_children():
-                widget.destroy()
-            ttk.Label(resultados_frame, text="Resultados:", font=("Arial", 12)).pack(pady=5)
-            ttk.Label(resultados_frame, text=resultado_texto).pack(pady=5)
-            botones_frame = ttk.Frame(resultados_frame)
-            botones_frame.pack(pady=10)
-            ttk.Button(botones_frame, text="Volver a Calcular", command=self.calcular_cilindro).pack(side=tk.LEFT, padx=5)
-            ttk.Button(botones_frame, text="Regresar", command=self.mostrar_menu_principal).pack(side=tk.LEFT, padx=5)
-            fig = self.dibujar_cilindro(figura_frame, radio, altura)
-            ttk.Button(botones_frame, text="Exportar PDF", command=lambda: exportar_a_pdf(resultado_texto, fig)).pack(side=tk.LEFT, padx=5)
-        except ValueError:
-            messagebox.showerror("Error", "Ingresa valores numéricos válidos.")
-
     def dibujar_cilindro(self, frame, radio, altura):
         fig = plt.figure(figsize=(4, 4))
         ax = fig.add_subplot(111, projection='3d')
@@ -1110,8 +1067,8 @@ class App:
         return fig
 
 
-
 if __name__ == "__main__":
     root = tk.Tk()
     app = App(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+    app.historial.cerrar()
\ No newline at end of file
@@ -0,0 +1,311 @@
+"""Lenguaje de fórmulas seguro para figuras personalizadas.
+
+Una fórmula es una o varias asignaciones, una por línea o separadas por `;`:
+
+    area = pi * a * b
+    perimetro = pi * (3 * (a + b) - sqrt((3 * a + b) * (a + 3 * b)))
+    dentro = (x / a) ** 2 + (y / b) ** 2 <= 1
+
+El texto se interpreta una sola vez con `ast`, se valida contra una lista
+blanca (números, operadores aritméticos y de comparación, `and`/`or`/`not` y
+las funciones de `FUNCIONES`; nada de atributos, índices ni llamadas
+arbitrarias) y se compila a un objeto invocable que opera con arreglos de
+NumPy. Las fórmulas compiladas se guardan en una caché por el hash del árbol,
+así que la misma fórmula no se vuelve a compilar.
+
+Los nombres que empiezan con `_` son intermedios y no se muestran. `dentro`,
+si se define, es la región de la figura como desigualdad en `x` e `y`: con
+ella se obtiene el contorno (ver `geometria.contorno_radial`).
+"""
+import ast
+import hashlib
+import json
+import os
+
+import numpy as np
+
+import geometria
+import registro
+
+# Misma carpeta de datos que el historial (ver `historial.DIRECTORIO_DATOS`)
+DIRECTORIO_DATOS = os.environ.get("SISTEMA_GEOMETRICO_DATOS") or \
+    os.path.join(os.path.expanduser("~"), ".sistema_geometrico")
+RUTA_POR_DEFECTO = os.path.join(DIRECTORIO_DATOS, "figuras.json")
+
+FUNCIONES = {
+    "sqrt": np.sqrt, "exp": np.exp, "log": np.log, "log10": np.log10, "abs": np.abs,
+    "sin": np.sin, "cos": np.cos, "tan": np.tan, "asin": np.arcsin, "acos": np.arccos,
+    "atan": np.arctan, "atan2": np.arctan2, "hypot": np.hypot,
+    "radians": np.radians, "degrees": np.degrees,
+    "min": np.minimum, "max": np.maximum, "where": np.where,
+}
+# Número de argumentos de cada función; las que no aparecen reciben uno
+ARGUMENTOS = {"atan2": 2, "hypot": 2, "min": 2, "max": 2, "where": 3}
+CONSTANTES = {"pi": np.pi, "e": np.e, "tau": 2 * np.pi}
+COORDENADAS = ("x", "y", "z")
+REGION = "dentro"
+
+_OPERADORES = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv,
+               ast.UAdd, ast.USub, ast.Not, ast.And, ast.Or,
+               ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq)
+_NODOS = (ast.Module, ast.Assign, ast.Name, ast.Load, ast.Store, ast.Constant, ast.BinOp,
+          ast.UnaryOp, ast.BoolOp, ast.Compare, ast.Call) + _OPERADORES
+
+_CACHE = {}
+
+
+class ErrorFormula(ValueError):
+    pass
+
+
+class _Vectorizar(ast.NodeTransformer):
+    """Reescribe la lógica de Python en operaciones elemento a elemento."""
+
+    def visit_BoolOp(self, nodo):
+        self.generic_visit(nodo)
+        operador = ast.BitAnd() if isinstance(nodo.op, ast.And) else ast.BitOr()
+        resultado = nodo.values[0]
+        for valor in nodo.values[1:]:
+            resultado = ast.BinOp(resultado, operador, valor)
+        return resultado
+
+    def visit_Compare(self, nodo):
+        # a < b < c  ->  (a < b) & (b < c)
+        self.generic_visit(nodo)
+        izquierda, partes = nodo.left, []
+        for operador, derecha in zip(nodo.ops, nodo.comparators):
+            partes.append(ast.Compare(izquierda, [operador], [derecha]))
+            izquierda = derecha
+        resultado = partes[0]
+        for parte in partes[1:]:
+            resultado = ast.BinOp(resultado, ast.BitAnd(), parte)
+        return resultado
+
+    def visit_BinOp(self, nodo):
+        # Potencias con NumPy: con flotantes de Python 9. ** 9. ** 9. lanzaría OverflowError
+        self.generic_visit(nodo)
+        if isinstance(nodo.op, ast.Pow):
+            return ast.Call(ast.Name("__potencia", ast.Load()), [nodo.left, nodo.right], [])
+        return nodo
+
+    def visit_UnaryOp(self, nodo):
+        self.generic_visit(nodo)
+        if isinstance(nodo.op, ast.Not):
+            return ast.Call(ast.Name("__no", ast.Load()), [nodo.operand], [])
+        return nodo
+
+    def visit_Constant(self, nodo):
+        # Todo en punto flotante: evita potencias enteras gigantescas (9 ** 9 ** 9)
+        return ast.Constant(float(nodo.value))
+
+
+class Formula:
+    """Fórmula compilada: `formula(**parametros)` devuelve un dict de resultados."""
+
+    def __init__(self, texto, codigo, codigo_region, salidas, libres, libres_propiedades):
+        self.texto = texto
+        # Código de las propiedades y, aparte, el de todas las asignaciones (con la región)
+        self.codigo = codigo
+        self.codigo_region = codigo_region
+        # Nombres asignados, en orden; los que empiezan con "_" son intermedios
+        self.salidas = salidas
+        # Nombres usados sin asignar (parámetros y coordenadas), en toda la fórmula y en las propiedades
+        self.libres = libres
+        self.libres_propiedades = libres_propiedades
+
+    @property
+    def propiedades(self):
+        return [n for n in self.salidas if not n.startswith("_") and n != REGION]
+
+    @property
+    def tiene_region(self):
+        return REGION in self.salidas
+
+    def evaluar(self, codigo, libres, **valores):
+        espacio = {"__builtins__": {}, "__no": np.logical_not, "__potencia": np.power, **FUNCIONES, **CONSTANTES}
+        espacio.update({n: np.asarray(v, dtype=np.float64) for n, v in valores.items()})
+        faltantes = [n for n in libres if n not in espacio]
+        if faltantes:
+            raise ErrorFormula(f"Faltan valores para: {', '.join(faltantes)}.")
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            exec(codigo, espacio)
+        return espacio
+
+    def __call__(self, **valores):
+        resultados = self.evaluar(self.codigo, self.libres_propiedades, **valores)
+        forma = np.broadcast_shapes(*(np.shape(v) for v in valores.values()))
+        return {n: np.broadcast_to(np.asarray(resultados[n], dtype=np.float64), forma)
+                for n in self.propiedades}
+
+    def region(self, parametros):
+        """Función `dentro(x, y)` con los parámetros fijados."""
+        def dentro(x, y):
+            return np.asarray(self.evaluar(self.codigo_region, self.libres, **parametros, x=x, y=y)[REGION],
+                              dtype=bool)
+        return dentro
+
+
+def compilar(texto):
+    """Interpreta, valida y compila una fórmula (usa la caché si ya se compiló)."""
+    try:
+        lineas = [linea.strip() for linea in texto.replace(";", "\n").splitlines()]
+        arbol = ast.parse("\n".join(lineas), mode="exec")
+    except SyntaxError as e:
+        raise ErrorFormula(f"Error de sintaxis en la línea {e.lineno}: {e.msg}.") from None
+    clave = hashlib.sha256(ast.dump(arbol).encode()).hexdigest()
+    if clave in _CACHE:
+        return _CACHE[clave]
+
+    salidas, libres, libres_propiedades = [], [], []
+    llamadas = {id(nodo.func) for nodo in ast.walk(arbol) if isinstance(nodo, ast.Call)}
+    for nodo in ast.walk(arbol):
+        if not isinstance(nodo, _NODOS):
+            raise ErrorFormula(f"Elemento no permitido: {type(nodo).__name__}.")
+        if isinstance(nodo, ast.Constant) and (isinstance(nodo.value, bool) or
+                                              not isinstance(nodo.value, (int, float))):
+            raise ErrorFormula(f"Solo se permiten constantes numéricas: {nodo.value!r}.")
+        if isinstance(nodo, ast.Name) and nodo.id in FUNCIONES and id(nodo) not in llamadas:
+            raise ErrorFormula(f"'{nodo.id}' es una función y debe llamarse: {nodo.id}(...).")
+        if isinstance(nodo, ast.Call):
+            if not isinstance(nodo.func, ast.Name) or nodo.func.id not in FUNCIONES or nodo.keywords:
+                raise ErrorFormula(f"Función no permitida: {ast.unparse(nodo.func)}.")
+            esperados = ARGUMENTOS.get(nodo.func.id, 1)
+            if len(nodo.args) != esperados:
+                raise ErrorFormula(f"'{nodo.func.id}' recibe {esperados} argumento{'s' if esperados > 1 else ''}: "
+                                   f"{ast.unparse(nodo)}.")
+    for sentencia in arbol.body:
+        if not isinstance(sentencia, ast.Assign) or len(sentencia.targets) != 1 \
+                or not isinstance(sentencia.targets[0], ast.Name):
+            raise ErrorFormula(f"Cada línea debe ser una asignación 'nombre = expresión': {ast.unparse(sentencia)}.")
+        destino = sentencia.targets[0].id
+        for nodo in ast.walk(sentencia.value):
+            if isinstance(nodo, ast.Name) and nodo.id not in FUNCIONES and nodo.id not in CONSTANTES \
+                    and nodo.id not in salidas:
+                if nodo.id not in libres:
+                    libres.append(nodo.id)
+                if destino != REGION and nodo.id not in libres_propiedades:
+                    libres_propiedades.append(nodo.id)
+        if destino in FUNCIONES or destino in CONSTANTES or destino in COORDENADAS or destino in libres:
+            raise ErrorFormula(f"No se puede asignar a '{destino}'.")
+        if destino in salidas:
+            raise ErrorFormula(f"'{destino}' se asigna más de una vez.")
+        salidas.append(destino)
+    if not salidas:
+        raise ErrorFormula("La fórmula no define ningún resultado.")
+    if not [n for n in libres if n not in COORDENADAS]:
+        raise ErrorFormula("La fórmula debe usar al menos un parámetro.")
+    nombres = salidas + libres
+    if any(n.startswith("__") for n in nombres):
+        raise ErrorFormula("Los nombres no pueden empezar con '__'.")
+
+    if REGION in salidas and any(REGION in _nombres(s.value) for s in arbol.body):
+        raise ErrorFormula(f"'{REGION}' no puede usarse dentro de otras expresiones.")
+
+    arbol = ast.fix_missing_locations(_Vectorizar().visit(arbol))
+    nombre_codigo = f"<fórmula {clave[:8]}>"
+    propiedades = ast.Module([s for s in arbol.body if s.targets[0].id != REGION], type_ignores=[])
+    codigo_region = compile(arbol, nombre_codigo, "exec") if REGION in salidas else None
+    formula = Formula(texto, compile(propiedades, nombre_codigo, "exec"), codigo_region, salidas, libres,
+                      libres_propiedades)
+    _CACHE[clave] = formula
+    return formula
+
+
+def _nombres(nodo):
+    return {n.id for n in ast.walk(nodo) if isinstance(n, ast.Name)}
+
+
+class FiguraPersonalizada(registro.Figura):
+    """Figura del registro definida por una fórmula del usuario."""
+
+    def __init__(self, clave, nombre, dimension, parametros, texto):
+        if not parametros:
+            raise ErrorFormula("La figura debe tener al menos un parámetro.")
+        formula = compilar(texto)
+        desconocidos = [n for n in formula.libres if n not in parametros and n not in COORDENADAS]
+        if desconocidos:
+            raise ErrorFormula(f"Nombres no declarados como parámetros: {', '.join(desconocidos)}.")
+        coordenadas = [n for n in formula.libres_propiedades if n in COORDENADAS]
+        if coordenadas:
+            raise ErrorFormula(f"Las coordenadas solo pueden usarse en '{REGION}': {', '.join(coordenadas)}.")
+        if formula.tiene_region and dimension != "2D":
+            raise ErrorFormula("La región 'dentro' solo se admite en figuras 2D.")
+        if not formula.propiedades:
+            raise ErrorFormula("La fórmula no define ninguna propiedad visible.")
+        propiedades = [(n, n.replace("_", " ").capitalize(), _unidad(n)) for n in formula.propiedades]
+        contorno = (self._contorno_region, list(parametros)) if formula.tiene_region else (None, [])
+        super().__init__(
+            clave, nombre, dimension,
+            [registro.Parametro(n, n.replace("_", " ").capitalize()) for n in parametros],
+            formula, propiedades, contorno, ("dibujar_personalizada", list(parametros)),
+            resumen=[(n, n.replace("_", " ").capitalize()) for n in parametros],
+        )
+        self.texto = texto
+
+    def _contorno_region(self, segmentos=geometria.SEGMENTOS_CURVA, **parametros):
+        radio = max([abs(float(v)) for v in parametros.values()] + [1.0])
+        return geometria.contorno_radial(self.formula.region(parametros), radio, segmentos)
+
+    def contorno(self, parametros, segmentos=None):
+        # La región puede no contener al origen; entonces la figura se muestra sin geometría
+        try:
+            return super().contorno(parametros, segmentos)
+        except ValueError:
+            return None
+
+    def argumentos_dibujo(self, parametros):
+        contorno = self.contorno(parametros) if self.tiene_contorno else None
+        return [contorno, self.nombre]
+
+    def definicion(self):
+        return {"clave": self.clave, "nombre": self.nombre, "dimension": self.dimension,
+                "parametros": self.nombres_parametros, "formula": self.texto}
+
+
+def _unidad(nombre):
+    if nombre.startswith("area"):
+        return "cm²"
+    if nombre.startswith("volumen"):
+        return "cm³"
+    return "cm"
+
+
+def crear(nombre, dimension, parametros, texto, clave=None):
+    """Crea y registra una figura personalizada; devuelve la figura."""
+    clave = clave or "personalizada_" + "".join(c if c.isalnum() else "_" for c in nombre.lower())
+    if clave in registro.FIGURAS and not isinstance(registro.FIGURAS[clave], FiguraPersonalizada):
+        raise ErrorFormula(f"Ya existe una figura con la clave '{clave}'.")
+    parametros = [p.strip() for p in parametros if p.strip()]
+    for parametro in parametros:
+        if not parametro.isidentifier() or parametro in FUNCIONES or parametro in CONSTANTES \
+                or parametro in COORDENADAS:
+            raise ErrorFormula(f"Nombre de parámetro no válido: '{parametro}'.")
+    return registro.registrar(FiguraPersonalizada(clave, nombre, dimension, parametros, texto))
+
+
+def personalizadas():
+    return [f for f in registro.figuras() if isinstance(f, FiguraPersonalizada)]
+
+
+def guardar(ruta=RUTA_POR_DEFECTO):
+    """Guarda las definiciones de todas las figuras personalizadas registradas."""
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    temporal = ruta + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump([figura.definicion() for figura in personalizadas()], f, indent=2, ensure_ascii=False)
+    os.replace(temporal, ruta)
+
+
+def cargar(ruta=RUTA_POR_DEFECTO):
+    """Registra las figuras personalizadas guardadas; devuelve las que no se pudieron cargar."""
+    if not os.path.exists(ruta):
+        return []
+    with open(ruta, encoding="utf-8") as f:
+        definiciones = json.load(f)
+    errores = []
+    for d in definiciones:
+        try:
+            crear(d["nombre"], d["dimension"], d["parametros"], d["formula"], d["clave"])
+        except (ErrorFormula, KeyError) as e:
+            errores.append((d.get("nombre"), str(e)))
+    return errores
@@ -0,0 +1,110 @@
+"""Galería de figuras pequeñas en una sola figura de matplotlib.
+
+Los ejes de la cuadrícula se crean una sola vez y se reutilizan en cada página.
+Cada contorno se normaliza a una caja fija, así que el fondo (marcos y ejes)
+no cambia: se dibuja una vez, se guarda con `copy_from_bbox` y al cambiar de
+página solo se restaura ese fondo y se redibujan las líneas con blitting.
+Solo se calculan los contornos de los mosaicos visibles.
+"""
+import numpy as np
+
+import registro
+
+class ElementosLote:
+    """Adapta las columnas de un lote de una sola figura a una secuencia de (figura, parametros)."""
+
+    def __init__(self, figura, columnas, parametros):
+        self.figura = figura
+        self.columnas = columnas
+        self.parametros = parametros
+
+    def __len__(self):
+        return len(self.columnas[self.parametros[0]])
+
+    def __getitem__(self, i):
+        return self.figura, {nombre: float(self.columnas[nombre][i]) for nombre in self.parametros}
+
+
+def normalizar(puntos):
+    """Centra el contorno y lo escala a la caja [-1, 1] conservando la proporción."""
+    puntos = np.asarray(puntos, dtype=float)
+    minimo, maximo = puntos.min(axis=0), puntos.max(axis=0)
+    escala = max((maximo - minimo).max() / 2, 1e-12)
+    cerrado = np.vstack((puntos, puntos[:1]))
+    return (cerrado - (minimo + maximo) / 2) / escala
+
+
+class Galeria:
+    def __init__(self, fig, elementos, filas=4, columnas=4):
+        self.fig = fig
+        self.elementos = elementos
+        self.por_pagina = filas * columnas
+        self.pagina = 0
+        self.fondo = None
+        self.cache = {}
+
+        self.ejes = fig.subplots(filas, columnas, squeeze=False).ravel()
+        self.lineas = []
+        self.titulos = []
+        for ax in self.ejes:
+            ax.set_xlim(-1.1, 1.1)
+            ax.set_ylim(-1.1, 1.1)
+            ax.set_aspect("equal")
+            ax.set_xticks([])
+            ax.set_yticks([])
+            # Los artistas animados no se incluyen en el fondo guardado
+            linea, = ax.plot([], [], color="b", animated=True)
+            titulo = ax.text(0.5, 1.02, "", transform=ax.transAxes, ha="center", va="bottom",
+                             fontsize=7, animated=True)
+            self.lineas.append(linea)
+            self.titulos.append(titulo)
+        fig.canvas.mpl_connect("draw_event", self._al_dibujar)
+
+    @property
+    def num_paginas(self):
+        return max(1, -(-len(self.elementos) // self.por_pagina))
+
+    def _contorno(self, indice):
+        if indice not in self.cache:
+            # Caché acotada a unas pocas páginas
+            if len(self.cache) >= 4 * self.por_pagina:
+                self.cache.pop(next(iter(self.cache)))
+            clave, parametros = self.elementos[indice]
+            figura = registro.obtener(clave)
+            texto = ", ".join(f"{parametros[n]:.3g}" for n in figura.nombres_parametros)
+            self.cache[indice] = (normalizar(figura.contorno(parametros)), f"{figura.nombre} ({texto})")
+        return self.cache[indice]
+
+    def _al_dibujar(self, _evento):
+        # Tras un redibujado completo (p. ej. al cambiar el tamaño) se vuelve a capturar el fondo
+        self.fondo = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._dibujar_mosaicos()
+
+    def _dibujar_mosaicos(self):
+        inicio = self.pagina * self.por_pagina
+        for posicion, (ax, linea, titulo) in enumerate(zip(self.ejes, self.lineas, self.titulos)):
+            indice = inicio + posicion
+            if indice < len(self.elementos):
+                puntos, texto = self._contorno(indice)
+                linea.set_data(puntos[:, 0], puntos[:, 1])
+                titulo.set_text(f"#{indice}  {texto}")
+            else:
+                linea.set_data([], [])
+                titulo.set_text("")
+            ax.draw_artist(linea)
+            ax.draw_artist(titulo)
+
+    def mostrar_pagina(self, pagina):
+        self.pagina = max(0, min(pagina, self.num_paginas - 1))
+        if self.fondo is None:
+            self.fig.canvas.draw()
+            return
+        self.fig.canvas.restore_region(self.fondo)
+        self._dibujar_mosaicos()
+        self.fig.canvas.blit(self.fig.bbox)
+
+    def siguiente(self):
+        self.mostrar_pagina(self.pagina + 1)
+
+    def anterior(self):
+        self.mostrar_pagina(self.pagina - 1)
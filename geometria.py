@@ -0,0 +1,126 @@
+"""Contornos de las figuras 2D como arreglos de vértices (N, 2) en cm.
+
+Estas funciones no dependen de matplotlib: solo generan la geometría para que
+los exportadores vectoriales (y cualquier otro consumidor) la dibujen.
+"""
+import math
+
+import numpy as np
+
+# Número de segmentos usados para aproximar curvas (círculo, elipse, arcos)
+SEGMENTOS_CURVA = 128
+
+
+def contorno_triangulo(base, altura):
+    return np.array([[0.0, 0.0], [base, 0.0], [0.0, altura]])
+
+
+def contorno_triangulo_lados(a, b, c):
+    """Triángulo general a partir de sus lados: `c` sobre el eje x y el vértice C arriba."""
+    coseno_a = (b ** 2 + c ** 2 - a ** 2) / (2 * b * c)
+    seno_a = math.sqrt(max(0.0, 1 - coseno_a ** 2))
+    return np.array([[0.0, 0.0], [c, 0.0], [b * coseno_a, b * seno_a]])
+
+
+def contorno_cuadrilatero(lado1, lado2):
+    return np.array([[0.0, 0.0], [lado1, 0.0], [lado1, lado2], [0.0, lado2]])
+
+
+def contorno_circulo(radio, segmentos=SEGMENTOS_CURVA):
+    return contorno_elipse(radio, radio, segmentos)
+
+
+def contorno_poligono_regular(n_lados, longitud_lado):
+    # Radio circunscrito a partir de la longitud del lado
+    radio = longitud_lado / (2 * math.sin(math.pi / n_lados))
+    theta = 2 * np.pi * np.arange(n_lados) / n_lados
+    return np.column_stack((radio * np.cos(theta), radio * np.sin(theta)))
+
+
+def contorno_elipse(a, b, segmentos=SEGMENTOS_CURVA):
+    theta = np.linspace(0, 2 * np.pi, segmentos, endpoint=False)
+    return np.column_stack((a * np.cos(theta), b * np.sin(theta)))
+
+
+def contorno_trapecio(base_mayor, base_menor, altura):
+    desfase = (base_mayor - base_menor) / 2
+    return np.array([
+        [0.0, 0.0], [base_mayor, 0.0],
+        [base_mayor - desfase, altura], [desfase, altura]
+    ])
+
+
+def contorno_paralelogramo(base, altura, angulo):
+    # El lado lateral forma `angulo` grados con la base y sube `altura`
+    desfase = altura / math.tan(math.radians(angulo))
+    return np.array([
+        [0.0, 0.0], [base, 0.0],
+        [base + desfase, altura], [desfase, altura]
+    ])
+
+
+def contorno_rombo(d_mayor, d_menor):
+    return np.array([
+        [0.0, d_menor / 2], [d_mayor / 2, 0.0],
+        [0.0, -d_menor / 2], [-d_mayor / 2, 0.0]
+    ])
+
+
+def contorno_sector_circular(radio, angulo, segmentos=SEGMENTOS_CURVA):
+    n = max(2, int(math.ceil(segmentos * angulo / 360)) + 1)
+    theta = np.linspace(0, np.radians(angulo), n)
+    arco = np.column_stack((radio * np.cos(theta), radio * np.sin(theta)))
+    if angulo >= 360:
+        return arco[:-1]
+    return np.vstack(([0.0, 0.0], arco))
+
+
+# Perfiles (vista lateral) de las figuras 3D
+def perfil_cubo(lado):
+    return contorno_cuadrilatero(lado, lado)
+
+
+def perfil_esfera(radio, segmentos=SEGMENTOS_CURVA):
+    return contorno_circulo(radio, segmentos)
+
+
+def perfil_piramide(lado_base, altura):
+    return np.array([[-lado_base / 2, 0.0], [lado_base / 2, 0.0], [0.0, altura]])
+
+
+def perfil_prisma(n_lados, longitud, altura):
+    # Ancho de la base vista de lado: diámetro circunscrito del polígono
+    ancho = longitud / math.sin(math.pi / n_lados)
+    return np.array([[-ancho / 2, 0.0], [ancho / 2, 0.0], [ancho / 2, altura], [-ancho / 2, altura]])
+
+
+def perfil_cono(radio, altura):
+    return np.array([[-radio, 0.0], [radio, 0.0], [0.0, altura]])
+
+
+def perfil_cilindro(radio, altura):
+    return np.array([[-radio, 0.0], [radio, 0.0], [radio, altura], [-radio, altura]])
+
+
+def contorno_radial(dentro, radio_inicial=1.0, segmentos=SEGMENTOS_CURVA, iteraciones=50):
+    """Contorno de una región implícita `dentro(x, y)` que contiene al origen.
+
+    Sobre cada rayo desde el origen se busca el borde por bisección (todos los
+    rayos a la vez). Es exacto para regiones estrelladas respecto al origen.
+    """
+    theta = np.linspace(0, 2 * np.pi, segmentos, endpoint=False)
+    cos, sin = np.cos(theta), np.sin(theta)
+    if not np.all(dentro(np.zeros(1), np.zeros(1))):
+        raise ValueError("La región debe contener al origen.")
+    alto = np.full(segmentos, float(radio_inicial))
+    for _ in range(60):
+        fuera = ~np.asarray(dentro(alto * cos, alto * sin), dtype=bool)
+        if fuera.all():
+            break
+        alto = np.where(fuera, alto, 2 * alto)
+    bajo = np.zeros(segmentos)
+    for _ in range(iteraciones):
+        medio = (bajo + alto) / 2
+        adentro = np.asarray(dentro(medio * cos, medio * sin), dtype=bool)
+        bajo, alto = np.where(adentro, medio, bajo), np.where(adentro, alto, medio)
+    return np.column_stack((bajo * cos, bajo * sin))
@@ -0,0 +1,169 @@
+"""Historial de cálculos en una base SQLite local.
+
+Las escrituras se encolan y un hilo en segundo plano las guarda por lotes en una
+sola transacción, con la base en modo WAL para que la interfaz pueda leer
+mientras se escribe. La lectura es paginada por id (paginación por llave), así
+que recorrer el historial sigue siendo rápido con cientos de miles de filas.
+"""
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+# La variable de entorno SISTEMA_GEOMETRICO_DATOS cambia la carpeta de datos (por ejemplo en pruebas)
+DIRECTORIO_DATOS = os.environ.get("SISTEMA_GEOMETRICO_DATOS") or \
+    os.path.join(os.path.expanduser("~"), ".sistema_geometrico")
+RUTA_POR_DEFECTO = os.path.join(DIRECTORIO_DATOS, "historial.db")
+TAM_LOTE = 500
+TAM_PAGINA = 100
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS calculos (
+    id INTEGER PRIMARY KEY,
+    figura TEXT NOT NULL,
+    fecha REAL NOT NULL,
+    parametros TEXT NOT NULL,
+    resultado TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_calculos_figura_id ON calculos(figura, id);
+CREATE INDEX IF NOT EXISTS idx_calculos_fecha ON calculos(fecha);
+CREATE TABLE IF NOT EXISTS parametros (
+    calculo_id INTEGER NOT NULL REFERENCES calculos(id),
+    nombre TEXT NOT NULL,
+    valor REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_parametros_nombre_valor ON parametros(nombre, valor);
+"""
+
+_FIN = object()
+_registro = logging.getLogger(__name__)
+
+
+def _conectar(ruta):
+    conexion = sqlite3.connect(ruta, check_same_thread=False)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.execute("PRAGMA synchronous=NORMAL")
+    return conexion
+
+
+class Historial:
+    def __init__(self, ruta=RUTA_POR_DEFECTO):
+        if ruta != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+        self.ruta = ruta
+        self.conexion = _conectar(ruta)
+        self.conexion.executescript(ESQUEMA)
+        self.conexion.commit()
+
+        self.pendientes = queue.Queue()
+        self.escritor = threading.Thread(target=self._escribir, name="historial", daemon=True)
+        self.escritor.start()
+
+    def registrar(self, figura, parametros, resultado, fecha=None):
+        """Encola un cálculo; se guarda en segundo plano sin bloquear la interfaz.
+
+        Los parámetros se convierten a float aquí, así que un valor no numérico
+        lanza ValueError en el hilo que llama y no en el escritor.
+        """
+        parametros = {str(nombre): float(valor) for nombre, valor in parametros.items()}
+        self.pendientes.put((str(figura), time.time() if fecha is None else float(fecha), parametros, str(resultado)))
+
+    def _escribir(self):
+        # El hilo escritor usa su propia conexión; la de lectura queda para la interfaz
+        conexion = self.conexion if self.ruta == ":memory:" else _conectar(self.ruta)
+        terminado = False
+        while not terminado:
+            lote = [self.pendientes.get()]
+            while len(lote) < TAM_LOTE:
+                try:
+                    lote.append(self.pendientes.get_nowait())
+                except queue.Empty:
+                    break
+            registros = [r for r in lote if r is not _FIN]
+            terminado = len(registros) != len(lote)
+            try:
+                self._guardar(conexion, registros)
+            except Exception:
+                # Un registro defectuoso no debe perder el lote: se reintenta uno por uno y se omite el que falle
+                for registro in registros:
+                    try:
+                        self._guardar(conexion, [registro])
+                    except Exception:
+                        _registro.exception("No se pudo guardar el cálculo de %s en el historial.", registro[0])
+            finally:
+                # Siempre se marcan como atendidos: si no, vaciar() esperaría para siempre
+                for _ in lote:
+                    self.pendientes.task_done()
+        if conexion is not self.conexion:
+            conexion.close()
+
+    @staticmethod
+    def _guardar(conexion, registros):
+        with conexion:
+            for figura, fecha, parametros, resultado in registros:
+                cursor = conexion.execute(
+                    "INSERT INTO calculos (figura, fecha, parametros, resultado) VALUES (?, ?, ?, ?)",
+                    (figura, fecha, json.dumps(parametros), resultado)
+                )
+                conexion.executemany(
+                    "INSERT INTO parametros (calculo_id, nombre, valor) VALUES (?, ?, ?)",
+                    [(cursor.lastrowid, nombre, valor) for nombre, valor in parametros.items()]
+                )
+
+    @property
+    def activo(self):
+        """Indica si el hilo escritor sigue en marcha."""
+        return self.escritor.is_alive()
+
+    def vaciar(self, tiempo=None):
+        """Espera a que todas las escrituras pendientes estén guardadas.
+
+        Con `tiempo` espera como mucho esos segundos; devuelve False si no se
+        vació la cola a tiempo (o si el escritor ya no está en marcha).
+        """
+        with self.pendientes.all_tasks_done:
+            vacia = self.pendientes.all_tasks_done.wait_for(
+                lambda: not self.pendientes.unfinished_tasks or not self.escritor.is_alive(), tiempo)
+        return vacia and not self.pendientes.unfinished_tasks
+
+    def cerrar(self):
+        self.pendientes.put(_FIN)
+        self.escritor.join()
+        self.conexion.close()
+
+    def contar(self, figura=None):
+        if figura is None:
+            return self.conexion.execute("SELECT COUNT(*) FROM calculos").fetchone()[0]
+        return self.conexion.execute("SELECT COUNT(*) FROM calculos WHERE figura = ?", (figura,)).fetchone()[0]
+
+    def figuras(self):
+        return [fila[0] for fila in self.conexion.execute("SELECT DISTINCT figura FROM calculos ORDER BY figura")]
+
+    def pagina(self, figura=None, antes_de=None, limite=TAM_PAGINA):
+        """Devuelve hasta `limite` cálculos, del más reciente al más antiguo, con id menor que `antes_de`."""
+        condiciones, valores = [], []
+        if figura is not None:
+            condiciones.append("figura = ?")
+            valores.append(figura)
+        if antes_de is not None:
+            condiciones.append("id < ?")
+            valores.append(antes_de)
+        where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        filas = self.conexion.execute(
+            f"SELECT id, figura, fecha, parametros, resultado FROM calculos {where} ORDER BY id DESC LIMIT ?",
+            valores + [limite]
+        ).fetchall()
+        return [(id_, figura, fecha, json.loads(parametros), resultado)
+                for id_, figura, fecha, parametros, resultado in filas]
+
+    def buscar_por_parametro(self, nombre, minimo, maximo, limite=TAM_PAGINA):
+        """Devuelve los ids de los cálculos cuyo parámetro `nombre` está en [minimo, maximo]."""
+        filas = self.conexion.execute(
+            "SELECT calculo_id FROM parametros WHERE nombre = ? AND valor BETWEEN ? AND ? "
+            "ORDER BY calculo_id DESC LIMIT ?",
+            (nombre, minimo, maximo, limite)
+        ).fetchall()
+        return [fila[0] for fila in filas]
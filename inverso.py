@@ -0,0 +1,176 @@
+"""Diseño inverso: encontrar la dimensión que produce un área o volumen objetivo.
+
+Donde existe una inversa cerrada (por ejemplo el radio de una esfera a partir
+de su volumen) se usa directamente. En los demás casos se usa un método de
+Newton protegido con bisección, vectorizado sobre todos los objetivos a la vez:
+cada paso de Newton que sale del intervalo que encierra la raíz se reemplaza
+por un paso de bisección, así que la convergencia está garantizada cuando hay
+cambio de signo.
+
+La bisección supone que la propiedad es monótona en la incógnita. Cuando no lo
+es, la búsqueda se limita a una rama monótona (ver `RAMAS`): el perímetro de
+un paralelogramo es simétrico respecto a 90°, así que se busca el ángulo en
+(0°, 90°] y 180° - θ es la otra solución.
+"""
+import numpy as np
+
+import calculos
+import registro
+
+TOLERANCIA = 1e-12
+MAX_ITERACIONES = 100
+MAX_DUPLICACIONES = 200
+
+# Inversas cerradas: (figura, propiedad, incógnita) -> función(objetivo, **fijos)
+INVERSAS = {
+    ("circulo", "area", "radio"): lambda t: np.sqrt(t / np.pi),
+    ("circulo", "perimetro", "radio"): lambda t: t / (2 * np.pi),
+    ("cuadrilatero", "area", "lado1"): lambda t, lado2: t / lado2,
+    ("cuadrilatero", "area", "lado2"): lambda t, lado1: t / lado1,
+    ("triangulo", "area", "base"): lambda t, altura: 2 * t / altura,
+    ("triangulo", "area", "altura"): lambda t, base: 2 * t / base,
+    ("elipse", "area", "a"): lambda t, b: t / (np.pi * b),
+    ("elipse", "area", "b"): lambda t, a: t / (np.pi * a),
+    ("rombo", "area", "d_mayor"): lambda t, d_menor: 2 * t / d_menor,
+    ("rombo", "area", "d_menor"): lambda t, d_mayor: 2 * t / d_mayor,
+    ("sector_circular", "area", "radio"): lambda t, angulo: np.sqrt(360 * t / (np.pi * angulo)),
+    ("poligono_regular", "area", "longitud_lado"):
+        lambda t, n_lados: np.sqrt(t / calculos.coeficiente_area_poligono(n_lados)),
+    ("cubo", "area", "lado"): lambda t: np.sqrt(t / 6),
+    ("cubo", "volumen", "lado"): lambda t: np.cbrt(t),
+    ("esfera", "area", "radio"): lambda t: np.sqrt(t / (4 * np.pi)),
+    ("esfera", "volumen", "radio"): lambda t: np.cbrt(3 * t / (4 * np.pi)),
+    ("cilindro", "volumen", "radio"): lambda t, altura: np.sqrt(t / (np.pi * altura)),
+    ("cilindro", "volumen", "altura"): lambda t, radio: t / (np.pi * radio ** 2),
+    ("cono", "volumen", "radio"): lambda t, altura: np.sqrt(3 * t / (np.pi * altura)),
+    ("cono", "volumen", "altura"): lambda t, radio: 3 * t / (np.pi * radio ** 2),
+    ("piramide", "volumen", "lado_base"): lambda t, altura: np.sqrt(3 * t / altura),
+    ("piramide", "volumen", "altura"): lambda t, lado_base: 3 * t / lado_base ** 2,
+    ("prisma", "volumen", "longitud"):
+        lambda t, n_lados, altura: np.sqrt(t / (calculos.coeficiente_area_poligono(n_lados) * altura)),
+    ("prisma", "volumen", "altura"):
+        lambda t, n_lados, longitud: t / (calculos.coeficiente_area_poligono(n_lados) * longitud ** 2),
+}
+
+# Propiedades no monótonas en la incógnita: (figura, incógnita) -> máximo de la rama que se busca
+RAMAS = {
+    ("paralelogramo", "angulo"): 90.0,
+}
+
+
+class Solucion:
+    """Resultado del solucionador con diagnósticos de convergencia por elemento."""
+
+    def __init__(self, valores, residuo, iteraciones, convergio, metodo):
+        self.valores = valores
+        self.residuo = residuo
+        self.iteraciones = iteraciones
+        self.convergio = convergio
+        self.metodo = metodo
+
+    def resumen(self):
+        return (f"Método: {self.metodo}\n"
+                f"Convergieron: {int(np.sum(self.convergio))} de {np.size(self.convergio)}\n"
+                f"Iteraciones máximas: {int(np.max(self.iteraciones, initial=0))}\n"
+                f"Residuo relativo máximo: {float(np.nanmax(self.residuo, initial=0)):.3e}")
+
+
+def incognitas(clave):
+    """Parámetros continuos de una figura que pueden resolverse."""
+    return [p.nombre for p in registro.obtener(clave).parametros if p.tipo is float]
+
+
+def resolver(clave, propiedad, objetivos, incognita, fijos=None, tolerancia=TOLERANCIA,
+             max_iteraciones=MAX_ITERACIONES):
+    """Encuentra el valor de `incognita` para el que `propiedad` vale cada uno de los `objetivos`.
+
+    `fijos` tiene los demás parámetros de la figura (escalares o arreglos que
+    se difunden con `objetivos`).
+    """
+    figura = registro.obtener(clave)
+    if incognita not in incognitas(clave):
+        raise ValueError(f"Incógnita no válida: {incognita}. Las incógnitas válidas son {incognitas(clave)}.")
+    if propiedad not in [p for p, _, _ in figura.propiedades]:
+        raise ValueError(f"Propiedad no válida para {figura.nombre}: {propiedad}.")
+    fijos = {nombre: np.asarray(valor, dtype=np.float64) for nombre, valor in (fijos or {}).items()}
+    objetivos = np.asarray(objetivos, dtype=np.float64)
+    objetivos, *difundidos = np.broadcast_arrays(objetivos, *fijos.values())
+    fijos = dict(zip(fijos, difundidos))
+
+    def evaluar(x):
+        return figura.calcular({**fijos, incognita: x})[propiedad]
+
+    inversa = INVERSAS.get((clave, propiedad, incognita))
+    if inversa is not None:
+        argumentos = inversa.__code__.co_varnames[1:inversa.__code__.co_argcount]
+        valores = inversa(objetivos, **{nombre: fijos[nombre] for nombre in argumentos})
+        return _diagnosticar(figura, incognita, fijos, evaluar, objetivos, valores,
+                             np.zeros(objetivos.shape, dtype=np.int64), tolerancia, "cerrada")
+
+    valores, iteraciones = _newton_biseccion(figura.parametros, incognita, evaluar, objetivos,
+                                             tolerancia, max_iteraciones, RAMAS.get((clave, incognita)))
+    return _diagnosticar(figura, incognita, fijos, evaluar, objetivos, valores, iteraciones,
+                         tolerancia, "newton-bisección")
+
+
+def _diagnosticar(figura, incognita, fijos, evaluar, objetivos, valores, iteraciones, tolerancia, metodo):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        residuo = np.abs(evaluar(valores) - objetivos) / np.maximum(np.abs(objetivos), np.finfo(float).tiny)
+    validos = figura.validar({**fijos, incognita: valores})
+    convergio = validos & (residuo <= np.sqrt(tolerancia))
+    return Solucion(np.where(validos, valores, np.nan), residuo, iteraciones, convergio, metodo)
+
+
+def _newton_biseccion(parametros, incognita, evaluar, objetivos, tolerancia, max_iteraciones, rama=None):
+    parametro = next(p for p in parametros if p.nombre == incognita)
+    forma = objetivos.shape
+
+    # Intervalo inicial: desde justo encima del mínimo hasta el máximo (o duplicando hasta encerrar la raíz)
+    bajo = np.full(forma, parametro.minimo + 1e-12 * max(1.0, abs(parametro.minimo)))
+    g_bajo = evaluar(bajo) - objetivos
+    if rama is not None:
+        alto = np.full(forma, float(rama))
+        g_alto = evaluar(alto) - objetivos
+    elif parametro.maximo is not None:
+        maximo = float(parametro.maximo) if parametro.incluir_maximo else float(parametro.maximo) - 1e-9
+        alto = np.full(forma, maximo)
+        g_alto = evaluar(alto) - objetivos
+    else:
+        alto = np.ones(forma)
+        g_alto = evaluar(alto) - objetivos
+        for _ in range(MAX_DUPLICACIONES):
+            pendientes = np.sign(g_alto) == np.sign(g_bajo)
+            if not pendientes.any():
+                break
+            alto = np.where(pendientes, alto * 2, alto)
+            g_alto = np.where(pendientes, evaluar(alto) - objetivos, g_alto)
+
+    x = (bajo + alto) / 2
+    iteraciones = np.zeros(forma, dtype=np.int64)
+    # Sin cambio de signo en el intervalo el objetivo no es alcanzable
+    sin_raiz = np.sign(g_bajo) == np.sign(g_alto)
+    activos = ~sin_raiz
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        for _ in range(max_iteraciones):
+            if not activos.any():
+                break
+            g = evaluar(x) - objetivos
+            # Mantener el intervalo que encierra la raíz
+            mismo_signo = np.sign(g) == np.sign(g_bajo)
+            bajo = np.where(activos & mismo_signo, x, bajo)
+            g_bajo = np.where(activos & mismo_signo, g, g_bajo)
+            alto = np.where(activos & ~mismo_signo, x, alto)
+
+            # Paso de Newton con derivada por diferencias centrales
+            h = 1e-6 * np.maximum(np.abs(x), 1e-12)
+            derivada = (evaluar(x + h) - evaluar(x - h)) / (2 * h)
+            newton = x - g / derivada
+            fuera = ~np.isfinite(newton) | (newton <= bajo) | (newton >= alto)
+            nuevo = np.where(fuera, (bajo + alto) / 2, newton)
+
+            terminado = (np.abs(g) <= tolerancia * np.abs(objetivos)) | \
+                        (np.abs(alto - bajo) <= tolerancia * np.abs(x))
+            iteraciones += activos
+            activos &= ~terminado
+            x = np.where(activos, nuevo, x)
+    return np.where(sin_raiz, np.nan, x), iteraciones
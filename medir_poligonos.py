@@ -0,0 +1,81 @@
+"""Compara la tabla de coeficientes de polígonos con el cálculo trigonométrico por llamada.
+
+Para lotes de distintos tamaños con números de lados enteros pequeños (el caso
+típico) mide el coeficiente de área solo, `calculos.poligono_regular` y
+`calculos.prisma` contra las mismas fórmulas evaluando tan(π/n) en cada fila,
+y comprueba que los resultados coincidan. El número de lados se prueba como
+columna de punto flotante y como columna entera (el tipo con el que lo guardan
+`almacen_columnar` y los lotes mixtos de `paralelo` y `distribuido`).
+
+    python medir_poligonos.py --filas 1000 100000 10000000
+"""
+import argparse
+import itertools
+import time
+
+import numpy as np
+
+import calculos
+
+
+def coeficiente_trigonometrico(n_lados):
+    n_lados = np.asarray(n_lados, dtype=np.float64)
+    return {"coeficiente": n_lados / (4 * np.tan(np.pi / n_lados))}
+
+
+def coeficiente_tabla(n_lados):
+    return {"coeficiente": calculos.coeficiente_area_poligono(n_lados)}
+
+
+def poligono_trigonometrico(n_lados, longitud_lado):
+    n_lados, longitud_lado = np.asarray(n_lados, dtype=np.float64), np.asarray(longitud_lado, dtype=np.float64)
+    return {
+        "area": (n_lados * longitud_lado ** 2) / (4 * np.tan(np.pi / n_lados)),
+        "perimetro": n_lados * longitud_lado,
+    }
+
+
+def prisma_trigonometrico(n_lados, longitud, altura):
+    n_lados = np.asarray(n_lados, dtype=np.float64)
+    longitud, altura = np.asarray(longitud, dtype=np.float64), np.asarray(altura, dtype=np.float64)
+    area_base = (n_lados * longitud ** 2) / (4 * np.tan(np.pi / n_lados))
+    return {"area_total": 2 * area_base + n_lados * longitud * altura, "volumen": area_base * altura}
+
+
+def medir(funcion, argumentos, repeticiones):
+    # La mejor de varias repeticiones: la menos afectada por el resto del sistema
+    mejor = np.inf
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(*argumentos)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tabla de polígonos contra trigonometría por llamada.")
+    parser.add_argument("--filas", type=int, nargs="+", default=[1_000, 100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--max-lados", type=int, default=12)
+    parser.add_argument("--repeticiones", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    casos = [("Coeficiente", coeficiente_tabla, coeficiente_trigonometrico, 1),
+             ("Polígono regular", calculos.poligono_regular, poligono_trigonometrico, 2),
+             ("Prisma", calculos.prisma, prisma_trigonometrico, 3)]
+    print(f"{'Figura':<18}{'n':>7}{'Filas':>12}{'Trigonometría':>16}{'Tabla':>12}{'Aceleración':>14}")
+    for filas in args.filas:
+        enteros = rng.integers(3, args.max_lados + 1, filas)
+        medidas = [rng.uniform(0.1, 100.0, filas) for _ in range(2)]
+        for (nombre, tabla, trigonometria, num_argumentos), (tipo, n_lados) in itertools.product(
+                casos, [("float", enteros.astype(np.float64)), ("int", enteros)]):
+            argumentos = [n_lados] + medidas[:num_argumentos - 1]
+            t_trig, esperado = medir(trigonometria, argumentos, args.repeticiones)
+            t_tabla, obtenido = medir(tabla, argumentos, args.repeticiones)
+            if not all(np.allclose(obtenido[k], esperado[k], rtol=1e-12) for k in esperado):
+                raise SystemExit(f"{nombre}: los resultados no coinciden.")
+            print(f"{nombre:<18}{tipo:>7}{filas:>12}{1000 * t_trig:>13.2f} ms{1000 * t_tabla:>9.2f} ms{t_trig / t_tabla:>13.2f}×")
+
+
+if __name__ == "__main__":
+    main()
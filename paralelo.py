@@ -0,0 +1,176 @@
+"""Evaluación de lotes mixtos en varios procesos usando memoria compartida.
+
+Las columnas de entrada (códigos de figura y parámetros) y las de salida
+(propiedades) viven en bloques de `multiprocessing.shared_memory`. Los procesos
+solo reciben los nombres de esos bloques, su forma y su tipo, y los mapean como
+arreglos de NumPy: ningún arreglo se serializa. El lote se divide en trozos y
+cada proceso toma el siguiente trozo libre de un contador compartido, así que
+los procesos que terminan antes siguen trabajando (reparto dinámico).
+"""
+import multiprocessing as mp
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import registro
+
+TAM_TROZO = 1 << 18
+
+
+class ArreglosCompartidos:
+    """Conjunto de arreglos de NumPy respaldados por bloques de memoria compartida."""
+
+    def __init__(self):
+        self.bloques = {}
+        self.arreglos = {}
+        self.propietario = True
+
+    def crear(self, nombre, forma, dtype, relleno=None):
+        dtype = np.dtype(dtype)
+        tam = max(1, int(np.prod(forma)) * dtype.itemsize)
+        bloque = shared_memory.SharedMemory(create=True, size=tam)
+        arreglo = np.ndarray(forma, dtype=dtype, buffer=bloque.buf)
+        if relleno is not None:
+            arreglo[...] = relleno
+        self.bloques[nombre] = bloque
+        self.arreglos[nombre] = arreglo
+        return arreglo
+
+    def descriptores(self):
+        return {nombre: (self.bloques[nombre].name, arreglo.shape, arreglo.dtype.str)
+                for nombre, arreglo in self.arreglos.items()}
+
+    @classmethod
+    def adjuntar(cls, descriptores):
+        """Mapea en este proceso bloques creados por otro, sin hacerse dueño de ellos."""
+        compartidos = cls()
+        compartidos.propietario = False
+        for nombre, (bloque_nombre, forma, dtype) in descriptores.items():
+            bloque = shared_memory.SharedMemory(name=bloque_nombre)
+            compartidos.bloques[nombre] = bloque
+            compartidos.arreglos[nombre] = np.ndarray(forma, dtype=np.dtype(dtype), buffer=bloque.buf)
+        return compartidos
+
+    def cerrar(self):
+        """Libera los bloques; los arreglos obtenidos antes dejan de ser válidos."""
+        self.arreglos.clear()
+        for bloque in self.bloques.values():
+            bloque.close()
+            if self.propietario:
+                bloque.unlink()
+        self.bloques.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+class LoteCompartido(ArreglosCompartidos):
+    """Lote mixto en memoria compartida.
+
+    `entradas` tiene la columna `codigo` (ver `registro.codificar`) y una columna
+    por parámetro con el tipo de `registro.tipos_lote` (NaN, o
+    `registro.RELLENO_ENTERO` en las enteras, donde no aplica); `salidas` tiene una columna por
+    propiedad. Las entradas pueden llenarse directamente para no copiar nada.
+    """
+
+    def __init__(self, filas):
+        super().__init__()
+        self.filas = filas
+        self.nombres_parametros = []
+        for figura in registro.figuras():
+            self.nombres_parametros += [n for n in figura.nombres_parametros if n not in self.nombres_parametros]
+        self.nombres_propiedades = registro.nombres_propiedades()
+        self.crear("codigo", (filas,), registro.TIPO_CODIGO)
+        tipos = registro.tipos_lote()
+        for nombre in self.nombres_parametros:
+            if tipos[nombre] is np.float64:
+                self.crear(nombre, (filas,), np.float64, np.nan)
+            else:
+                self.crear(nombre, (filas,), tipos[nombre], registro.RELLENO_ENTERO)
+        for nombre in self.nombres_propiedades:
+            self.crear(nombre, (filas,), np.float64, np.nan)
+
+    @classmethod
+    def desde_arreglos(cls, claves, columnas):
+        lote = cls(len(claves))
+        claves = np.asarray(claves)
+        lote.arreglos["codigo"][:] = claves if np.issubdtype(claves.dtype, np.integer) else registro.codificar(claves)
+        tipos = registro.tipos_lote()
+        for nombre, valores in columnas.items():
+            lote.arreglos[nombre][:] = registro.columna_lote(nombre, valores, tipos)
+        return lote
+
+    @property
+    def entradas(self):
+        return {n: self.arreglos[n] for n in ["codigo"] + self.nombres_parametros}
+
+    @property
+    def salidas(self):
+        return {n: self.arreglos[n] for n in self.nombres_propiedades}
+
+    def evaluar(self, procesos=None, tam_trozo=TAM_TROZO):
+        """Evalúa el lote; los resultados quedan en `salidas` (memoria compartida)."""
+        procesos = procesos or os.cpu_count() or 1
+        num_trozos = -(-self.filas // tam_trozo)
+        if procesos == 1 or num_trozos == 1:
+            _evaluar_trozos(self.arreglos, self.nombres_parametros, self.nombres_propiedades,
+                            iter(range(num_trozos)), self.filas, tam_trozo)
+            return self.salidas
+
+        contexto = mp.get_context()
+        siguiente = contexto.Value("q", 0)
+        trabajadores = [
+            contexto.Process(target=_trabajador, args=(
+                self.descriptores(), self.nombres_parametros, self.nombres_propiedades,
+                siguiente, num_trozos, self.filas, tam_trozo))
+            for _ in range(min(procesos, num_trozos))
+        ]
+        for trabajador in trabajadores:
+            trabajador.start()
+        for trabajador in trabajadores:
+            trabajador.join()
+        fallidos = [t.exitcode for t in trabajadores if t.exitcode != 0]
+        if fallidos:
+            raise RuntimeError(f"Fallaron {len(fallidos)} procesos de evaluación (códigos de salida {fallidos}).")
+        return self.salidas
+
+
+def _evaluar_trozos(arreglos, nombres_parametros, nombres_propiedades, trozos, filas, tam_trozo):
+    for trozo in trozos:
+        inicio, fin = trozo * tam_trozo, min(filas, (trozo + 1) * tam_trozo)
+        registro.evaluar_lote_mixto(
+            arreglos["codigo"][inicio:fin],
+            {nombre: arreglos[nombre][inicio:fin] for nombre in nombres_parametros},
+            salida={nombre: arreglos[nombre][inicio:fin] for nombre in nombres_propiedades},
+        )
+
+
+def _tomar_trozos(siguiente, num_trozos):
+    # Cada proceso toma el siguiente trozo libre hasta agotar el lote
+    while True:
+        with siguiente.get_lock():
+            trozo = siguiente.value
+            siguiente.value += 1
+        if trozo >= num_trozos:
+            return
+        yield trozo
+
+
+def _trabajador(descriptores, nombres_parametros, nombres_propiedades, siguiente, num_trozos, filas, tam_trozo):
+    compartidos = ArreglosCompartidos.adjuntar(descriptores)
+    try:
+        _evaluar_trozos(compartidos.arreglos, nombres_parametros, nombres_propiedades,
+                        _tomar_trozos(siguiente, num_trozos), filas, tam_trozo)
+    finally:
+        compartidos.cerrar()
+
+
+def evaluar_en_paralelo(claves, columnas, procesos=None, tam_trozo=TAM_TROZO):
+    """Atajo: copia el lote a memoria compartida, lo evalúa y devuelve copias de las propiedades."""
+    with LoteCompartido.desde_arreglos(claves, columnas) as lote:
+        salidas = lote.evaluar(procesos, tam_trozo)
+        return {nombre: valores.copy() for nombre, valores in salidas.items()}
@@ -0,0 +1,290 @@
+"""Prueba de resistencia de la interfaz: miles de ciclos sin intervención.
+
+Ejecuta `App` (en una pantalla virtual Xvfb si no hay `DISPLAY`) y, para cada
+figura del registro y para el triángulo general, repite el ciclo del usuario:
+abrir el formulario, llenar los campos, Calcular, y pulsar "Volver a Calcular".
+Cada cierto número de ciclos anota la memoria residente (RSS), las figuras
+abiertas de pyplot, los widgets de Tk y la latencia de los ciclos. Al final
+falla (código de salida 1) si alguno de esos recursos crece sin límite, o si
+un ciclo abre un diálogo o lanza una excepción (la prueba se detiene ahí):
+
+- las figuras de pyplot, los widgets y los registros pendientes del historial
+  no pueden superar lo que había tras el calentamiento;
+- el hilo escritor del historial debe seguir vivo y vaciar la cola en menos de
+  `--limite-historial` segundos en cada medida;
+- el RSS no puede crecer más de `--limite-rss` MB tras el calentamiento;
+- la mediana de la latencia del último tramo no puede superar
+  `--limite-latencia` veces la del primero.
+
+Uso:
+
+    python prueba_resistencia.py --ciclos 2000 --csv medidas.csv
+"""
+import argparse
+import csv
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+
+import numpy as np
+
+# Valores válidos para llenar los formularios; los demás parámetros reciben VALOR_POR_DEFECTO
+VALORES = {"n_lados": 6, "angulo": 60.0, "base_mayor": 5.0, "base_menor": 3.0}
+VALOR_POR_DEFECTO = 3.0
+DATOS_TRIANGULO = ("LLL", ["3", "4", "5"])
+TIEMPO_HISTORIAL = 10.0
+FORMULA_PRUEBA = ("Elipse de prueba", "2D", ["a", "b"],
+                  "area = pi * a * b; dentro = (x / a)**2 + (y / b)**2 <= 1")
+
+
+def iniciar_pantalla_virtual(forzar=False):
+    """Inicia Xvfb si no hay pantalla (o si se fuerza); devuelve el proceso o None."""
+    if os.environ.get("DISPLAY") and not forzar:
+        return None
+    ejecutable = shutil.which("Xvfb")
+    if ejecutable is None:
+        raise SystemExit("No hay pantalla disponible y Xvfb no está instalado.")
+    # Xvfb escribe en `-displayfd` el número de pantalla libre que eligió
+    lectura, escritura = os.pipe()
+    proceso = subprocess.Popen([ejecutable, "-displayfd", str(escritura), "-screen", "0", "1280x1024x24",
+                                "-nolisten", "tcp"], pass_fds=(escritura,),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.close(escritura)
+    with os.fdopen(lectura) as f:
+        numero = f.readline().strip()
+    if not numero:
+        proceso.kill()
+        raise SystemExit("Xvfb no pudo iniciar.")
+    os.environ["DISPLAY"] = f":{numero}"
+    return proceso
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        # Sin /proc solo está el máximo histórico (en KB en Linux, en bytes en macOS)
+        maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maximo / 2 ** 20 if sys.platform == "darwin" else maximo / 2 ** 10
+
+
+def contar_widgets(widget):
+    return 1 + sum(contar_widgets(hijo) for hijo in widget.winfo_children())
+
+
+def buscar(widget, condicion):
+    for hijo in widget.winfo_children():
+        if condicion(hijo):
+            return hijo
+        encontrado = buscar(hijo, condicion)
+        if encontrado is not None:
+            return encontrado
+    return None
+
+
+def buscar_boton(widget, texto):
+    from tkinter import ttk
+    return buscar(widget, lambda hijo: isinstance(hijo, ttk.Button) and hijo.cget("text") == texto)
+
+
+class FallaInterfaz(Exception):
+    """Una acción de la interfaz falló (un diálogo o una excepción en un callback de Tk)."""
+
+
+class Conductor:
+    """Conduce la interfaz como lo haría un usuario, sin diálogos bloqueantes."""
+
+    def __init__(self, app, figuras):
+        self.app = app
+        self.figuras = figuras
+        # Tk imprime y descarta las excepciones de sus callbacks; aquí se guardan para detener la prueba
+        self.errores = []
+        app.root.report_callback_exception = self._reportar
+
+    def _reportar(self, tipo, valor, _traza):
+        self.errores.append("".join(traceback.format_exception_only(tipo, valor)).strip())
+
+    def _actualizar(self):
+        self.app.root.update()
+        if self.errores:
+            raise FallaInterfaz(self.errores[0])
+
+    def _pulsar(self, texto):
+        boton = buscar_boton(self.app.main_frame, texto)
+        if boton is None:
+            raise FallaInterfaz(f"No se encontró el botón '{texto}'.")
+        boton.invoke()
+        self._actualizar()
+
+    def _llenar(self, valores):
+        for nombre, valor in valores.items():
+            entrada = self.app.entradas[nombre]
+            entrada.delete(0, "end")
+            entrada.insert(0, str(valor))
+
+    def ciclo_figura(self, figura):
+        self.app.calcular_figura(figura.clave)
+        self._llenar({p.nombre: VALORES.get(p.nombre, VALOR_POR_DEFECTO) for p in figura.parametros})
+        self._pulsar("Calcular")
+        # "Volver a Calcular" deja el formulario listo para el siguiente ciclo
+        self._pulsar("Volver a Calcular")
+
+    def ciclo_triangulo(self):
+        caso, datos = DATOS_TRIANGULO
+        from tkinter import ttk
+        self.app.calcular_triangulo_general()
+        # Elegir el caso en el combobox reetiqueta las entradas como lo haría el usuario
+        buscar(self.app.main_frame, lambda hijo: isinstance(hijo, ttk.Combobox)).set(caso)
+        self._actualizar()
+        for entrada, valor in zip(self.app.entradas, datos):
+            entrada.delete(0, "end")
+            entrada.insert(0, valor)
+        self._pulsar("Calcular")
+        self._pulsar("Volver a Calcular")
+
+    def ciclo(self, i):
+        """Un ciclo por figura; el triángulo general se intercala como una figura más."""
+        indice = i % (len(self.figuras) + 1)
+        if indice == len(self.figuras):
+            self.ciclo_triangulo()
+        else:
+            self.ciclo_figura(self.figuras[indice])
+
+
+def medir(app, plt, ciclo, latencias, limite_historial):
+    vaciado = app.historial.vaciar(limite_historial)
+    return {
+        "ciclo": ciclo,
+        "rss_mb": rss_mb(),
+        "figuras_pyplot": len(plt.get_fignums()),
+        "widgets": contar_widgets(app.root),
+        "latencia_ms": 1000 * float(np.median(latencias)) if latencias else 0.0,
+        "historial_pendientes": app.historial.pendientes.unfinished_tasks,
+        "historial_activo": app.historial.activo,
+        "historial_vaciado": vaciado,
+    }
+
+
+def evaluar(medidas, calentamiento, limite_rss, limite_latencia):
+    """Devuelve la lista de fallas encontradas en las medidas."""
+    base = [m for m in medidas if m["ciclo"] <= calentamiento]
+    resto = [m for m in medidas if m["ciclo"] > calentamiento]
+    if not base or not resto:
+        return ["No hay suficientes medidas; aumente --ciclos o reduzca --calentamiento."]
+    fallas = []
+    muerto = next((m["ciclo"] for m in medidas if not m["historial_activo"]), None)
+    if muerto is not None:
+        fallas.append(f"El escritor del historial murió antes del ciclo {muerto}.")
+    atascado = next((m["ciclo"] for m in medidas if not m["historial_vaciado"]), None)
+    if atascado is not None:
+        fallas.append(f"El historial no se vació a tiempo en el ciclo {atascado}.")
+    for recurso in ("figuras_pyplot", "widgets", "historial_pendientes"):
+        maximo = max(m[recurso] for m in base)
+        final = max(m[recurso] for m in resto)
+        if final > maximo:
+            fallas.append(f"{recurso} creció de {maximo} a {final}.")
+    crecimiento = resto[-1]["rss_mb"] - base[-1]["rss_mb"]
+    if crecimiento > limite_rss:
+        fallas.append(f"El RSS creció {crecimiento:.1f} MB después del calentamiento (límite {limite_rss} MB).")
+    tramo = max(1, len(resto) // 4)
+    inicial = np.median([m["latencia_ms"] for m in resto[:tramo]])
+    final = np.median([m["latencia_ms"] for m in resto[-tramo:]])
+    if final > limite_latencia * inicial:
+        fallas.append(f"La latencia pasó de {inicial:.1f} ms a {final:.1f} ms por ciclo.")
+    return fallas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prueba de resistencia de la interfaz gráfica.")
+    parser.add_argument("--ciclos", type=int, default=2000, help="ciclos en total (repartidos entre las figuras)")
+    parser.add_argument("--calentamiento", type=int, default=None,
+                        help="ciclos iniciales que no cuentan para el crecimiento (por omisión el 10 %%)")
+    parser.add_argument("--cada", type=int, default=None, help="ciclos entre medidas (por omisión una vuelta)")
+    parser.add_argument("--limite-rss", type=float, default=50.0, help="crecimiento máximo del RSS en MB")
+    parser.add_argument("--limite-latencia", type=float, default=1.5,
+                        help="razón máxima entre la latencia final y la inicial")
+    parser.add_argument("--limite-historial", type=float, default=TIEMPO_HISTORIAL,
+                        help="segundos máximos para vaciar el historial en cada medida")
+    parser.add_argument("--csv", help="archivo donde guardar las medidas")
+    parser.add_argument("--xvfb", action="store_true", help="usar Xvfb aunque haya pantalla")
+    args = parser.parse_args(argv)
+
+    xvfb = iniciar_pantalla_virtual(args.xvfb)
+    temporal = tempfile.TemporaryDirectory()
+    # El historial y las figuras de la prueba no se mezclan con los del usuario
+    os.environ["SISTEMA_GEOMETRICO_DATOS"] = temporal.name
+    medidas, falla_ciclo = [], None
+    try:
+        os.environ.setdefault("MPLBACKEND", "TkAgg")
+        import tkinter as tk
+        from tkinter import messagebox
+
+        import matplotlib.pyplot as plt
+
+        import figurasalpha
+        import formulas
+        import registro
+
+        # Un diálogo bloquearía la prueba: cualquier mensaje es una falla
+        def dialogo(titulo, mensaje, **_):
+            raise RuntimeError(f"{titulo}: {mensaje}")
+        for nombre in ("showinfo", "showwarning", "showerror"):
+            setattr(messagebox, nombre, dialogo)
+
+        root = tk.Tk()
+        app = figurasalpha.App(root)
+        formulas.crear(*FORMULA_PRUEBA)
+        figuras = list(registro.figuras())
+        conductor = Conductor(app, figuras)
+
+        vuelta = len(figuras) + 1
+        cada = args.cada or vuelta
+        calentamiento = args.calentamiento if args.calentamiento is not None else max(vuelta, args.ciclos // 10)
+        latencias = []
+        for i in range(1, args.ciclos + 1):
+            inicio = time.perf_counter()
+            try:
+                conductor.ciclo(i - 1)
+            except Exception as e:
+                # Un diálogo o un error de la interfaz detiene la prueba; las medidas previas se conservan
+                falla_ciclo = f"El ciclo {i} falló: {e}"
+                break
+            latencias.append(time.perf_counter() - inicio)
+            if i % cada == 0 or i == args.ciclos:
+                medidas.append(medir(app, plt, i, latencias, args.limite_historial))
+                latencias = []
+                m = medidas[-1]
+                print(f"ciclo {i:6d}  RSS {m['rss_mb']:8.1f} MB  figuras {m['figuras_pyplot']:3d}  "
+                      f"widgets {m['widgets']:5d}  historial {m['historial_pendientes']:4d}  "
+                      f"latencia {m['latencia_ms']:7.1f} ms", flush=True)
+        app.historial.cerrar()
+        root.destroy()
+    finally:
+        temporal.cleanup()
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    if args.csv and medidas:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            escritor = csv.DictWriter(f, fieldnames=list(medidas[0]))
+            escritor.writeheader()
+            escritor.writerows(medidas)
+
+    fallas = ([falla_ciclo] if falla_ciclo else []) + \
+        evaluar(medidas, calentamiento, args.limite_rss, args.limite_latencia)
+    for falla in fallas:
+        print(f"FALLA: {falla}")
+    if not fallas:
+        print("Sin crecimiento de recursos.")
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
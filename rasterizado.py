@@ -0,0 +1,191 @@
+"""Rasterizado por teselas de las figuras 2D en máscaras de píxeles, sin matplotlib.
+
+La máscara se escribe en un archivo `.npy` mapeado en memoria, así que puede
+ser mucho más grande que la RAM (por ejemplo 100 000 × 100 000 píxeles): cada
+tesela se calcula y se escribe por separado, y las teselas que no tocan la
+figura ni siquiera se escriben (el archivo queda disperso).
+
+Cada tesela se rellena por líneas de barrido con la regla par-impar: en cada
+sub-fila se calculan los cruces con las aristas del contorno y la cobertura
+horizontal de cada píxel se integra de forma exacta; verticalmente se toman
+`submuestras` sub-filas por píxel. El resultado es la cobertura suavizada
+(antialiasing) en 0..255.
+
+Las curvas (círculos, elipses, arcos) se aproximan con tantos segmentos como
+haga falta para que cada cuerda se aparte de la curva menos de `ERROR_CURVA`
+píxeles a la resolución pedida.
+"""
+import math
+import multiprocessing as mp
+import os
+
+import numpy as np
+
+import geometria
+import registro
+import render_vectorial
+
+TAM_TESELA = 512
+SUBMUESTRAS = 4
+# Distancia máxima (en píxeles) entre una curva y las cuerdas que la aproximan
+ERROR_CURVA = 0.1
+
+
+def aristas(contornos, ancho, alto, margen=0):
+    """Ajusta los contornos (en cm) al lienzo y devuelve sus aristas (E, 4) en píxeles.
+
+    El eje Y se invierte para que la fila 0 quede arriba, como en la imagen.
+    """
+    if isinstance(contornos, np.ndarray) and contornos.ndim == 2:
+        contornos = [contornos]
+    todos = render_vectorial.ajustar_a_caja(np.vstack(contornos) * [1, -1], 0, 0, ancho, alto, margen)
+    cortes = np.cumsum([len(contorno) for contorno in contornos])[:-1]
+    lista = []
+    for puntos in np.split(todos, cortes):
+        # Contorno cerrado: cada vértice se une con el siguiente
+        lista.append(np.hstack([puntos, np.roll(puntos, -1, axis=0)]))
+    return np.vstack(lista)
+
+
+def segmentos_curva(contornos, ancho, alto=None, margen=0, error=ERROR_CURVA):
+    """Segmentos por vuelta completa para que la flecha de cada cuerda sea menor que `error` píxeles.
+
+    La flecha de una cuerda que abarca 2π/N en un radio R es R·(1 - cos(π/N)),
+    aproximadamente R·π²/(2N²). Como cota de R se usa la mayor extensión de la
+    figura a la escala del lienzo.
+    """
+    if isinstance(contornos, np.ndarray) and contornos.ndim == 2:
+        contornos = [contornos]
+    extension = np.ptp(np.vstack(contornos), axis=0)
+    extension[extension == 0] = 1.0
+    escala = (ancho - 2 * margen) / extension[0]
+    if alto is not None:
+        escala = min(escala, (alto - 2 * margen) / extension[1])
+    radio = escala * float(extension.max())
+    return max(geometria.SEGMENTOS_CURVA, math.ceil(math.pi * math.sqrt(radio / (2 * error))))
+
+
+def cobertura(aristas, fila0, filas, col0, columnas, submuestras=SUBMUESTRAS):
+    """Cobertura (0..1) de la tesela que empieza en (fila0, col0)."""
+    x0, y0, x1, y1 = aristas.T
+    y = fila0 + (np.arange(filas * submuestras) + 0.5) / submuestras
+    cruza = ((y0 <= y[:, None]) & (y[:, None] < y1)) | ((y1 <= y[:, None]) & (y[:, None] < y0))
+    resultado = np.zeros((filas * submuestras, columnas))
+    maximo = int(cruza.sum(axis=1).max(initial=0))
+    if maximo == 0:
+        return resultado.reshape(filas, submuestras, columnas).mean(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x = x0 + (y[:, None] - y0) / (y1 - y0) * (x1 - x0)
+    x = np.sort(np.where(cruza, x, np.inf), axis=1)[:, :maximo]
+    validos = np.isfinite(x)
+    # Entre cruces pares e impares la fila está dentro: cobertura = Σ ±clip(x - p, 0, 1).
+    # Cada término es 1 antes del píxel del cruce, la fracción en él y 0 después,
+    # así que se acumula como arreglo de diferencias y se integra con cumsum.
+    signos = np.where(np.arange(maximo) % 2 == 0, -1.0, 1.0) * validos
+    x = np.where(validos, x - col0, 0.0)
+    piso = np.floor(x)
+    fraccion = x - piso
+    desplazamiento = (np.arange(len(y)) * (columnas + 2))[:, None]
+    en_cruce = desplazamiento + np.clip(piso, 0, columnas).astype(np.int64)
+    despues = desplazamiento + np.clip(piso + 1, 0, columnas + 1).astype(np.int64)
+    diferencias = np.bincount(
+        np.concatenate([en_cruce.ravel(), despues.ravel()]),
+        weights=np.concatenate([(signos * (fraccion - 1)).ravel(), (-signos * fraccion).ravel()]),
+        minlength=len(y) * (columnas + 2),
+    ).reshape(len(y), columnas + 2)
+    diferencias[:, 0] += signos.sum(axis=1)
+    resultado = np.cumsum(diferencias[:, :columnas], axis=1)
+    return np.clip(resultado, 0.0, 1.0).reshape(filas, submuestras, columnas).mean(axis=1)
+
+
+def teselas(aristas, ancho, alto, tam_tesela=TAM_TESELA):
+    """Teselas (fila0, filas, col0, columnas) que tocan la caja de la figura."""
+    xmin, xmax = aristas[:, [0, 2]].min(), aristas[:, [0, 2]].max()
+    ymin, ymax = aristas[:, [1, 3]].min(), aristas[:, [1, 3]].max()
+    for fila0 in range(0, alto, tam_tesela):
+        if fila0 + tam_tesela <= ymin or fila0 >= ymax:
+            continue
+        for col0 in range(0, ancho, tam_tesela):
+            if col0 + tam_tesela <= xmin or col0 >= xmax:
+                continue
+            yield fila0, min(tam_tesela, alto - fila0), col0, min(tam_tesela, ancho - col0)
+
+
+def dentro(aristas, x, y):
+    """Indica si el punto (x, y) en píxeles está dentro de la figura (regla par-impar)."""
+    x0, y0, x1, y1 = aristas.T
+    cruza = ((y0 <= y) & (y < y1)) | ((y1 <= y) & (y < y0))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cruces = x0 + (y - y0) / (y1 - y0) * (x1 - x0)
+    return bool(np.count_nonzero(cruza & (cruces < x)) % 2)
+
+
+def _rasterizar_tesela(ruta, aristas, tesela, submuestras):
+    fila0, filas, col0, columnas = tesela
+    # Solo las aristas que cruzan las filas de la tesela pueden producir cruces
+    y0, y1 = aristas[:, 1], aristas[:, 3]
+    utiles = (np.maximum(y0, y1) >= fila0) & (np.minimum(y0, y1) <= fila0 + filas)
+    x0, x1 = aristas[:, 0], aristas[:, 2]
+    borde = utiles & (np.maximum(x0, x1) >= col0) & (np.minimum(x0, x1) <= col0 + columnas)
+    if not borde.any():
+        # Ninguna arista toca la tesela: está completamente dentro o completamente fuera
+        if not dentro(aristas, col0 + columnas / 2, fila0 + filas / 2):
+            return
+        valores = np.full((filas, columnas), 255, dtype=np.uint8)
+    else:
+        valores = cobertura(aristas[utiles], fila0, filas, col0, columnas, submuestras)
+        if not valores.any():
+            return
+        valores = np.round(valores * 255).astype(np.uint8)
+    mascara = np.load(ruta, mmap_mode="r+")
+    mascara[fila0:fila0 + filas, col0:col0 + columnas] = valores
+    mascara.flush()
+    del mascara
+
+
+def _trabajador(argumentos):
+    _rasterizar_tesela(*argumentos)
+
+
+def rasterizar(ruta, contornos, ancho, alto=None, margen=0, submuestras=SUBMUESTRAS,
+               tam_tesela=TAM_TESELA, procesos=None):
+    """Rasteriza los contornos en una máscara uint8 (alto, ancho) guardada en `ruta` (.npy).
+
+    Si no se da `alto` se usa el que conserva la proporción de la figura.
+    Devuelve la máscara abierta en modo lectura y mapeada en memoria.
+    """
+    if alto is None:
+        extension = np.ptp(np.vstack(contornos), axis=0)
+        alto = max(1, int(round((ancho - 2 * margen) * extension[1] / extension[0])) + 2 * margen)
+    lista_aristas = aristas(contornos, ancho, alto, margen)
+    np.lib.format.open_memmap(ruta, mode="w+", dtype=np.uint8, shape=(alto, ancho)).flush()
+
+    tareas = [(ruta, lista_aristas, tesela, submuestras)
+              for tesela in teselas(lista_aristas, ancho, alto, tam_tesela)]
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1 or len(tareas) <= 1:
+        for tarea in tareas:
+            _trabajador(tarea)
+    else:
+        with mp.get_context().Pool(min(procesos, len(tareas))) as grupo:
+            # Reparto dinámico: cada proceso toma la siguiente tesela libre
+            for _ in grupo.imap_unordered(_trabajador, tareas):
+                pass
+    return np.load(ruta, mmap_mode="r")
+
+
+def rasterizar_figura(ruta, clave, parametros, ancho, alto=None, **opciones):
+    """Atajo: rasteriza el contorno de una figura 2D del registro.
+
+    Las curvas se vuelven a generar con los segmentos que pide `segmentos_curva`
+    para el tamaño de salida.
+    """
+    figura = registro.obtener(clave)
+    if figura.dimension != "2D":
+        raise ValueError(f"Solo se pueden rasterizar figuras 2D: {figura.nombre}.")
+    contorno = figura.contorno(parametros)
+    segmentos = segmentos_curva(contorno, ancho, alto, opciones.get("margen", 0))
+    if segmentos > geometria.SEGMENTOS_CURVA:
+        contorno = figura.contorno(parametros, segmentos)
+    return rasterizar(ruta, contorno, ancho, alto, **opciones)
@@ -0,0 +1,350 @@
+"""Registro declarativo de figuras.
+
+Cada figura declara aquí sus parámetros (con su validación), su fórmula
+vectorizada, su generador de geometría y cómo se grafica. La interfaz (menús y
+formularios), el despachador de lotes y los exportadores se generan a partir de
+este registro, así que agregar una figura consiste en registrar una entrada.
+"""
+import inspect
+
+import numpy as np
+
+import calculos
+import geometria
+
+
+class Parametro:
+    def __init__(self, nombre, etiqueta, tipo=float, minimo=0, incluir_minimo=False,
+                 maximo=None, incluir_maximo=True):
+        self.nombre = nombre
+        self.etiqueta = etiqueta
+        self.tipo = tipo
+        self.minimo = minimo
+        self.incluir_minimo = incluir_minimo
+        self.maximo = maximo
+        self.incluir_maximo = incluir_maximo
+
+    @property
+    def dtype(self):
+        return np.int64 if self.tipo is int else np.float64
+
+    def validos(self, valores):
+        """Máscara vectorizada de los valores que cumplen los límites del parámetro."""
+        valores = np.asarray(valores)
+        entero = np.issubdtype(valores.dtype, np.integer)
+        if not entero:
+            valores = valores.astype(np.float64, copy=False)
+        mascara = valores >= self.minimo if self.incluir_minimo else valores > self.minimo
+        if self.maximo is not None:
+            mascara &= valores <= self.maximo if self.incluir_maximo else valores < self.maximo
+        if self.tipo is int and not entero:
+            mascara &= valores == np.floor(valores)
+        return mascara
+
+
+class Figura:
+    def __init__(self, clave, nombre, dimension, parametros, formula, propiedades, contorno,
+                 dibujo, resumen=(), mensaje_error="Los valores deben ser mayores que cero."):
+        self.clave = clave
+        self.nombre = nombre
+        self.dimension = dimension
+        self.parametros = parametros
+        # Fórmula vectorizada: recibe los parámetros por nombre y devuelve un dict de propiedades
+        self.formula = formula
+        # Propiedades a mostrar: (clave, etiqueta, unidad)
+        self.propiedades = propiedades
+        # Generador de geometría: (función de `geometria`, nombres de los parámetros que usa)
+        self.contorno_funcion, self.contorno_parametros = contorno
+        # Método `dibujar_*` de la interfaz y parámetros que recibe, en orden
+        self.dibujo_metodo, self.dibujo_parametros = dibujo
+        # Parámetros que se repiten al inicio del texto de resultados: (nombre, etiqueta)
+        self.resumen = resumen
+        self.mensaje_error = mensaje_error
+
+    @property
+    def tiene_contorno(self):
+        return self.contorno_funcion is not None
+
+    @property
+    def nombres_parametros(self):
+        return [p.nombre for p in self.parametros]
+
+    def validar(self, columnas):
+        """Máscara vectorizada de las filas cuyos parámetros son válidos."""
+        mascara = np.ones(np.shape(columnas[self.parametros[0].nombre]), dtype=bool)
+        for parametro in self.parametros:
+            mascara &= parametro.validos(columnas[parametro.nombre])
+        return mascara
+
+    def calcular(self, columnas):
+        return self.formula(**{nombre: columnas[nombre] for nombre in self.nombres_parametros})
+
+    def contorno(self, parametros, segmentos=None):
+        """Contorno de la figura; `segmentos` fija la resolución de las curvas, si las tiene."""
+        argumentos = {nombre: parametros[nombre] for nombre in self.contorno_parametros}
+        if segmentos is not None and "segmentos" in inspect.signature(self.contorno_funcion).parameters:
+            argumentos["segmentos"] = int(segmentos)
+        for parametro in self.parametros:
+            if parametro.tipo is int and parametro.nombre in argumentos:
+                argumentos[parametro.nombre] = int(argumentos[parametro.nombre])
+        return self.contorno_funcion(**argumentos)
+
+    def argumentos_dibujo(self, parametros):
+        tipos = {p.nombre: p.tipo for p in self.parametros}
+        return [tipos[nombre](parametros[nombre]) for nombre in self.dibujo_parametros]
+
+    def texto_resultado(self, parametros, propiedades):
+        lineas = []
+        tipos = {p.nombre: p.tipo for p in self.parametros}
+        for nombre, etiqueta in self.resumen:
+            if tipos[nombre] is int:
+                lineas.append(f"{etiqueta}: {int(parametros[nombre])}")
+            else:
+                lineas.append(f"{etiqueta}: {parametros[nombre]:.2f} cm")
+        for clave, etiqueta, unidad in self.propiedades:
+            lineas.append(f"{etiqueta}: {propiedades[clave]:.2f} {unidad}")
+        return "\n".join(lineas)
+
+
+FIGURAS = {}
+
+
+def registrar(figura):
+    FIGURAS[figura.clave] = figura
+    return figura
+
+
+def figuras(dimension=None):
+    return [f for f in FIGURAS.values() if dimension is None or f.dimension == dimension]
+
+
+def obtener(clave):
+    if clave not in FIGURAS:
+        raise ValueError(f"Figura no válida: {clave}. Las figuras válidas son {list(FIGURAS)}.")
+    return FIGURAS[clave]
+
+
+def calcular_lote(clave, columnas):
+    """Evalúa la fórmula de una sola figura sobre un diccionario de columnas de parámetros."""
+    return obtener(clave).calcular(columnas)
+
+
+# Tipo de los códigos de figura; int16 admite hasta 32 767 figuras registradas
+TIPO_CODIGO = np.int16
+
+
+def codificar(claves):
+    """Convierte claves de figura en códigos enteros (posición en el registro)."""
+    codigos = {clave: i for i, clave in enumerate(FIGURAS)}
+    return np.array([codigos[str(c)] for c in np.asarray(claves).ravel()], dtype=TIPO_CODIGO)
+
+
+# Relleno de las columnas enteras de un lote mixto donde el parámetro no aplica o no es entero.
+# Ningún parámetro entero lo admite (n_lados empieza en 3), así que esas filas quedan inválidas
+RELLENO_ENTERO = 0
+
+
+def tipos_lote():
+    """Tipo de cada columna de parámetros en un lote mixto.
+
+    Es entero solo si todas las figuras que usan el parámetro lo declaran
+    entero; así esas columnas llegan a la tabla de `calculos` sin conversión.
+    """
+    tipos = {}
+    for figura in FIGURAS.values():
+        for parametro in figura.parametros:
+            previo = tipos.get(parametro.nombre, parametro.dtype)
+            tipos[parametro.nombre] = parametro.dtype if previo is parametro.dtype else np.float64
+    return tipos
+
+
+def columna_lote(nombre, valores, tipos=None):
+    """Convierte una columna de un lote mixto al tipo de `tipos_lote`.
+
+    En las columnas enteras los NaN y los valores no enteros pasan a
+    `RELLENO_ENTERO`, de modo que siguen siendo inválidos tras la conversión.
+    """
+    tipo = (tipos or tipos_lote()).get(nombre, np.float64)
+    valores = np.asarray(valores)
+    if tipo is np.float64 or np.issubdtype(valores.dtype, np.integer):
+        return valores.astype(tipo, copy=False)
+    valores = valores.astype(np.float64, copy=False)
+    with np.errstate(invalid="ignore"):
+        enteros = np.isfinite(valores) & (valores == np.floor(valores)) & (np.abs(valores) < 2 ** 62)
+    return np.where(enteros, valores, RELLENO_ENTERO).astype(tipo)
+
+
+def nombres_propiedades():
+    """Unión de las propiedades que calculan todas las figuras registradas."""
+    nombres = []
+    for figura in FIGURAS.values():
+        nombres += [clave for clave, _, _ in figura.propiedades if clave not in nombres]
+    return nombres
+
+
+def evaluar_lote_mixto(claves, columnas, salida=None):
+    """Evalúa un lote con figuras mezcladas.
+
+    `claves` es un arreglo con la clave (o el código de `codificar`) de la
+    figura de cada fila y `columnas` un dict con todas las columnas de
+    parámetros (NaN donde no aplican). Las columnas enteras conviene pasarlas
+    ya convertidas con `columna_lote`: los grupos las reciben sin copiarlas
+    a punto flotante. Las filas se agrupan por figura y cada
+    grupo se evalúa con una sola llamada vectorizada. Devuelve un dict de
+    propiedades con NaN en las filas inválidas o donde la propiedad no aplica;
+    si se pasa `salida`, los resultados se escriben en esos arreglos.
+    """
+    claves = np.asarray(claves)
+    por_codigo = list(FIGURAS) if np.issubdtype(claves.dtype, np.integer) else None
+    resultado = {} if salida is None else salida
+    # Un solo ordenamiento estable agrupa las filas; cada grupo conserva el orden original
+    orden = np.argsort(claves, kind="stable")
+    ordenadas = claves[orden]
+    limites = np.concatenate([[0], np.flatnonzero(ordenadas[1:] != ordenadas[:-1]) + 1, [len(claves)]])
+    for inicio, fin in zip(limites[:-1], limites[1:]):
+        if inicio == fin:
+            continue
+        clave = ordenadas[inicio]
+        figura = obtener(por_codigo[clave] if por_codigo else str(clave))
+        indices = orden[inicio:fin]
+        parametros = {nombre: np.asarray(columnas[nombre])[indices] for nombre in figura.nombres_parametros}
+        validos = figura.validar(parametros)
+        propiedades = figura.calcular(parametros)
+        for nombre, valores in propiedades.items():
+            if nombre not in resultado:
+                resultado[nombre] = np.full(len(claves), np.nan)
+            resultado[nombre][indices] = np.where(validos, valores, np.nan)
+    return resultado
+
+
+AREA = ("area", "Área", "cm²")
+PERIMETRO = ("perimetro", "Perímetro", "cm")
+AREA_TOTAL = ("area_total", "Área total", "cm²")
+VOLUMEN = ("volumen", "Volumen", "cm³")
+
+
+# Figuras 2D
+registrar(Figura(
+    "triangulo", "Triángulo Rectángulo", "2D",
+    [Parametro("base", "Base"), Parametro("altura", "Altura")],
+    calculos.triangulo, [AREA, PERIMETRO],
+    (geometria.contorno_triangulo, ["base", "altura"]),
+    ("dibujar_triangulo", ["base", "altura"]),
+))
+registrar(Figura(
+    "cuadrilatero", "Cuadrilátero", "2D",
+    [Parametro("lado1", "Lado 1"), Parametro("lado2", "Lado 2")],
+    calculos.cuadrilatero, [AREA, PERIMETRO],
+    (geometria.contorno_cuadrilatero, ["lado1", "lado2"]),
+    ("dibujar_cuadrilatero", ["lado1", "lado2"]),
+))
+registrar(Figura(
+    "circulo", "Círculo", "2D",
+    [Parametro("radio", "Radio")],
+    calculos.circulo, [AREA, PERIMETRO],
+    (geometria.contorno_circulo, ["radio"]),
+    ("dibujar_circulo", ["radio"]),
+    mensaje_error="El radio debe ser mayor que cero.",
+))
+registrar(Figura(
+    "poligono_regular", "Polígono Regular", "2D",
+    [Parametro("n_lados", "Número de lados", int, minimo=3, incluir_minimo=True),
+     Parametro("longitud_lado", "Longitud del lado")],
+    calculos.poligono_regular, [AREA, PERIMETRO],
+    (geometria.contorno_poligono_regular, ["n_lados", "longitud_lado"]),
+    ("dibujar_poligono_regular", ["n_lados", "longitud_lado"]),
+    mensaje_error="El número de lados debe ser al menos 3 y la longitud del lado mayor que cero.",
+))
+registrar(Figura(
+    "elipse", "Elipse", "2D",
+    [Parametro("a", "Semieje Mayor"), Parametro("b", "Semieje Menor")],
+    calculos.elipse, [AREA, ("perimetro", "Perímetro aproximado", "cm")],
+    (geometria.contorno_elipse, ["a", "b"]),
+    ("dibujar_elipse", ["a", "b"]),
+))
+registrar(Figura(
+    "trapecio", "Trapecio", "2D",
+    [Parametro("base_mayor", "Base Mayor"), Parametro("base_menor", "Base Menor"),
+     Parametro("altura", "Altura"), Parametro("lado_no_paralelo", "Lado No Paralelo")],
+    calculos.trapecio, [AREA, PERIMETRO],
+    (geometria.contorno_trapecio, ["base_mayor", "base_menor", "altura"]),
+    ("dibujar_trapecio", ["base_mayor", "base_menor", "altura"]),
+))
+registrar(Figura(
+    "paralelogramo", "Paralelogramo", "2D",
+    [Parametro("base", "Base"), Parametro("altura", "Altura"),
+     Parametro("angulo", "Ángulo (grados)", maximo=180, incluir_maximo=False)],
+    calculos.paralelogramo, [AREA, PERIMETRO],
+    (geometria.contorno_paralelogramo, ["base", "altura", "angulo"]),
+    ("dibujar_paralelogramo", ["base", "altura", "angulo"]),
+    mensaje_error="La base y la altura deben ser mayores que cero y el ángulo debe estar entre 0 y 180 grados.",
+))
+registrar(Figura(
+    "rombo", "Rombo", "2D",
+    [Parametro("d_mayor", "Diagonal Mayor"), Parametro("d_menor", "Diagonal Menor")],
+    calculos.rombo, [AREA, PERIMETRO],
+    (geometria.contorno_rombo, ["d_mayor", "d_menor"]),
+    ("dibujar_rombo", ["d_mayor", "d_menor"]),
+))
+registrar(Figura(
+    "sector_circular", "Sector Circular", "2D",
+    [Parametro("radio", "Radio"), Parametro("angulo", "Ángulo Central (grados)", maximo=360)],
+    calculos.sector_circular, [AREA, ("longitud_arco", "Longitud del Arco", "cm")],
+    (geometria.contorno_sector_circular, ["radio", "angulo"]),
+    ("dibujar_sector_circular", ["radio", "angulo"]),
+    mensaje_error="El radio debe ser mayor que cero y el ángulo entre 0 y 360 grados.",
+))
+
+# Figuras 3D (el contorno es el perfil lateral)
+registrar(Figura(
+    "cubo", "Cubo", "3D",
+    [Parametro("lado", "Lado")],
+    calculos.cubo, [("area", "Área superficial", "cm²"), VOLUMEN],
+    (geometria.perfil_cubo, ["lado"]),
+    ("dibujar_cubo", ["lado"]),
+    resumen=[("lado", "Lado")],
+    mensaje_error="El lado debe ser mayor que cero.",
+))
+registrar(Figura(
+    "esfera", "Esfera", "3D",
+    [Parametro("radio", "Radio")],
+    calculos.esfera, [("area", "Área superficial", "cm²"), VOLUMEN],
+    (geometria.perfil_esfera, ["radio"]),
+    ("dibujar_esfera", ["radio"]),
+    resumen=[("radio", "Radio")],
+    mensaje_error="El radio debe ser mayor que cero.",
+))
+registrar(Figura(
+    "piramide", "Pirámide", "3D",
+    [Parametro("lado_base", "Lado de la base"), Parametro("altura", "Altura")],
+    calculos.piramide, [AREA_TOTAL, VOLUMEN],
+    (geometria.perfil_piramide, ["lado_base", "altura"]),
+    ("dibujar_piramide", ["lado_base", "altura"]),
+    resumen=[("lado_base", "Lado base"), ("altura", "Altura")],
+))
+registrar(Figura(
+    "prisma", "Prisma", "3D",
+    [Parametro("n_lados", "Número de lados de la base", int, minimo=3, incluir_minimo=True),
+     Parametro("longitud", "Longitud de cada lado"), Parametro("altura", "Altura del prisma")],
+    calculos.prisma, [AREA_TOTAL, VOLUMEN],
+    (geometria.perfil_prisma, ["n_lados", "longitud", "altura"]),
+    ("dibujar_prisma", ["n_lados", "longitud", "altura"]),
+    resumen=[("n_lados", "Número de lados"), ("longitud", "Longitud"), ("altura", "Altura")],
+    mensaje_error="El número de lados debe ser >= 3 y los valores positivos.",
+))
+registrar(Figura(
+    "cono", "Cono", "3D",
+    [Parametro("radio", "Radio de la base"), Parametro("altura", "Altura")],
+    calculos.cono, [("generatriz", "Generatriz", "cm"), AREA_TOTAL, VOLUMEN],
+    (geometria.perfil_cono, ["radio", "altura"]),
+    ("dibujar_cono", ["radio", "altura"]),
+    resumen=[("radio", "Radio"), ("altura", "Altura")],
+))
+registrar(Figura(
+    "cilindro", "Cilindro", "3D",
+    [Parametro("radio", "Radio de la base"), Parametro("altura", "Altura")],
+    calculos.cilindro, [AREA_TOTAL, VOLUMEN],
+    (geometria.perfil_cilindro, ["radio", "altura"]),
+    ("dibujar_cilindro", ["radio", "altura"]),
+    resumen=[("radio", "Radio"), ("altura", "Altura")],
+))
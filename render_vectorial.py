@@ -0,0 +1,91 @@
+"""Render vectorial ligero (SVG y ReportLab) de contornos 2D.
+
+Evita crear figuras de matplotlib: los trazos se escriben directamente a partir
+de los vértices generados en `geometria`, lo que es mucho más rápido para
+exportaciones y reportes por lotes y produce salida vectorial nítida.
+"""
+from xml.sax.saxutils import escape
+
+import numpy as np
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+
+def ajustar_a_caja(puntos, x, y, ancho, alto, margen=10):
+    """Escala y centra los puntos dentro de la caja (x, y, ancho, alto) conservando la proporción."""
+    puntos = np.asarray(puntos, dtype=float)
+    minimo = puntos.min(axis=0)
+    extension = puntos.max(axis=0) - minimo
+    extension[extension == 0] = 1.0
+    escala = min((ancho - 2 * margen) / extension[0], (alto - 2 * margen) / extension[1])
+    desplazamiento = np.array([
+        x + (ancho - extension[0] * escala) / 2,
+        y + (alto - extension[1] * escala) / 2
+    ])
+    return (puntos - minimo) * escala + desplazamiento
+
+
+def ruta_svg(puntos, cerrar=True):
+    coords = " L ".join(f"{px:.3f} {py:.3f}" for px, py in puntos)
+    return f"M {coords}" + (" Z" if cerrar else "")
+
+
+def a_svg(contornos, ancho=400, alto=400, margen=10, titulo=None, trazo="#1f77b4", grosor=1.5):
+    """Genera un documento SVG con uno o varios contornos ajustados al lienzo."""
+    if isinstance(contornos, np.ndarray) and contornos.ndim == 2:
+        contornos = [contornos]
+    # En SVG el eje Y crece hacia abajo: se invierte antes de ajustar
+    todos = ajustar_a_caja(np.vstack(contornos) * [1, -1], 0, 0, ancho, alto, margen)
+    cortes = np.cumsum([len(contorno) for contorno in contornos])[:-1]
+
+    partes = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{ancho}" height="{alto}" '
+        f'viewBox="0 0 {ancho} {alto}">'
+    ]
+    if titulo:
+        partes.append(f"<title>{escape(str(titulo))}</title>")
+    for puntos in np.split(todos, cortes):
+        partes.append(
+            f'<path d="{ruta_svg(puntos)}" fill="none" stroke="{trazo}" '
+            f'stroke-width="{grosor}" stroke-linejoin="round"/>'
+        )
+    partes.append("</svg>")
+    return "\n".join(partes)
+
+
+def guardar_svg(ruta, contornos, **opciones):
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write(a_svg(contornos, **opciones))
+
+
+def dibujar_en_pdf(c, puntos, x, y, ancho, alto, margen=10, grosor=1.5):
+    """Dibuja un contorno cerrado en un canvas de ReportLab dentro de la caja indicada."""
+    puntos = ajustar_a_caja(puntos, x, y, ancho, alto, margen)
+    path = c.beginPath()
+    path.moveTo(*puntos[0])
+    for px, py in puntos[1:]:
+        path.lineTo(px, py)
+    path.close()
+    c.setLineWidth(grosor)
+    c.setStrokeColorRGB(0.12, 0.47, 0.71)
+    c.drawPath(path, stroke=1, fill=0)
+
+
+def escribir_pagina(c, resultado_texto, contorno, tam_figura=400):
+    width, height = letter
+    textobject = c.beginText(40, height - 50)
+    textobject.setFont("Helvetica", 12)
+    for linea in resultado_texto.split("\n"):
+        textobject.textLine(linea)
+    c.drawText(textobject)
+    dibujar_en_pdf(c, contorno, (width - tam_figura) / 2, (height - tam_figura) / 2 - 60,
+                   tam_figura, tam_figura)
+    c.showPage()
+
+
+def reporte_pdf(ruta, entradas):
+    """Escribe un reporte PDF con una página por cada par (resultado_texto, contorno)."""
+    c = canvas.Canvas(ruta, pagesize=letter)
+    for resultado_texto, contorno in entradas:
+        escribir_pagina(c, resultado_texto, contorno)
+    c.save()
@@ -0,0 +1,110 @@
+"""Secciones transversales de los sólidos 3D por planos horizontales.
+
+Cada plano se da por su altura `z` medida desde la base del sólido (para la
+esfera, desde su punto más bajo). La sección de todos los sólidos es una copia
+escalada de una forma fija (círculo, cuadrado o polígono regular), así que
+muchas alturas se evalúan en una sola operación vectorizada: se calcula la
+medida de la sección (radio o lado) en cada altura y se escala la forma base.
+
+Los contornos son arreglos (K, N, 2) en cm, uno por altura, que pueden pasarse
+directamente a `render_vectorial`. Fuera del sólido la sección es vacía: área
+0 y un contorno reducido a un punto.
+
+Solo se admiten planos horizontales, perpendiculares al eje del sólido. Un
+plano inclinado corta elipses, trapecios o polígonos irregulares que no son
+copias escaladas de la forma base, y no se pueden obtener con este esquema.
+"""
+import math
+
+import numpy as np
+
+import calculos
+import geometria
+
+NODOS_GAUSS = 8
+
+
+class Solido:
+    """Describe cómo cambia la sección horizontal de un sólido con la altura.
+
+    `altura(**p)` es la altura total, `medida(z, **p)` el radio o lado de la
+    sección a la altura `z` y `forma(**p)` devuelve el contorno y el área de la
+    sección con medida 1.
+    """
+
+    def __init__(self, altura, medida, forma):
+        self.altura = altura
+        self.medida = medida
+        self.forma = forma
+
+
+def _circulo(**_):
+    return geometria.contorno_circulo(1.0), math.pi
+
+
+def _cuadrado(**_):
+    return geometria.contorno_cuadrilatero(1.0, 1.0) - 0.5, 1.0
+
+
+def _poligono(n_lados, **_):
+    n_lados = int(n_lados)
+    return geometria.contorno_poligono_regular(n_lados, 1.0), float(calculos.coeficiente_area_poligono(n_lados))
+
+
+SOLIDOS = {
+    "cubo": Solido(lambda lado: lado, lambda z, lado: np.full_like(z, lado), _cuadrado),
+    "esfera": Solido(lambda radio: 2 * radio,
+                     lambda z, radio: np.sqrt(np.clip(z * (2 * radio - z), 0, None)), _circulo),
+    "piramide": Solido(lambda lado_base, altura: altura,
+                       lambda z, lado_base, altura: lado_base * (1 - z / altura), _cuadrado),
+    "prisma": Solido(lambda n_lados, longitud, altura: altura,
+                     lambda z, n_lados, longitud, altura: np.full_like(z, longitud), _poligono),
+    "cono": Solido(lambda radio, altura: altura,
+                   lambda z, radio, altura: radio * (1 - z / altura), _circulo),
+    "cilindro": Solido(lambda radio, altura: altura,
+                       lambda z, radio, altura: np.full_like(z, radio), _circulo),
+}
+
+
+def obtener(clave):
+    if clave not in SOLIDOS:
+        raise ValueError(f"Sólido no válido: {clave}. Los sólidos válidos son {list(SOLIDOS)}.")
+    return SOLIDOS[clave]
+
+
+def medidas(clave, alturas, **parametros):
+    """Radio o lado de la sección en cada altura (0 fuera del sólido)."""
+    solido = obtener(clave)
+    z = np.asarray(alturas, dtype=np.float64)
+    dentro = (z >= 0) & (z <= solido.altura(**parametros))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(dentro, solido.medida(z, **parametros), 0.0)
+
+
+def areas(clave, alturas, **parametros):
+    """Área de la sección en cada altura, en cm²."""
+    _, area_unitaria = obtener(clave).forma(**parametros)
+    return area_unitaria * medidas(clave, alturas, **parametros) ** 2
+
+
+def contornos(clave, alturas, **parametros):
+    """Contornos de las secciones como arreglo (K, N, 2), uno por altura."""
+    unitario, _ = obtener(clave).forma(**parametros)
+    escala = np.atleast_1d(medidas(clave, alturas, **parametros))
+    return escala[:, None, None] * unitario[None, :, :]
+
+
+def volumen_entre(clave, desde, hasta, nodos=NODOS_GAUSS, **parametros):
+    """Volumen entre los planos `desde` y `hasta` integrando el área de la sección.
+
+    Usa cuadratura de Gauss-Legendre, exacta para las secciones de estos
+    sólidos (el área es a lo sumo cuadrática en la altura). `desde` y `hasta`
+    pueden ser arreglos para evaluar muchos llenados parciales a la vez.
+    """
+    altura_total = obtener(clave).altura(**parametros)
+    desde = np.clip(np.asarray(desde, dtype=np.float64), 0, altura_total)
+    hasta = np.clip(np.asarray(hasta, dtype=np.float64), 0, altura_total)
+    x, w = np.polynomial.legendre.leggauss(nodos)
+    centro, mitad = (desde + hasta) / 2, (hasta - desde) / 2
+    z = centro[..., None] + mitad[..., None] * x
+    return mitad * np.sum(w * areas(clave, z, **parametros), axis=-1)
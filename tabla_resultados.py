@@ -0,0 +1,200 @@
+"""Tabla virtualizada para ver resultados por lotes dentro de la aplicación Tk.
+
+El `ttk.Treeview` solo contiene las filas visibles (una cantidad fija de items
+que se reutilizan); al desplazarse únicamente se actualizan sus valores a partir
+de las columnas de NumPy. El ordenamiento y el filtrado se calculan en un hilo
+en segundo plano sobre los arreglos y la interfaz solo recibe la permutación
+resultante, así que la ventana sigue respondiendo con millones de filas.
+"""
+import operator
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+import numpy as np
+
+OPERADORES = {
+    "<=": operator.le, ">=": operator.ge, "==": operator.eq,
+    "!=": operator.ne, "<": operator.lt, ">": operator.gt,
+}
+
+
+def interpretar_filtro(texto, columnas):
+    """Convierte un texto como "volumen > 10" en (columna, operador, valor)."""
+    for simbolo in OPERADORES:
+        if simbolo in texto:
+            nombre, valor = (parte.strip() for parte in texto.split(simbolo, 1))
+            if nombre not in columnas:
+                raise ValueError(f"Columna no válida: {nombre}. Las columnas válidas son {list(columnas)}.")
+            return nombre, OPERADORES[simbolo], float(valor)
+    raise ValueError("El filtro debe tener la forma: columna operador valor (por ejemplo: area > 10).")
+
+
+class TablaVirtual(ttk.Frame):
+    def __init__(self, master, columnas, filas_visibles=25, al_seleccionar=None):
+        super().__init__(master)
+        self.columnas = columnas
+        self.nombres = list(columnas)
+        self.total = len(next(iter(columnas.values()))) if columnas else 0
+        self.filas_visibles = filas_visibles
+        self.al_seleccionar = al_seleccionar
+
+        # Permutación de filas que se muestra (tras ordenar/filtrar) y fila inicial visible
+        self.vista = np.arange(self.total)
+        self.inicio = 0
+        self.orden_actual = None
+        self.resultados = queue.Queue()
+        self.trabajo = 0
+        # Un solo ciclo de sondeo por tabla; se detiene al llegar el resultado del trabajo actual
+        self.sondeo = None
+        self.bind("<Destroy>", self._al_destruir)
+
+        controles = ttk.Frame(self)
+        controles.pack(fill=tk.X, pady=5)
+        ttk.Label(controles, text="Filtro:").pack(side=tk.LEFT, padx=5)
+        self.filtro_entry = ttk.Entry(controles, width=25)
+        self.filtro_entry.pack(side=tk.LEFT)
+        self.filtro_entry.bind("<Return>", lambda e: self.filtrar(self.filtro_entry.get()))
+        ttk.Button(controles, text="Aplicar", command=lambda: self.filtrar(self.filtro_entry.get())).pack(side=tk.LEFT, padx=5)
+        self.estado = ttk.Label(controles)
+        self.estado.pack(side=tk.LEFT, padx=5)
+
+        cuerpo = ttk.Frame(self)
+        cuerpo.pack(fill=tk.BOTH, expand=True)
+        self.tabla = ttk.Treeview(cuerpo, columns=["fila"] + self.nombres, show="headings",
+                                  height=filas_visibles, selectmode="browse")
+        self.tabla.heading("fila", text="#")
+        self.tabla.column("fila", width=70, anchor=tk.E)
+        for nombre in self.nombres:
+            self.tabla.heading(nombre, text=nombre, command=lambda n=nombre: self.ordenar(n))
+            self.tabla.column(nombre, width=90, anchor=tk.E)
+        self.barra = ttk.Scrollbar(cuerpo, orient=tk.VERTICAL, command=self._desplazar)
+        self.tabla.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.barra.pack(side=tk.LEFT, fill=tk.Y)
+
+        # Items fijos que se reutilizan en cada desplazamiento
+        self.items = [self.tabla.insert("", tk.END) for _ in range(filas_visibles)]
+        self.tabla.bind("<MouseWheel>", self._rueda)
+        self.tabla.bind("<Button-4>", lambda e: self._mover(-3))
+        self.tabla.bind("<Button-5>", lambda e: self._mover(3))
+        self.tabla.bind("<Up>", lambda e: self._mover(-1) if self._en_borde(0) else None)
+        self.tabla.bind("<Down>", lambda e: self._mover(1) if self._en_borde(-1) else None)
+        self.tabla.bind("<Prior>", lambda e: self._mover(-filas_visibles))
+        self.tabla.bind("<Next>", lambda e: self._mover(filas_visibles))
+        self.tabla.bind("<<TreeviewSelect>>", self._seleccion)
+        self.refrescar()
+
+    def _en_borde(self, posicion):
+        return self.tabla.focus() == self.items[posicion]
+
+    def _rueda(self, evento):
+        self._mover(-3 if evento.delta > 0 else 3)
+
+    def _mover(self, filas):
+        self.mostrar_desde(self.inicio + filas)
+        return "break"
+
+    def _desplazar(self, accion, cantidad, unidad=None):
+        if accion == "moveto":
+            self.mostrar_desde(int(float(cantidad) * len(self.vista)))
+        elif accion == "scroll":
+            paso = self.filas_visibles if unidad == "pages" else 1
+            self.mostrar_desde(self.inicio + int(cantidad) * paso)
+
+    def mostrar_desde(self, inicio):
+        self.inicio = max(0, min(inicio, len(self.vista) - self.filas_visibles))
+        self.refrescar()
+
+    def refrescar(self):
+        """Materializa solo las filas visibles en los items reutilizados."""
+        indices = self.vista[self.inicio:self.inicio + self.filas_visibles]
+        bloque = [self.columnas[nombre][indices] for nombre in self.nombres]
+        for posicion, item in enumerate(self.items):
+            if posicion < len(indices):
+                valores = [int(indices[posicion])] + [f"{col[posicion]:.4g}" for col in bloque]
+                self.tabla.item(item, values=valores)
+            else:
+                self.tabla.item(item, values=())
+        total = len(self.vista)
+        if total:
+            self.barra.set(self.inicio / total, min(1.0, (self.inicio + self.filas_visibles) / total))
+        else:
+            self.barra.set(0, 1)
+        self.estado.config(text=f"{total:,} de {self.total:,} filas")
+
+    def fila_seleccionada(self):
+        seleccion = self.tabla.selection()
+        if not seleccion:
+            return None
+        valores = self.tabla.item(seleccion[0], "values")
+        return int(valores[0]) if valores else None
+
+    def _seleccion(self, _evento):
+        fila = self.fila_seleccionada()
+        if fila is not None and self.al_seleccionar:
+            self.al_seleccionar(fila)
+
+    # Ordenamiento y filtrado en segundo plano
+    def _en_segundo_plano(self, descripcion, calcular):
+        self.trabajo += 1
+        trabajo = self.trabajo
+        self.estado.config(text=f"{descripcion}...")
+
+        def ejecutar():
+            try:
+                self.resultados.put((trabajo, calcular(), None))
+            except Exception as e:
+                self.resultados.put((trabajo, None, e))
+
+        threading.Thread(target=ejecutar, daemon=True).start()
+        if self.sondeo is None:
+            self.sondeo = self.after(50, self._revisar_resultados)
+
+    def _revisar_resultados(self):
+        self.sondeo = None
+        while True:
+            try:
+                trabajo, vista, error = self.resultados.get_nowait()
+            except queue.Empty:
+                self.sondeo = self.after(50, self._revisar_resultados)
+                return
+            # Solo se aplica el último trabajo pedido; los anteriores se descartan
+            if trabajo == self.trabajo:
+                break
+        if error is not None:
+            self.estado.config(text=f"Error: {error}")
+            return
+        self.vista = vista
+        self.mostrar_desde(0)
+
+    def _al_destruir(self, evento):
+        if evento.widget is self and self.sondeo is not None:
+            self.after_cancel(self.sondeo)
+            self.sondeo = None
+
+    def ordenar(self, nombre):
+        descendente = self.orden_actual == (nombre, False)
+        self.orden_actual = (nombre, descendente)
+        vista, columna = self.vista, self.columnas[nombre]
+
+        def calcular():
+            orden = np.argsort(columna[vista], kind="stable")
+            return vista[orden[::-1]] if descendente else vista[orden]
+
+        self._en_segundo_plano(f"Ordenando por {nombre}", calcular)
+
+    def filtrar(self, texto):
+        texto = texto.strip()
+        if not texto:
+            self.orden_actual = None
+            self._en_segundo_plano("Quitando filtro", lambda: np.arange(self.total))
+            return
+        try:
+            nombre, comparar, valor = interpretar_filtro(texto, self.columnas)
+        except ValueError as e:
+            self.estado.config(text=str(e))
+            return
+        columna = self.columnas[nombre]
+        self.orden_actual = None
+        self._en_segundo_plano("Filtrando", lambda: np.flatnonzero(comparar(columna, valor)))
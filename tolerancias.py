@@ -0,0 +1,148 @@
+"""Propagación de tolerancias de los parámetros a las propiedades de las figuras.
+
+Hay dos modos, ambos vectorizados sobre lotes completos:
+
+- `propagar`: primer orden. Las derivadas parciales de cada propiedad respecto
+  a cada parámetro se calculan con diferencias centrales sobre la fórmula
+  vectorizada del registro, y con ellas se obtienen los límites del peor caso
+  (Σ |∂f/∂x|·t) y la tolerancia estadística (raíz de la suma de cuadrados).
+- `montecarlo`: muestrea los parámetros dentro de sus tolerancias, evalúa la
+  fórmula sobre todas las muestras a la vez y devuelve percentiles.
+
+Las tolerancias se dan como ± en las mismas unidades que cada parámetro; los
+parámetros enteros (número de lados) no tienen tolerancia.
+"""
+import numpy as np
+
+import registro
+
+MUESTRAS = 1_000_000
+PERCENTILES = (0.5, 2.5, 50.0, 97.5, 99.5)
+# Elementos (filas × muestras) evaluados de una vez en el modo Monte Carlo
+TAM_BLOQUE = 1 << 21
+
+
+def parametros_con_tolerancia(clave):
+    return [p.nombre for p in registro.obtener(clave).parametros if p.tipo is float]
+
+
+def _preparar(clave, valores, tolerancias):
+    figura = registro.obtener(clave)
+    valores = {p.nombre: np.asarray(valores[p.nombre], dtype=np.float64) for p in figura.parametros}
+    tolerancias = {nombre: np.abs(np.asarray(tolerancias.get(nombre, 0.0), dtype=np.float64))
+                   for nombre in parametros_con_tolerancia(clave)}
+    return figura, valores, tolerancias
+
+
+def derivadas(clave, valores):
+    """Derivadas parciales {propiedad: {parámetro: ∂propiedad/∂parámetro}} en cada fila."""
+    figura = registro.obtener(clave)
+    resultado = {}
+    for nombre in parametros_con_tolerancia(clave):
+        x = np.asarray(valores[nombre], dtype=np.float64)
+        h = np.cbrt(np.finfo(np.float64).eps) * np.maximum(np.abs(x), 1.0)
+        arriba = figura.calcular({**valores, nombre: x + h})
+        abajo = figura.calcular({**valores, nombre: x - h})
+        for propiedad in arriba:
+            resultado.setdefault(propiedad, {})[nombre] = (arriba[propiedad] - abajo[propiedad]) / (2 * h)
+    return resultado
+
+
+def propagar(clave, valores, tolerancias):
+    """Propagación de primer orden.
+
+    Devuelve {propiedad: {"nominal", "inferior", "superior", "rss"}}: los
+    límites del peor caso lineal y la tolerancia estadística (±rss).
+    """
+    figura, valores, tolerancias = _preparar(clave, valores, tolerancias)
+    nominal = figura.calcular(valores)
+    parciales = derivadas(clave, valores)
+    resultado = {}
+    for propiedad, valor in nominal.items():
+        terminos = [parciales[propiedad][nombre] * tolerancias[nombre] for nombre in tolerancias]
+        peor = np.sum(np.abs(terminos), axis=0)
+        resultado[propiedad] = {
+            "nominal": valor,
+            "inferior": valor - peor,
+            "superior": valor + peor,
+            "rss": np.sqrt(np.sum(np.square(terminos), axis=0)),
+        }
+    return resultado
+
+
+def montecarlo(clave, valores, tolerancias, muestras=MUESTRAS, percentiles=PERCENTILES,
+               distribucion="uniforme", semilla=None):
+    """Propagación por Monte Carlo.
+
+    Con `distribucion="uniforme"` cada parámetro se muestrea en [x - t, x + t];
+    con `"normal"` se usa una normal con σ = t/3. Las muestras que quedan fuera
+    del dominio de la figura se descartan. Devuelve {propiedad: {"media",
+    "desviacion", "percentiles"}} con los percentiles en el último eje, y
+    "validas" con la fracción de muestras usadas por fila.
+    """
+    if distribucion not in ("uniforme", "normal"):
+        raise ValueError(f"Distribución no válida: {distribucion}. Use 'uniforme' o 'normal'.")
+    figura, valores, tolerancias = _preparar(clave, valores, tolerancias)
+    rng = np.random.default_rng(semilla)
+    forma = np.broadcast_shapes(*(np.shape(v) for v in valores.values()),
+                                *(np.shape(t) for t in tolerancias.values()))
+    valores = {n: np.broadcast_to(v, forma).ravel() for n, v in valores.items()}
+    tolerancias = {n: np.broadcast_to(t, forma).ravel() for n, t in tolerancias.items()}
+    filas = int(np.prod(forma))
+
+    estadisticas = {}
+    validas = np.empty(filas)
+    por_bloque = max(1, TAM_BLOQUE // muestras)
+    for inicio in range(0, filas, por_bloque):
+        trozo = slice(inicio, min(filas, inicio + por_bloque))
+        muestra = {n: v[trozo, None] for n, v in valores.items()}
+        for nombre, t in tolerancias.items():
+            base, ancho = valores[nombre][trozo, None], t[trozo, None]
+            if distribucion == "uniforme":
+                ruido = rng.uniform(-1.0, 1.0, (len(base), muestras))
+            else:
+                ruido = rng.standard_normal((len(base), muestras)) / 3
+            muestra[nombre] = base + ancho * ruido
+        muestra = dict(zip(muestra, np.broadcast_arrays(*muestra.values())))
+        mascara = figura.validar(muestra)
+        validas[trozo] = mascara.mean(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            propiedades = figura.calcular(muestra)
+        for propiedad, valor in propiedades.items():
+            valor = np.where(mascara, np.broadcast_to(valor, mascara.shape), np.nan)
+            if mascara.all():
+                cuantiles = np.percentile(valor, percentiles, axis=1).T
+                media, desviacion = valor.mean(axis=1), valor.std(axis=1)
+            else:
+                cuantiles = np.nanpercentile(valor, percentiles, axis=1).T
+                media, desviacion = np.nanmean(valor, axis=1), np.nanstd(valor, axis=1)
+            salida = estadisticas.setdefault(propiedad, {
+                "media": np.empty(filas), "desviacion": np.empty(filas),
+                "percentiles": np.empty((filas, len(percentiles)))})
+            salida["media"][trozo] = media
+            salida["desviacion"][trozo] = desviacion
+            salida["percentiles"][trozo] = cuantiles
+
+    resultado = {propiedad: {"media": s["media"].reshape(forma), "desviacion": s["desviacion"].reshape(forma),
+                             "percentiles": s["percentiles"].reshape(forma + (len(percentiles),))}
+                 for propiedad, s in estadisticas.items()}
+    resultado["validas"] = validas.reshape(forma)
+    return resultado
+
+
+def texto_tolerancias(clave, valores, tolerancias, muestras=None, percentiles=PERCENTILES):
+    """Reporte legible para una sola pieza; con `muestras` agrega los percentiles de Monte Carlo."""
+    figura = registro.obtener(clave)
+    lineal = propagar(clave, valores, tolerancias)
+    aleatorio = montecarlo(clave, valores, tolerancias, muestras, percentiles) if muestras else None
+    lineas = []
+    for propiedad, etiqueta, unidad in figura.propiedades:
+        r = lineal[propiedad]
+        lineas.append(f"{etiqueta}: {float(r['nominal']):.4f} {unidad}")
+        lineas.append(f"  Peor caso: [{float(r['inferior']):.4f}, {float(r['superior']):.4f}] {unidad}")
+        lineas.append(f"  Estadística (RSS): ± {float(r['rss']):.4f} {unidad}")
+        if aleatorio is not None:
+            cuantiles = ", ".join(f"P{p:g} = {float(v):.4f}"
+                                  for p, v in zip(percentiles, aleatorio[propiedad]["percentiles"]))
+            lineas.append(f"  Monte Carlo: {cuantiles}")
+    return "\n".join(lineas)
@@ -0,0 +1,157 @@
+"""Solucionador general de triángulos, vectorizado sobre arreglos.
+
+Notación: los lados `a`, `b`, `c` son opuestos a los ángulos `A`, `B`, `C`
+(en grados). Todos los casos (LLL, LAL, ALA, AAL y LLA) se reducen a los tres
+lados y a partir de ellos se calculan los ángulos, el área, el inradio, el
+circunradio y la clasificación.
+
+El área usa la variante de Herón de Kahan (lados ordenados y paréntesis
+intactos), que es estable incluso para triángulos muy agudos, y los ángulos se
+obtienen con `arctan2` en lugar de `arccos` para no perder precisión cerca de
+0° y 180°.
+"""
+import numpy as np
+
+CASOS = {
+    "LLL": ("a", "b", "c"),
+    "LAL": ("a", "b", "C"),
+    "ALA": ("A", "c", "B"),
+    "AAL": ("A", "B", "a"),
+    "LLA": ("a", "b", "A"),
+}
+TOLERANCIA = 1e-9
+
+
+def _arr(valor):
+    return np.asarray(valor, dtype=np.float64)
+
+
+def area_heron(a, b, c):
+    """Área por la fórmula de Herón en la forma estable de Kahan."""
+    lados = np.sort(np.stack(np.broadcast_arrays(_arr(a), _arr(b), _arr(c))), axis=0)[::-1]
+    a, b, c = lados
+    producto = (a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c))
+    with np.errstate(invalid="ignore"):
+        return 0.25 * np.sqrt(np.where(producto >= 0, producto, np.nan))
+
+
+def es_triangulo(a, b, c):
+    a, b, c = _arr(a), _arr(b), _arr(c)
+    return (a > 0) & (b > 0) & (c > 0) & (a + b > c) & (a + c > b) & (b + c > a)
+
+
+def clasificar(a, b, c, A, B, C, tolerancia=TOLERANCIA):
+    """Devuelve (clasificación por lados, clasificación por ángulos) como arreglos de texto."""
+    escala = np.maximum(np.maximum(a, b), c)
+    iguales = [np.abs(x - y) <= tolerancia * escala for x, y in ((a, b), (b, c), (a, c))]
+    por_lados = np.select(
+        [iguales[0] & iguales[1], iguales[0] | iguales[1] | iguales[2]],
+        ["Equilátero", "Isósceles"], "Escaleno")
+    mayor = np.maximum(np.maximum(A, B), C)
+    por_angulos = np.select(
+        [np.abs(mayor - 90) <= tolerancia * 90, mayor > 90],
+        ["Rectángulo", "Obtusángulo"], "Acutángulo")
+    return por_lados, por_angulos
+
+
+def resolver_lll(a, b, c):
+    """Resuelve el triángulo a partir de sus tres lados.
+
+    Devuelve un dict con lados, ángulos, área, perímetro, inradio, circunradio,
+    clasificación y la máscara `valido` (NaN en las filas que no son triángulo).
+    """
+    a, b, c = np.broadcast_arrays(_arr(a), _arr(b), _arr(c))
+    valido = es_triangulo(a, b, c)
+    area = np.where(valido, area_heron(a, b, c), np.nan)
+    # tan(A) = 4·área / (b² + c² - a²); C también se calcula así y no como 180 - A - B,
+    # que pierde toda la precisión cuando C es muy pequeño
+    A = np.degrees(np.arctan2(4 * area, b ** 2 + c ** 2 - a ** 2))
+    B = np.degrees(np.arctan2(4 * area, a ** 2 + c ** 2 - b ** 2))
+    C = np.degrees(np.arctan2(4 * area, a ** 2 + b ** 2 - c ** 2))
+    perimetro = a + b + c
+    with np.errstate(invalid="ignore", divide="ignore"):
+        inradio = 2 * area / perimetro
+        circunradio = a * b * c / (4 * area)
+    por_lados, por_angulos = clasificar(a, b, c, A, B, C)
+    resultado = {
+        "a": a, "b": b, "c": c, "A": A, "B": B, "C": C,
+        "area": area, "perimetro": perimetro, "inradio": inradio, "circunradio": circunradio,
+    }
+    resultado = {k: np.where(valido, v, np.nan) for k, v in resultado.items()}
+    resultado["por_lados"] = np.where(valido, por_lados, "")
+    resultado["por_angulos"] = np.where(valido, por_angulos, "")
+    resultado["valido"] = valido
+    return resultado
+
+
+def resolver_lal(a, b, C):
+    """Dos lados y el ángulo comprendido entre ellos."""
+    a, b, C = _arr(a), _arr(b), _arr(C)
+    # c² = (a - b)² + 4ab·sen²(C/2): evita la cancelación de la ley de cosenos con C pequeño
+    c = np.sqrt((a - b) ** 2 + 4 * a * b * np.sin(np.radians(C) / 2) ** 2)
+    resultado = resolver_lll(a, b, c)
+    return _invalidar(resultado, (C > 0) & (C < 180))
+
+
+def resolver_ala(A, c, B):
+    """Dos ángulos y el lado comprendido entre ellos."""
+    A, c, B = _arr(A), _arr(c), _arr(B)
+    C = 180.0 - A - B
+    with np.errstate(invalid="ignore", divide="ignore"):
+        razon = c / np.sin(np.radians(C))
+    resultado = resolver_lll(razon * np.sin(np.radians(A)), razon * np.sin(np.radians(B)), c)
+    return _invalidar(resultado, (A > 0) & (B > 0) & (C > 0))
+
+
+def resolver_aal(A, B, a):
+    """Dos ángulos y el lado opuesto al primero."""
+    A, B, a = _arr(A), _arr(B), _arr(a)
+    C = 180.0 - A - B
+    with np.errstate(invalid="ignore", divide="ignore"):
+        razon = a / np.sin(np.radians(A))
+    resultado = resolver_lll(a, razon * np.sin(np.radians(B)), razon * np.sin(np.radians(C)))
+    return _invalidar(resultado, (A > 0) & (B > 0) & (C > 0))
+
+
+def resolver_lla(a, b, A):
+    """Dos lados y el ángulo opuesto al primero (caso ambiguo).
+
+    Devuelve (primera, segunda): `segunda` solo es válida donde hay dos
+    triángulos posibles (A agudo y b·sen(A) < a < b).
+    """
+    a, b, A = np.broadcast_arrays(_arr(a), _arr(b), _arr(A))
+    seno_b = b * np.sin(np.radians(A)) / a
+    existe = (A > 0) & (A < 180) & (seno_b <= 1 + TOLERANCIA) & ((A < 90) | (a > b))
+    B1 = np.degrees(np.arcsin(np.clip(seno_b, -1, 1)))
+    ambiguo = existe & (A < 90) & (a < b) & (seno_b < 1 - TOLERANCIA)
+
+    primera = _invalidar(resolver_aal(A, B1, a), existe)
+    segunda = _invalidar(resolver_aal(A, 180.0 - B1, a), ambiguo)
+    return primera, segunda
+
+
+def resolver(caso, **datos):
+    """Resuelve según el caso ("LLL", "LAL", "ALA", "AAL" o "LLA").
+
+    Devuelve (primera, segunda); `segunda` es None salvo en el caso LLA.
+    """
+    if caso not in CASOS:
+        raise ValueError(f"Caso no válido: {caso}. Los casos válidos son {list(CASOS)}.")
+    argumentos = [datos[nombre] for nombre in CASOS[caso]]
+    if caso == "LLA":
+        return resolver_lla(*argumentos)
+    funcion = {"LLL": resolver_lll, "LAL": resolver_lal, "ALA": resolver_ala, "AAL": resolver_aal}[caso]
+    return funcion(*argumentos), None
+
+
+def _invalidar(resultado, mascara):
+    valido = resultado["valido"] & mascara
+    salida = {}
+    for clave, valores in resultado.items():
+        if clave == "valido":
+            salida[clave] = valido
+        elif valores.dtype.kind in "US":
+            salida[clave] = np.where(valido, valores, "")
+        else:
+            salida[clave] = np.where(valido, valores, np.nan)
+    return salida